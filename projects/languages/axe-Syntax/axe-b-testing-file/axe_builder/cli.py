@@ -3,13 +3,28 @@
 import sys
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
-from axe_builder.exporter.exporter import export_cli_template
+from axe_builder.exporter.build import (
+    DEFAULT_BACKEND,
+    DEFAULT_INPUT_SUFFIX,
+    DEFAULT_OUTPUT_PATTERN,
+    WRITTEN,
+    BuildManifest,
+    build_all,
+    build_key,
+    build_output,
+    collect_targets,
+    output_directory,
+)
 from axe_builder.logger.logger import logger
-from axe_builder.parser.parser import AxeSyntaxParser
+from axe_builder.logger.trace import PRODUCTION_ENV, production_mode
+from axe_builder.parser.disk_cache import CACHE_DIR_ENV, DiskParseCache
+from axe_builder.parser.fast_parser import FastAxeSyntaxParser
+from axe_builder.parser.parser import AxeSyntaxParser, get_parser
 from axe_builder.tui.tui import launch_tui
+from axe_builder.utils.utils import check_syntax_or_fail
 from typer import Context
 
 app = typer.Typer(help="axe:Builder - A CLI Menu Builder using axe:Syntax")
@@ -21,6 +36,33 @@ class OperationMode(str, Enum):
     tui = "tui"
 
 
+class ExportBackend(str, Enum):
+    jinja = "jinja"
+    ast = "ast"
+
+
+def _command_parser(ctx: Context, fast: bool = False) -> AxeSyntaxParser:
+    """
+    Returns the parser a command should use.
+
+    Without --cache-dir this is the shared parser. With it, a parser of its own
+    is built around the requested cache, so the shared parsers are left as they
+    are.
+
+    Args:
+        ctx (Context): The command's context, as set up by main().
+        fast (bool): Whether to use the fast-path parser.
+
+    Returns:
+        AxeSyntaxParser: The parser to use.
+    """
+    disk_cache = (ctx.obj or {}).get("disk_cache")
+    if disk_cache is None:
+        return get_parser(fast=fast)
+    parser_class = FastAxeSyntaxParser if fast else AxeSyntaxParser
+    return parser_class(disk_cache=disk_cache)
+
+
 @app.callback()
 def main(
     ctx: Context,
@@ -31,6 +73,20 @@ def main(
         help="Enable verbose logging",
         show_default=False,
     ),
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--cache-dir",
+        envvar=CACHE_DIR_ENV,
+        help="Directory for the persistent parse cache shared across runs.",
+        show_default=False,
+    ),
+    production: bool = typer.Option(
+        False,
+        "--production",
+        envvar=PRODUCTION_ENV,
+        help="Drop per-token parser tracing from the logs.",
+        show_default=False,
+    ),
 ):
     """
     axe:Builder - A CLI Menu Builder using axe:Syntax
@@ -43,7 +99,19 @@ def main(
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
         )
         logger.debug("Verbose mode enabled")
-    ctx.obj = {"verbose": verbose}
+    if production:
+        # Restored when the command finishes
+        ctx.with_resource(production_mode())
+    disk_cache = None
+    if cache_dir:
+        disk_cache = DiskParseCache(cache_dir)
+        logger.debug(f"Using parse cache at {cache_dir}")
+    ctx.obj = {
+        "verbose": verbose,
+        "cache_dir": cache_dir,
+        "disk_cache": disk_cache,
+        "production": production,
+    }
 
 
 @app.command(
@@ -51,6 +119,7 @@ def main(
     help="Parse an axe:Syntax string and display the structured commands.",
 )
 def parse_command(
+    ctx: Context,
     syntax: Optional[str] = typer.Argument(
         None, help="The axe:Syntax string to parse."
     ),
@@ -62,6 +131,17 @@ def parse_command(
         exists=True,
         readable=True,
     ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        "-s",
+        help="Parse --file incrementally, one command line per line.",
+    ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Use the hand-written fast-path parser; Lark handles what it rejects.",
+    ),
 ):
     """
     Parse an axe:Syntax string and display the structured commands.
@@ -71,14 +151,24 @@ def parse_command(
             raise typer.BadParameter(
                 "Either provide a syntax string or a file containing the syntax."
             )
+        if stream and not file:
+            raise typer.BadParameter("--stream requires --file.")
+        parser = _command_parser(ctx, fast=fast)
+        if stream:
+            logger.info(f"Streaming axe:Syntax input from {file}")
+            for parsed_commands in parser.iter_parse_file(file):
+                for cmd in parsed_commands:
+                    typer.echo(cmd.model_dump_json(indent=4))
+            logger.success("Parsing completed successfully.")
+            return
         if file:
             syntax = file.read_text(encoding="utf-8").strip()
             logger.debug(f"Read syntax from file: {file}")
+        check_syntax_or_fail(syntax)
         logger.info("Parsing axe:Syntax input")
-        parser = AxeSyntaxParser()
         parsed_commands = parser.parse(syntax)
         for cmd in parsed_commands:
-            typer.echo(cmd.json(indent=4))
+            typer.echo(cmd.model_dump_json(indent=4))
         logger.success("Parsing completed successfully.")
     except typer.BadParameter as e:
         logger.error(f"Bad parameter: {e}")
@@ -99,6 +189,7 @@ def parse_command(
     help="Build CLI menus from axe:Syntax and export to a Python CLI template.",
 )
 def build_command(
+    ctx: Context,
     syntax: Optional[str] = typer.Argument(
         None, help="The axe:Syntax string to parse and build."
     ),
@@ -122,9 +213,24 @@ def build_command(
         "-w",
         help="Overwrite the output file if it already exists.",
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rebuild even if the output is up to date.",
+    ),
+    backend: ExportBackend = typer.Option(
+        DEFAULT_BACKEND,
+        "--backend",
+        "-b",
+        help="Exporter backend: Jinja templates, or generated Python AST.",
+    ),
 ):
     """
     Build CLI menus from axe:Syntax and export to a Python CLI template.
+
+    Outputs are recorded in a build manifest next to them; an output whose
+    inputs (syntax, grammar, templates, exporter version) did not change since
+    it was built is skipped.
     """
     try:
         if not syntax and not file:
@@ -134,6 +240,12 @@ def build_command(
         if file:
             syntax = file.read_text(encoding="utf-8").strip()
             logger.debug(f"Read syntax from file: {file}")
+        manifest = BuildManifest.load(output_directory(output))
+        key = build_key(syntax, backend=backend.value)
+        if not force and manifest.is_current(output, key):
+            logger.info(f"{output} is up to date; skipping build.")
+            typer.echo(f"{output} is up to date.")
+            return
         if output.exists() and not overwrite:
             logger.error(
                 f"Output file {output} already exists. Use --overwrite to overwrite."
@@ -143,12 +255,23 @@ def build_command(
                 err=True,
             )
             raise typer.Exit(code=1)
+        check_syntax_or_fail(syntax)
         logger.info("Building CLI template from syntax")
-        parser = AxeSyntaxParser()
-        parsed_commands = parser.parse(syntax)
-        export_cli_template(parsed_commands, str(output))
-        logger.success(f"CLI template exported to {output}")
-        typer.echo(f"CLI template exported to {output}")
+        # The exporter works on nodes; no pydantic models needed here
+        result = build_output(
+            syntax,
+            output,
+            manifest,
+            key=key,
+            parser=_command_parser(ctx),
+            backend=backend.value,
+        )
+        manifest.save()
+        if result.status == WRITTEN:
+            logger.success(f"CLI template exported to {output}")
+            typer.echo(f"CLI template exported to {output}")
+        else:
+            typer.echo(f"CLI template at {output} is unchanged.")
     except typer.BadParameter as e:
         logger.error(f"Bad parameter: {e}")
         typer.echo(f"Error: {e}", err=True)
@@ -163,6 +286,74 @@ def build_command(
         raise typer.Exit(code=1) from e
 
 
+@app.command(
+    name="build-all",
+    help="Build many axe:Syntax files in parallel, skipping up-to-date outputs.",
+)
+def build_all_command(
+    inputs: List[str] = typer.Argument(
+        ..., help="Input files, directories or glob patterns (e.g. 'menus/**/*.axe')."
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        "--output-dir",
+        "-o",
+        help="Root directory of the outputs. Defaults to next to each input.",
+    ),
+    pattern: str = typer.Option(
+        DEFAULT_OUTPUT_PATTERN,
+        "--pattern",
+        "-p",
+        help="Output file name pattern; {stem} and {name} refer to the input.",
+    ),
+    suffix: str = typer.Option(
+        DEFAULT_INPUT_SUFFIX,
+        "--suffix",
+        help="Suffix of the input files searched for in directories.",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of worker processes. Defaults to the CPU count.",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rebuild even the outputs that are up to date.",
+    ),
+    backend: ExportBackend = typer.Option(
+        DEFAULT_BACKEND,
+        "--backend",
+        "-b",
+        help="Exporter backend: Jinja templates, or generated Python AST.",
+    ),
+):
+    """
+    Build many axe:Syntax files in parallel, then print a summary.
+
+    Workers keep their parser and template loaded across files. Outputs whose
+    inputs did not change since they were built are skipped.
+    """
+    try:
+        targets = collect_targets(inputs, output_dir, pattern, suffix)
+        summary = build_all(
+            targets, workers=jobs, force=force, backend=backend.value
+        )
+    except ValueError as e:
+        logger.error(f"Build failed: {e}")
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    except Exception as e:
+        logger.exception("An unexpected error occurred during build.")
+        typer.echo(f"Unexpected Error: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    typer.echo(summary.format())
+    if summary.failures:
+        raise typer.Exit(code=1)
+
+
 @app.command(
     name="tui",
     help="Launch the Textual UI to interact with the defined CLI menus.",
@@ -0,0 +1,450 @@
+# axe_builder/exporter/ast_exporter.py
+"""
+Exporter backend that builds the generated CLI as a Python AST.
+
+Values are emitted as constants and names as generated identifiers, so the
+module is valid Python by construction. It can be compiled straight to a code
+object, or unparsed into source one top-level statement at a time.
+"""
+
+import ast
+import keyword
+import sys
+from collections import OrderedDict
+from types import CodeType
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from axe_builder.exporter.exporter import WriteResult, write_atomic
+from axe_builder.models.models import MenuCommand
+from axe_builder.models.nodes import MenuNode, SubNode, from_model
+from loguru import logger
+
+CLI_FILENAME = "<axe-cli>"
+
+_PRELUDE = '''
+import typer
+from loguru import logger
+
+app = typer.Typer()
+
+
+def opt_completer(ctx: typer.Context, incomplete: str):
+    options = ["option1", "option2", "option3"]
+    return [opt for opt in options if opt.startswith(incomplete)]
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose mode"),
+):
+    """
+    axe:Builder CLI Application
+    """
+    if verbose:
+        logger.add("cli_verbose.log", level="DEBUG")
+        logger.debug("Verbose mode enabled")
+'''
+
+_EPILOGUE = '''
+if __name__ == "__main__":
+    app()
+'''
+
+# FunctionDef grew a required type_params field in Python 3.12
+_FUNCTION_EXTRA = (
+    {"type_params": []} if "type_params" in ast.FunctionDef._fields else {}
+)
+
+
+def _name(identifier: str) -> ast.Name:
+    return ast.Name(id=identifier, ctx=ast.Load())
+
+
+def _attr(value: str, attr: str) -> ast.Attribute:
+    return ast.Attribute(value=_name(value), attr=attr, ctx=ast.Load())
+
+
+def _call(func: ast.expr, *args: ast.expr, **keywords: ast.expr) -> ast.Call:
+    return ast.Call(
+        func=func,
+        args=list(args),
+        keywords=[ast.keyword(arg=key, value=val) for key, val in keywords.items()],
+    )
+
+
+def _const(value) -> ast.Constant:
+    return ast.Constant(value=value)
+
+
+def _error_fstring(prefix: str) -> ast.JoinedStr:
+    # f"{prefix}{e}"
+    return ast.JoinedStr(
+        values=[_const(prefix), ast.FormattedValue(value=_name("e"), conversion=-1)]
+    )
+
+
+def _expr(call: ast.Call) -> ast.Expr:
+    return ast.Expr(value=call)
+
+
+def _handler_body(
+    label: str, kind: str, log_message: str, echo: str
+) -> List[ast.stmt]:
+    """
+    Builds the body shared by every generated command: a docstring, then the
+    command's output wrapped in the same error handling as the Jinja template.
+    """
+    guarded = ast.Try(
+        body=[
+            _expr(_call(_attr("logger", "info"), _const(log_message))),
+            _expr(_call(_attr("typer", "echo"), _const(echo))),
+        ],
+        handlers=[
+            ast.ExceptHandler(
+                type=_name("Exception"),
+                name="e",
+                body=[
+                    _expr(
+                        _call(
+                            _attr("logger", "error"),
+                            _error_fstring(f"Error in {label} {kind}: "),
+                        )
+                    ),
+                    _expr(
+                        _call(
+                            _attr("typer", "echo"),
+                            _error_fstring("An error occurred: "),
+                            err=_const(True),
+                        )
+                    ),
+                ],
+            )
+        ],
+        orelse=[],
+        finalbody=[],
+    )
+    return [_expr(_const(f"{label} {kind} Handler")), guarded]
+
+
+def _option_argument(
+    name: str, help_text: str, completer: Optional[str] = None
+) -> ast.arguments:
+    # (name: str = typer.Option(..., help=..., autocompletion=...))
+    keywords = {"help": _const(help_text)}
+    if completer is not None:
+        keywords["autocompletion"] = _name(completer)
+    return ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=name, annotation=_name("str"))],
+        vararg=None,
+        kwonlyargs=[],
+        kw_defaults=[],
+        kwarg=None,
+        defaults=[_call(_attr("typer", "Option"), _const(Ellipsis), **keywords)],
+    )
+
+
+def _command_argument(node_type: str, kind: str) -> ast.arguments:
+    # Menus take an autocompleted option, subcommands an input
+    if kind == "Menu":
+        help_text = f"Option for {node_type} Menu"
+        return _option_argument("option", help_text, "opt_completer")
+    return _option_argument("input", f"Input for {node_type} SubCommand")
+
+
+def _command_decorator(command: str, help_text: str) -> ast.Call:
+    # @app.command(name=..., help=...)
+    return _call(_attr("app", "command"), name=_const(command), help=_const(help_text))
+
+
+def _command(
+    function: str,
+    command: str,
+    help_text: str,
+    args: ast.arguments,
+    body: List[ast.stmt],
+) -> ast.FunctionDef:
+    return ast.FunctionDef(
+        name=function,
+        args=args,
+        body=body,
+        decorator_list=[_command_decorator(command, help_text)],
+        returns=None,
+        # ast.unparse reads a definition's line number; the rest are filled in
+        # by ast.fix_missing_locations when the module is compiled
+        lineno=1,
+        **_FUNCTION_EXTRA,
+    )
+
+
+def _label(node: Union[MenuNode, SubNode]) -> str:
+    # "M2", "T", "custom6": the node's type and count, usable in an identifier
+    kind = "custom" if node.type == "." else node.type
+    count = node.count if isinstance(node.count, int) and node.count > 0 else ""
+    label = f"{kind}{count}"
+    if not label.isidentifier() or keyword.iskeyword(label.lower()):
+        raise ValueError(f"Cannot name a command after type {node.type!r}")
+    return label
+
+
+class _Command(NamedTuple):
+    function: str
+    name: str
+    node_type: str
+    kind: str  # "Menu" or "SubCommand"
+    log_message: str
+    echo: str
+
+
+class CliModuleBuilder:
+    """
+    Builds the AST of a generated Typer CLI from parsed menus.
+
+    Menus become commands named after their type and count (e.g. "M2"), and
+    their subcommands commands named after the menu, the subcommand and its
+    position (e.g. "M2_T_1"). A top-level subcommand belongs to the preceding
+    menu. Repeated names get a numeric suffix, so every command and function
+    name in a module is unique.
+
+    Handler bodies are cached by their type, kind and messages, and the same
+    subtree is reused wherever it occurs; the cache keeps the most recently used
+    bodies, so memory stays bounded on large inputs. Callers must treat the
+    produced nodes as read-only.
+    """
+
+    def __init__(self, max_cached_bodies: int = 1024):
+        self._names: Set[str] = set()
+        self._suffixes: Dict[str, int] = {}
+        self._max_bodies = max_cached_bodies
+        self._bodies: "OrderedDict[Tuple[str, ...], List[ast.stmt]]" = OrderedDict()
+        self._arguments: Dict[Tuple[str, str], ast.arguments] = {}
+        self.reused_bodies = 0
+
+    def _unique(self, name: str) -> str:
+        # Resumes from the last suffix given out for this name
+        suffix = self._suffixes.get(name, 0)
+        candidate = name if suffix == 0 else f"{name}_{suffix}"
+        while candidate in self._names:
+            suffix = max(suffix, 1) + 1
+            candidate = f"{name}_{suffix}"
+        self._suffixes[name] = suffix
+        self._names.add(candidate)
+        return candidate
+
+    def _menu(self, node: MenuNode) -> _Command:
+        label = _label(node)
+        name = self._unique(label)
+        count = f" {node.count}" if node.count else ""
+        return _Command(
+            name.lower(),
+            name,
+            node.type,
+            "Menu",
+            f"Executing {label} Menu",
+            f"This is {node.type}{count} Menu",
+        )
+
+    def _subcommand(self, node: SubNode, menu: str, position: int) -> _Command:
+        stem = f"{_label(node)}_{position}"
+        name = self._unique(f"{menu}_{stem}" if menu else stem)
+        return _Command(
+            name.lower(),
+            name,
+            node.type,
+            "SubCommand",
+            f"Executing {node.type} SubCommand",
+            node.value if node.value else "This is a custom subcommand.",
+        )
+
+    def _commands(
+        self, menus: Iterable[Union[MenuNode, SubNode, MenuCommand]]
+    ) -> Iterator[_Command]:
+        menu_name, position = "", 0
+        for item in menus:
+            node = from_model(item)
+            if isinstance(node, MenuNode):
+                command = self._menu(node)
+                menu_name = command.name
+                yield command
+                for position, sub in enumerate(node.subcommands, start=1):
+                    yield self._subcommand(sub, menu_name, position)
+            else:
+                # Chained after a menu, e.g. [M={1}]:(T="Title")
+                position += 1
+                yield self._subcommand(node, menu_name, position)
+
+    def _argument(self, node_type: str, kind: str) -> ast.arguments:
+        args = self._arguments.get((node_type, kind))
+        if args is None:
+            args = _command_argument(node_type, kind)
+            self._arguments[(node_type, kind)] = args
+        return args
+
+    def _body(self, command: _Command) -> List[ast.stmt]:
+        key = command[2:]  # (node_type, kind, log_message, echo)
+        body = self._bodies.get(key)
+        if body is not None:
+            self._bodies.move_to_end(key)
+            self.reused_bodies += 1
+            return body
+        body = self._bodies[key] = _handler_body(*key)
+        if len(self._bodies) > self._max_bodies:
+            self._bodies.popitem(last=False)
+        return body
+
+    def _function(self, command: _Command) -> ast.FunctionDef:
+        return _command(
+            command.function,
+            command.name,
+            f"Generated {command.node_type} {command.kind}",
+            self._argument(command.node_type, command.kind),
+            self._body(command),
+        )
+
+    def statements(
+        self, menus: Iterable[Union[MenuNode, SubNode, MenuCommand]]
+    ) -> Iterator[ast.stmt]:
+        """
+        Yields the module's top-level statements, one command at a time.
+
+        Args:
+            menus (Iterable[Union[MenuNode, SubNode, MenuCommand]]): The parsed menus.
+
+        Returns:
+            Iterator[ast.stmt]: The statements, in module order.
+
+        Raises:
+            ValueError: If a node's type cannot be part of a Python identifier.
+        """
+        yield from ast.parse(_PRELUDE).body
+        for command in self._commands(menus):
+            yield self._function(command)
+        yield from ast.parse(_EPILOGUE).body
+
+    def source_chunks(
+        self, menus: Iterable[Union[MenuNode, SubNode, MenuCommand]]
+    ) -> Iterator[str]:
+        """
+        Yields the module's source, one statement at a time.
+
+        Each statement built by statements() is unparsed as it is produced, so
+        only one command is held in memory.
+
+        Args:
+            menus (Iterable[Union[MenuNode, SubNode, MenuCommand]]): The parsed menus.
+
+        Returns:
+            Iterator[str]: Chunks of the module's source.
+
+        Raises:
+            ValueError: If a node's type cannot be part of a Python identifier.
+        """
+        previous = None
+        for statement in self.statements(menus):
+            if previous is not None:
+                # Two blank lines around definitions, as in hand-written modules
+                separated = isinstance(statement, ast.FunctionDef) or isinstance(
+                    previous, ast.FunctionDef
+                )
+                yield "\n\n\n" if separated else "\n"
+            yield ast.unparse(statement)
+            previous = statement
+        yield "\n"
+
+
+def build_cli_module(
+    menus: Iterable[Union[MenuNode, SubNode, MenuCommand]]
+) -> ast.Module:
+    """
+    Builds the whole generated CLI as an AST module.
+
+    Args:
+        menus (Iterable[Union[MenuNode, SubNode, MenuCommand]]): The parsed menus, as
+            nodes or MenuCommand objects.
+
+    Returns:
+        ast.Module: The module, with source locations filled in.
+    """
+    statements = list(CliModuleBuilder().statements(menus))
+    module = ast.Module(body=statements, type_ignores=[])
+    return ast.fix_missing_locations(module)
+
+
+def compile_cli_module(
+    menus: Iterable[Union[MenuNode, SubNode, MenuCommand]],
+    filename: str = CLI_FILENAME,
+) -> CodeType:
+    """
+    Compiles the generated CLI straight to a code object, without source text.
+
+    Args:
+        menus (Iterable[Union[MenuNode, SubNode, MenuCommand]]): The parsed menus.
+        filename (str): The file name reported in tracebacks.
+
+    Returns:
+        CodeType: Code that defines ``app``; exec it in a fresh namespace.
+    """
+    return compile(build_cli_module(menus), filename, "exec")
+
+
+def export_cli_ast(
+    menus: Iterable[Union[MenuNode, SubNode, MenuCommand]],
+    output_path: str,
+    skip_unchanged: bool = False,
+) -> WriteResult:
+    """
+    Exports the parsed axe:Syntax menus to a Python CLI module, through an AST.
+
+    Statements are built and unparsed one command at a time and streamed to
+    disk, so memory use does not grow with the number of menus. The output file
+    is replaced atomically. ast.unparse makes this backend several times slower
+    than the Jinja template on large inputs.
+
+    Args:
+        menus (Iterable[Union[MenuNode, SubNode, MenuCommand]]): The parsed menus, as
+            nodes or MenuCommand objects.
+        output_path (str): The file path to export the generated CLI module.
+        skip_unchanged (bool): If True, an existing output with identical bytes is
+            not rewritten, so its mtime stays stable.
+
+    Returns:
+        WriteResult: Characters written, digest of the output and whether it changed.
+
+    Raises:
+        RuntimeError: On Python versions without ast.unparse (before 3.9).
+    """
+    if not hasattr(ast, "unparse"):
+        raise RuntimeError(
+            "The AST exporter needs Python 3.9 or later; "
+            f"running {sys.version_info.major}.{sys.version_info.minor}."
+        )
+    try:
+        logger.info(f"Exporting CLI module to {output_path} (AST backend)")
+        result = write_atomic(
+            output_path,
+            CliModuleBuilder().source_chunks(menus),
+            skip_unchanged=skip_unchanged,
+        )
+        if result.changed:
+            logger.success(
+                f"CLI module successfully exported to {output_path} "
+                f"({result.characters} characters)"
+            )
+        else:
+            logger.info(f"CLI module at {output_path} is unchanged; not rewritten.")
+        return result
+
+    except Exception as e:
+        logger.exception(f"Failed to export CLI module: {e}")
+        raise
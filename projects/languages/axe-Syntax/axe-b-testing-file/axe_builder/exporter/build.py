@@ -0,0 +1,552 @@
+# axe_builder/exporter/build.py
+# Incremental builds: a manifest next to the outputs records, for each output,
+# a key made of the hashes of everything that determines its bytes (syntax
+# input, grammar, template set, exporter version), plus the output's digest,
+# size and mtime. An output whose key and stat match is up to date and is
+# skipped without parsing, rendering or reading it.
+
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from axe_builder.exporter.ast_exporter import export_cli_ast
+from axe_builder.exporter.environment import get_environment, template_set_hash
+from axe_builder.exporter.exporter import (
+    CLI_TEMPLATE,
+    EXPORTER_VERSION,
+    WriteResult,
+    export_cli_template,
+    write_atomic,
+)
+from axe_builder.parser.cache import content_hash
+from axe_builder.parser.parser import AxeSyntaxParser, get_parser, grammar_version
+from axe_builder.utils.utils import check_syntax_or_fail
+from loguru import logger
+
+MANIFEST_NAME = ".axe_build_manifest.json"
+_MANIFEST_FORMAT = 1
+
+# Build statuses
+SKIPPED = "skipped"  # up to date; nothing was parsed or rendered
+UNCHANGED = "unchanged"  # rebuilt, but the output already had the same bytes
+WRITTEN = "written"  # the output was created or replaced
+FAILED = "failed"  # the input could not be read, parsed or exported
+
+DEFAULT_INPUT_SUFFIX = ".axe"
+DEFAULT_BACKEND = "jinja"
+
+# Exporter backends, by name: each writes menus to an output path
+EXPORTERS: Dict[str, Callable[..., WriteResult]] = {
+    "jinja": export_cli_template,
+    "ast": export_cli_ast,
+}
+DEFAULT_OUTPUT_PATTERN = "{stem}.py"
+
+
+def _exporter(backend: str) -> Callable[..., WriteResult]:
+    exporter = EXPORTERS.get(backend)
+    if exporter is None:
+        raise ValueError(
+            f"Unknown exporter backend '{backend}'; choose from {sorted(EXPORTERS)}"
+        )
+    return exporter
+
+
+def toolchain_hash(backend: str = DEFAULT_BACKEND) -> str:
+    """
+    Returns a hash of the grammar, the exporter backend and its version.
+
+    Args:
+        backend (str): The exporter backend; the template set is part of the
+            hash for the 'jinja' backend.
+
+    Returns:
+        str: SHA-256 hex digest; changes whenever a build's output could change
+            for the same input.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    _exporter(backend)
+    templates = template_set_hash() if backend == "jinja" else ""
+    parts = (grammar_version(), backend, templates, EXPORTER_VERSION)
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def build_key(
+    syntax: str, toolchain: Optional[str] = None, backend: str = DEFAULT_BACKEND
+) -> str:
+    """
+    Returns the key of a build: a hash of every input that determines its output.
+
+    Args:
+        syntax (str): The axe:Syntax input.
+        toolchain (Optional[str]): The toolchain_hash(), when building many inputs
+            with the same toolchain. Computed for ``backend`` if omitted.
+        backend (str): The exporter backend.
+
+    Returns:
+        str: SHA-256 hex digest of the input and toolchain hashes.
+    """
+    parts = (content_hash(syntax), toolchain or toolchain_hash(backend))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class BuildResult(NamedTuple):
+    """
+    The outcome of building one output.
+    """
+
+    output: Path
+    status: str  # SKIPPED, UNCHANGED or WRITTEN
+    entry: Optional[Dict[str, Any]]  # the output's manifest entry
+
+
+class BuildManifest:
+    """
+    The build records of the outputs in one directory.
+
+    Entries are keyed by output file name. The manifest is read once and
+    written back with save(), atomically.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Initializes an empty BuildManifest.
+
+        Args:
+            directory (Union[str, Path]): The directory of the outputs and the manifest.
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / MANIFEST_NAME
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, directory: Union[str, Path]) -> "BuildManifest":
+        """
+        Reads the manifest of a directory. A missing or unreadable manifest is empty.
+
+        Args:
+            directory (Union[str, Path]): The directory of the outputs.
+
+        Returns:
+            BuildManifest: The manifest.
+        """
+        manifest = cls(directory)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable build manifest {manifest.path}: {e}")
+            return manifest
+        if isinstance(data, dict) and data.get("format") == _MANIFEST_FORMAT:
+            manifest.entries = data.get("outputs", {})
+        return manifest
+
+    def is_current(self, output: Union[str, Path], key: str) -> bool:
+        """
+        Checks whether an output was built from the inputs behind a key.
+
+        Only the output's stat is read, never its contents. An output edited or
+        replaced since it was built is not current.
+
+        Args:
+            output (Union[str, Path]): The output file.
+            key (str): The build key, from build_key.
+
+        Returns:
+            bool: True if the output is up to date.
+        """
+        output = Path(output)
+        entry = self.entries.get(output.name)
+        if entry is None or entry.get("key") != key:
+            return False
+        try:
+            stat = output.stat()
+        except OSError:
+            return False
+        return entry.get("size") == stat.st_size and entry.get(
+            "mtime_ns") == stat.st_mtime_ns
+
+    def record(self, output: Union[str, Path], key: str, digest: str) -> Dict[str, Any]:
+        """
+        Records a freshly built output.
+
+        Args:
+            output (Union[str, Path]): The output file, as it is now on disk.
+            key (str): The build key it was built from.
+            digest (str): SHA-256 hex digest of its bytes.
+
+        Returns:
+            Dict[str, Any]: The new entry.
+        """
+        output = Path(output)
+        stat = output.stat()
+        entry = {
+            "key": key,
+            "digest": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        self.entries[output.name] = entry
+        return entry
+
+    def save(self) -> None:
+        """
+        Writes the manifest back to its directory, atomically.
+        """
+        data = {"format": _MANIFEST_FORMAT, "outputs": self.entries}
+        write_atomic(
+            self.path, [json.dumps(data, indent=2, sort_keys=True)], skip_unchanged=True
+        )
+
+
+def build_output(
+    syntax: str,
+    output: Union[str, Path],
+    manifest: BuildManifest,
+    key: Optional[str] = None,
+    parser: Optional[AxeSyntaxParser] = None,
+    backend: str = DEFAULT_BACKEND,
+) -> BuildResult:
+    """
+    Parses syntax and exports it to an output, recording the build in a manifest.
+
+    The output is only rewritten if its bytes differ, so an unchanged output
+    keeps its mtime. The manifest is updated in memory; call save() to persist it.
+
+    Args:
+        syntax (str): The axe:Syntax input.
+        output (Union[str, Path]): The output file.
+        manifest (BuildManifest): The manifest of the output's directory.
+        key (Optional[str]): The build key, if already computed.
+        parser (Optional[AxeSyntaxParser]): The parser to use. Defaults to the
+            shared parser.
+        backend (str): The exporter backend, 'jinja' or 'ast'.
+
+    Returns:
+        BuildResult: WRITTEN or UNCHANGED, with the output's new entry.
+
+    Raises:
+        ValueError: If the syntax is invalid, or the backend is unknown.
+    """
+    output = Path(output)
+    exporter = _exporter(backend)
+    key = key or build_key(syntax, backend=backend)
+    nodes = (parser or get_parser()).parse_nodes(syntax)
+    result = exporter(nodes, str(output), skip_unchanged=True)
+    entry = manifest.record(output, key, result.digest)
+    return BuildResult(output, WRITTEN if result.changed else UNCHANGED, entry)
+
+
+def output_directory(output: Union[str, Path]) -> Path:
+    """
+    Returns the directory whose manifest records an output.
+
+    Args:
+        output (Union[str, Path]): The output file.
+
+    Returns:
+        Path: The output's absolute parent directory.
+    """
+    return Path(os.path.abspath(output)).parent
+
+
+class BuildTarget(NamedTuple):
+    """
+    One input file and the output it is built into.
+    """
+
+    source: Path
+    output: Path
+
+
+class TargetOutcome(NamedTuple):
+    """
+    The outcome of building one target of a batch.
+    """
+
+    target: BuildTarget
+    status: str  # SKIPPED, UNCHANGED, WRITTEN or FAILED
+    seconds: float  # time spent on the target (reading and hashing for SKIPPED)
+    entry: Optional[Dict[str, Any]] = None  # new manifest entry, if built
+    error: Optional[str] = None  # error message, if FAILED
+
+
+def _glob_root(pattern: str) -> Path:
+    # The leading directories of a glob pattern that contain no wildcards
+    root = Path()
+    for part in Path(pattern).parts[:-1]:
+        if glob.has_magic(part):
+            break
+        root /= part
+    return root
+
+
+def collect_targets(
+    inputs: Iterable[str],
+    output_dir: Optional[Union[str, Path]] = None,
+    pattern: str = DEFAULT_OUTPUT_PATTERN,
+    suffix: str = DEFAULT_INPUT_SUFFIX,
+) -> List[BuildTarget]:
+    """
+    Expands input files, directories and globs into build targets.
+
+    Directories are searched recursively for files ending in ``suffix``. Each
+    output is named by ``pattern``, where ``{stem}`` and ``{name}`` stand for the
+    input's stem and file name. With an output directory, inputs keep their path
+    relative to the directory (or to the fixed part of the glob) they were found
+    in; without one, outputs are written next to their inputs.
+
+    Args:
+        inputs (Iterable[str]): Input files, directories or glob patterns
+            (``**`` matches any number of directories).
+        output_dir (Optional[Union[str, Path]]): Root of the outputs.
+        pattern (str): Output file name pattern, e.g. '{stem}_cli.py'.
+        suffix (str): Suffix of the input files searched for in directories.
+
+    Returns:
+        List[BuildTarget]: The targets, in input order, without duplicates.
+
+    Raises:
+        ValueError: If the pattern is invalid, an input matches no file, or two
+            inputs map to one output.
+    """
+    try:
+        pattern.format(stem="", name="")
+    except (KeyError, IndexError, ValueError) as e:
+        raise ValueError(
+            f"Invalid output pattern '{pattern}': use {{stem}} and {{name}}") from e
+    targets: List[BuildTarget] = []
+    sources: Dict[Path, Path] = {}
+    outputs: Dict[Path, Path] = {}
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            root = path
+            matches = sorted(p for p in path.rglob(f"*{suffix}") if p.is_file())
+        elif glob.has_magic(item):
+            root = _glob_root(item)
+            matches = sorted(
+                Path(p) for p in glob.glob(item, recursive=True) if Path(p).is_file()
+            )
+        else:
+            root = path.parent
+            matches = [path] if path.is_file() else []
+        if not matches:
+            raise ValueError(f"No input files match '{item}'")
+        for source in matches:
+            resolved = source.resolve()
+            if resolved in sources:
+                continue
+            name = pattern.format(stem=source.stem, name=source.name)
+            if output_dir is None:
+                output = source.with_name(name)
+            else:
+                relative = source.relative_to(root).with_name(name)
+                output = Path(output_dir) / relative
+            clash = outputs.get(output.resolve())
+            if clash is not None:
+                raise ValueError(
+                    f"Inputs {clash} and {source} both map to the output {output}"
+                )
+            sources[resolved] = source
+            outputs[output.resolve()] = source
+            targets.append(BuildTarget(source, output))
+    return targets
+
+
+class BuildSummary:
+    """
+    The outcomes of a batch build, with their totals.
+    """
+
+    def __init__(self, outcomes: List[TargetOutcome], seconds: float, workers: int):
+        self.outcomes = outcomes
+        self.seconds = seconds
+        self.workers = workers
+
+    def count(self, status: str) -> int:
+        """
+        Returns the number of targets with a status.
+        """
+        return sum(1 for outcome in self.outcomes if outcome.status == status)
+
+    @property
+    def failures(self) -> List[TargetOutcome]:
+        """
+        The failed targets, in input order.
+        """
+        return [outcome for outcome in self.outcomes if outcome.status == FAILED]
+
+    def format(self) -> str:
+        """
+        Formats the summary as a short report.
+
+        Returns:
+            str: Totals, cache hits, build timings and one line per failure.
+        """
+        lines = [
+            f"{len(self.outcomes)} target(s) in {self.seconds:.2f}s "
+            f"with {self.workers} worker(s): "
+            f"{self.count(WRITTEN)} written, {self.count(UNCHANGED)} unchanged, "
+            f"{self.count(SKIPPED)} up to date, {self.count(FAILED)} failed"
+        ]
+        built = [
+            outcome
+            for outcome in self.outcomes
+            if outcome.status in (WRITTEN, UNCHANGED)
+        ]
+        if built:
+            total = sum(outcome.seconds for outcome in built)
+            slowest = max(built, key=lambda outcome: outcome.seconds)
+            lines.append(
+                f"build time: {total:.2f}s total, "
+                f"{total / len(built) * 1000:.1f} ms mean, "
+                f"slowest {slowest.target.source} ({slowest.seconds * 1000:.1f} ms)"
+            )
+        for outcome in self.failures:
+            # First line only; parse errors continue with a context excerpt
+            message = (outcome.error or "").split("\n", 1)[0]
+            lines.append(f"failed: {outcome.target.source}: {message}")
+        return "\n".join(lines)
+
+
+def _build_target(
+    target: BuildTarget, syntax: str, key: str, backend: str
+) -> TargetOutcome:
+    start = time.perf_counter()
+    try:
+        # Same gate as the single-input CLI commands, so errors read the same
+        check_syntax_or_fail(syntax)
+        # The caller owns the real manifest; this one only builds the entry
+        manifest = BuildManifest(target.output.parent)
+        result = build_output(syntax, target.output, manifest, key=key, backend=backend)
+    except Exception as e:
+        logger.error(f"Failed to build {target.source}: {e}")
+        return TargetOutcome(
+            target, FAILED, time.perf_counter() - start, error=str(e))
+    return TargetOutcome(
+        target, result.status, time.perf_counter() - start, entry=result.entry
+    )
+
+
+def _init_build_worker(backend: str) -> None:
+    """
+    Process pool initializer: warms the worker's parser and template up front.
+    """
+    get_parser()
+    if backend == "jinja":
+        get_environment().get_template(CLI_TEMPLATE)
+
+
+def _build_in_worker(job: Tuple[BuildTarget, str, str, str]) -> TargetOutcome:
+    return _build_target(*job)
+
+
+def build_all(
+    targets: List[BuildTarget],
+    workers: Optional[int] = None,
+    force: bool = False,
+    chunksize: int = 4,
+    backend: str = DEFAULT_BACKEND,
+) -> BuildSummary:
+    """
+    Builds many targets, spreading parsing and rendering over a process pool.
+
+    Up-to-date targets are skipped in this process, using the build manifest of
+    their output directory; the rest are checked with check_syntax and built by
+    workers whose parser and template are loaded once, in the pool initializer.
+    The pool never has more workers than out-of-date targets. A failing target
+    does not stop the batch. Manifests are saved once, at the end.
+
+    Args:
+        targets (List[BuildTarget]): The targets, e.g. from collect_targets.
+        workers (Optional[int]): Maximum number of worker processes. Defaults to
+            the CPU count. With 1 worker, or at most one out-of-date target, the
+            targets are built in the calling process.
+        force (bool): If True, rebuild up-to-date targets as well.
+        chunksize (int): Number of targets sent to a worker at a time.
+        backend (str): The exporter backend, 'jinja' or 'ast'.
+
+    Returns:
+        BuildSummary: One outcome per target, in target order.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    toolchain = toolchain_hash(backend)
+    manifests: Dict[Path, BuildManifest] = {}
+    outcomes: List[Optional[TargetOutcome]] = [None] * len(targets)
+    pending: List[int] = []
+    jobs: List[Tuple[BuildTarget, str, str, str]] = []
+    for idx, target in enumerate(targets):
+        checked = time.perf_counter()
+        directory = output_directory(target.output)
+        manifest = manifests.get(directory)
+        if manifest is None:
+            manifest = manifests[directory] = BuildManifest.load(directory)
+        try:
+            syntax = target.source.read_text(encoding="utf-8").strip()
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            outcomes[idx] = TargetOutcome(
+                target, FAILED, time.perf_counter() - checked, error=str(e))
+            continue
+        key = build_key(syntax, toolchain)
+        if not force and manifest.is_current(target.output, key):
+            outcomes[idx] = TargetOutcome(
+                target, SKIPPED, time.perf_counter() - checked)
+            continue
+        pending.append(idx)
+        jobs.append((target, syntax, key, backend))
+
+    # The workers actually used, which the summary reports
+    workers = max(1, min(workers, len(pending)))
+    logger.info(
+        f"Building {len(targets)} target(s) ({len(pending)} out of date) "
+        f"with {workers} worker(s)."
+    )
+    if workers == 1:
+        results = [_build_target(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_build_worker, initargs=(backend,)
+        ) as executor:
+            results = list(
+                executor.map(_build_in_worker, jobs, chunksize=max(1, chunksize))
+            )
+
+    changed = set()
+    for idx, outcome in zip(pending, results):
+        outcomes[idx] = outcome
+        if outcome.entry is not None:
+            directory = output_directory(outcome.target.output)
+            manifests[directory].entries[outcome.target.output.name] = outcome.entry
+            changed.add(directory)
+    for directory in changed:
+        manifests[directory].save()
+
+    summary = BuildSummary(
+        outcomes, time.perf_counter() - start, workers  # type: ignore[arg-type]
+    )
+    logger.info(summary.format())
+    return summary
@@ -0,0 +1,230 @@
+# axe_builder/exporter/environment.py
+# Shared Jinja environments for the exporter.
+#
+# One Environment is kept per template directory, so templates are compiled
+# once per process and then served from the environment's in-memory cache
+# (which reloads a template whose file changed). Compiled bytecode is also
+# kept on disk, keyed by a checksum of the template source, so a new process
+# skips the compile step as long as the template is unchanged. Templates can
+# also be precompiled into importable modules under $AXE_BUILDER_CACHE_DIR:
+#
+#     python -m axe_builder.exporter.environment
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from axe_builder.parser.disk_cache import CACHE_DIR_ENV
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    select_autoescape,
+)
+from loguru import logger
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+TEMPLATE_SUFFIX = ".jinja2"
+COMPILED_DIR_NAME = "compiled"
+_SOURCES_FILE = "sources.json"
+
+
+def _cache_root() -> Optional[Path]:
+    # Shared with the persistent parse cache: template caches go to <dir>/templates
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    return Path(cache_dir) / "templates" if cache_dir else None
+
+
+def compiled_templates_path(template_dir: Path) -> Optional[Path]:
+    """
+    Returns the directory holding the precompiled modules of a template directory.
+
+    The modules live in the cache directory named by AXE_BUILDER_CACHE_DIR, never
+    in the (possibly read-only) package, one subdirectory per template directory.
+
+    Args:
+        template_dir (Path): The template directory.
+
+    Returns:
+        Optional[Path]: The compiled-module directory, or None if no cache
+            directory is configured.
+    """
+    root = _cache_root()
+    if root is None:
+        return None
+    key = hashlib.sha256(str(Path(template_dir).resolve()).encode("utf-8"))
+    return root / COMPILED_DIR_NAME / key.hexdigest()[:16]
+
+
+def _template_hashes(template_dir: Path) -> Dict[str, str]:
+    return {
+        path.name: hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(template_dir.glob(f"*{TEMPLATE_SUFFIX}"))
+    }
+
+
+def template_set_hash(template_dir: Optional[Union[str, Path]] = None) -> str:
+    """
+    Returns a hash covering the name and source of every template in a directory.
+
+    Args:
+        template_dir (Optional[Union[str, Path]]): The template directory. Defaults to
+            the exporter's bundled templates.
+
+    Returns:
+        str: SHA-256 hex digest; changes whenever a template is added, removed or edited.
+    """
+    hashes = _template_hashes(Path(template_dir or TEMPLATE_DIR))
+    return hashlib.sha256(json.dumps(hashes).encode("utf-8")).hexdigest()
+
+
+def _bytecode_cache() -> BytecodeCache:
+    directory = _cache_root()
+    if directory is not None:
+        directory.mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(str(directory))
+    # Per-user directory under the system temp dir
+    return FileSystemBytecodeCache()
+
+
+def _loader(template_dir: Path) -> BaseLoader:
+    source_loader = FileSystemLoader(searchpath=str(template_dir))
+    compiled_dir = compiled_templates_path(template_dir)
+    if compiled_dir is None:
+        return source_loader
+    sources_file = compiled_dir / _SOURCES_FILE
+    if not sources_file.exists():
+        return source_loader
+    try:
+        compiled_hashes = json.loads(sources_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable precompiled templates: {e}")
+        return source_loader
+    if compiled_hashes != _template_hashes(template_dir):
+        logger.debug(f"Precompiled templates in {compiled_dir} are stale; ignoring.")
+        return source_loader
+    logger.debug(f"Using precompiled templates from {compiled_dir}")
+    return ChoiceLoader([ModuleLoader(str(compiled_dir)), source_loader])
+
+
+def _build_environment(template_dir: Path, loader: BaseLoader) -> Environment:
+    env = Environment(
+        loader=loader,
+        autoescape=select_autoescape(["jinja2"]),
+        bytecode_cache=_bytecode_cache(),
+        auto_reload=True,
+    )
+    # Python builtins the exporter templates call
+    env.globals.update(enumerate=enumerate, str=str)
+    return env
+
+
+def get_environment(template_dir: Optional[Union[str, Path]] = None) -> Environment:
+    """
+    Returns the shared Jinja environment for a template directory.
+
+    Safe to call from many threads at once; each environment is only built once.
+
+    Args:
+        template_dir (Optional[Union[str, Path]]): The template directory. Defaults to
+            the exporter's bundled templates.
+
+    Returns:
+        Environment: The shared environment.
+    """
+    key = Path(template_dir or TEMPLATE_DIR).resolve()
+    env = _environments.get(key)
+    if env is None:
+        with _environments_lock:
+            env = _environments.get(key)
+            if env is None:
+                logger.debug(f"Building Jinja environment for {key}")
+                env = _build_environment(key, _loader(key))
+                _environments[key] = env
+    return env
+
+
+def clear_environments() -> None:
+    """
+    Drops every shared environment, e.g. after precompiling templates.
+    """
+    with _environments_lock:
+        _environments.clear()
+
+
+def precompile_templates(template_dir: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Compiles every template of a directory into importable Python modules.
+
+    The modules are written to the cache directory named by AXE_BUILDER_CACHE_DIR,
+    together with the hashes of the sources they were compiled from.
+    Environments built afterwards load the modules instead of compiling, until a
+    template changes. Templates that fail to compile are skipped, and are
+    compiled from source when used.
+
+    Args:
+        template_dir (Optional[Union[str, Path]]): The template directory. Defaults to
+            the exporter's bundled templates.
+
+    Returns:
+        Path: The directory holding the compiled modules.
+
+    Raises:
+        ValueError: If the template directory does not exist, or no cache
+            directory is configured.
+    """
+    template_dir = Path(template_dir or TEMPLATE_DIR).resolve()
+    if not template_dir.is_dir():
+        raise ValueError(f"Template directory not found: {template_dir}")
+    compiled_dir = compiled_templates_path(template_dir)
+    if compiled_dir is None:
+        raise ValueError(
+            f"Set {CACHE_DIR_ENV} to the directory for precompiled templates"
+        )
+    env = _build_environment(
+        template_dir, FileSystemLoader(searchpath=str(template_dir)))
+    hashes = _template_hashes(template_dir)
+    env.compile_templates(
+        str(compiled_dir),
+        filter_func=lambda name: name in hashes,
+        zip=None,
+        log_function=logger.debug,
+        ignore_errors=True,
+    )
+    (compiled_dir / _SOURCES_FILE).write_text(json.dumps(hashes), encoding="utf-8")
+    clear_environments()
+    compiled = len(list(compiled_dir.glob("tmpl_*.py")))
+    logger.info(
+        f"Precompiled {compiled} of {len(hashes)} template(s) into {compiled_dir}")
+    return compiled_dir
+
+
+# Process-wide environment registry, built lazily on first use
+_environments: Dict[Path, Environment] = {}
+_environments_lock = threading.Lock()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Precompile the exporter's Jinja templates into Python modules."
+    )
+    arg_parser.add_argument(
+        "template_dir", nargs="?", default=None, help="Template directory."
+    )
+    args = arg_parser.parse_args()
+    try:
+        print(precompile_templates(args.template_dir))
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
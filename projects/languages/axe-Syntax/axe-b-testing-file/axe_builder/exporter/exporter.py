@@ -1,40 +1,180 @@
 # axe_builder/exporter/exporter.py
 
+import hashlib
+import os
+import secrets
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, NamedTuple, Tuple, Union
 
+from axe_builder.exporter.environment import get_environment
 from axe_builder.models.models import MenuCommand
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from axe_builder.models.nodes import MenuNode
 from loguru import logger
 
+CLI_TEMPLATE = "cli_template.jinja2"
 
-def export_cli_template(menus: List[MenuCommand], output_path: str):
+# Bump when a change to the exporter alters its output for the same templates
+EXPORTER_VERSION = "2"
+
+# Size of the write buffer that collects the template's small output chunks
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Creation mode of temporary files; os.open applies the umask to it, so a new
+# output gets the same mode as a file created with plain open()
+_NEW_FILE_MODE = 0o666
+
+
+class WriteResult(NamedTuple):
+    """
+    The outcome of write_atomic.
+    """
+
+    characters: int  # number of characters generated
+    digest: str  # SHA-256 hex digest of the output file's bytes
+    changed: bool  # False if the existing output already had these bytes
+
+
+def file_digest(path: Union[str, Path], block_size: int = WRITE_BUFFER_SIZE) -> str:
+    """
+    Returns the SHA-256 hex digest of a file, read in blocks.
+
+    Args:
+        path (Union[str, Path]): The file.
+        block_size (int): Size of each read, in bytes.
+
+    Returns:
+        str: Hex digest of the file's bytes.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _create_temp_file(output_path: Path) -> Tuple[int, str]:
+    # Same directory as the output, so the rename never crosses filesystems
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        name = str(
+            output_path.parent / f".{output_path.name}.{secrets.token_hex(4)}.tmp"
+        )
+        try:
+            return os.open(name, flags, _NEW_FILE_MODE), name
+        except FileExistsError:
+            continue
+
+
+def write_atomic(
+    output_path: Union[str, Path],
+    chunks: Iterable[str],
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    skip_unchanged: bool = False,
+) -> WriteResult:
+    """
+    Streams text chunks to a temporary file, then renames it over the output path.
+
+    Readers of the output path see either the old file or the complete new one,
+    never a partial write. Only one buffer of text is held in memory at a time,
+    and the digest is computed from the buffers as they are written. A replaced
+    output keeps its mode; a new one gets the default mode for the umask.
+
+    Args:
+        output_path (Union[str, Path]): The destination file.
+        chunks (Iterable[str]): The text to write, in order.
+        buffer_size (int): Size of the write buffer, in bytes.
+        skip_unchanged (bool): If True, an existing output with the same bytes is
+            left alone (keeping its mtime) instead of being replaced.
+
+    Returns:
+        WriteResult: Characters written, digest of the output and whether it changed.
+    """
+    output_path = Path(output_path)
+    try:
+        mode = output_path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = None
+    fd, tmp_name = _create_temp_file(output_path)
+    try:
+        written = 0
+        hasher = hashlib.sha256()
+        pending: List[str] = []
+        pending_size = 0
+        with open(fd, "wb") as f:
+            # Chunks are batched, then encoded, hashed and written one buffer at a
+            # time, so the file never has to be read back for its digest
+            for chunk in chunks:
+                pending.append(chunk)
+                pending_size += len(chunk)
+                if pending_size >= buffer_size:
+                    data = "".join(pending).encode("utf-8")
+                    hasher.update(data)
+                    f.write(data)
+                    written += pending_size
+                    pending.clear()
+                    pending_size = 0
+            data = "".join(pending).encode("utf-8")
+            hasher.update(data)
+            f.write(data)
+            written += pending_size
+        digest = hasher.hexdigest()
+        if (
+            skip_unchanged
+            and output_path.is_file()
+            and file_digest(output_path, buffer_size) == digest
+        ):
+            os.unlink(tmp_name)
+            return WriteResult(written, digest, False)
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return WriteResult(written, digest, True)
+
+
+def export_cli_template(
+    menus: List[Union[MenuNode, MenuCommand]],
+    output_path: str,
+    skip_unchanged: bool = False,
+) -> WriteResult:
     """
     Exports the parsed axe:Syntax menus to a Python CLI template using Typer.
 
+    The template's output is streamed to disk as it is generated, so memory use
+    does not grow with the size of the generated module. The output file is
+    replaced atomically; a failed export leaves any previous file untouched.
+
     Args:
-        menus (List[MenuCommand]): The list of parsed MenuCommand objects.
+        menus (List[Union[MenuNode, MenuCommand]]): The parsed menus, as nodes (e.g. from
+            AxeSyntaxParser.parse_nodes) or MenuCommand objects.
         output_path (str): The file path to export the generated CLI template.
+        skip_unchanged (bool): If True, an existing output with identical bytes is
+            not rewritten, so its mtime stays stable.
+
+    Returns:
+        WriteResult: Characters written, digest of the output and whether it changed.
     """
     try:
         logger.info(f"Exporting CLI template to {output_path}")
 
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent / "templates"
-        env = Environment(
-            loader=FileSystemLoader(searchpath=str(template_dir)),
-            autoescape=select_autoescape(["jinja2"]),
-        )
-        template = env.get_template("cli_template.jinja2")
-
-        # Render the template with menus
-        rendered = template.render(menus=menus)
+        # Shared environment: the template is compiled once per process
+        template = get_environment().get_template(CLI_TEMPLATE)
 
-        # Write the rendered template to the output file
-        with open(output_path, "w") as f:
-            f.write(rendered)
+        # Render chunk by chunk, straight into the output file
+        result = write_atomic(
+            output_path, template.generate(menus=menus), skip_unchanged=skip_unchanged
+        )
 
-        logger.success(f"CLI template successfully exported to {output_path}")
+        if result.changed:
+            logger.success(
+                f"CLI template successfully exported to {output_path} "
+                f"({result.characters} characters)"
+            )
+        else:
+            logger.info(f"CLI template at {output_path} is unchanged; not rewritten.")
+        return result
 
     except Exception as e:
         logger.exception(f"Failed to export CLI template: {e}")
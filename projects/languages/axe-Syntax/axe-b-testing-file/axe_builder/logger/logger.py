@@ -31,10 +31,10 @@
 logger.add(
     "axe_builder.json",
     level="DEBUG",
-    format='{"time": "{time:YYYY-MM-DD HH:mm:ss}", "level": "{level}", "message": "{message}"}',
+    format='{{"time": "{time:YYYY-MM-DD HH:mm:ss}", "level": "{level}", "message": "{message}"}}',
     rotation="50 MB",
     retention="30 days",
-    compression="gzip",
+    compression="gz",
     enqueue=True,
     serialize=True,
 )
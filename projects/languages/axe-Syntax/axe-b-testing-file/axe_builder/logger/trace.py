@@ -0,0 +1,68 @@
+# axe_builder/logger/trace.py
+# Switch for per-token and per-parse trace logging in the parser hot path.
+#
+# Hot-path call sites log as
+#
+#     if trace.enabled:
+#         logger.debug("Created MenuCommand: {}", menu_command)
+#
+# so in production mode they cost one attribute lookup, and otherwise the
+# message is only formatted (and its arguments repr'd) when a sink accepts it.
+
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+PRODUCTION_ENV = "AXE_BUILDER_PRODUCTION"
+
+# Read by every hot-path call site; change it through set_production_mode
+enabled = os.environ.get(PRODUCTION_ENV, "").strip().lower() not in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
+
+def set_production_mode(production: bool) -> None:
+    """
+    Turns production mode on or off.
+
+    In production mode the parser and transformer skip their trace logging
+    entirely. Warnings and errors are still logged.
+
+    Args:
+        production (bool): True to drop trace logging, False to restore it.
+    """
+    global enabled
+    enabled = not production
+
+
+@contextmanager
+def production_mode(production: bool = True) -> Iterator[None]:
+    """
+    Sets production mode for the duration of a with block.
+
+    The previous setting is restored on exit, so callers such as a single CLI
+    invocation do not leave the process-wide switch changed.
+
+    Args:
+        production (bool): True to drop trace logging, False to keep it.
+    """
+    global enabled
+    previous = enabled
+    enabled = not production
+    try:
+        yield
+    finally:
+        enabled = previous
+
+
+def is_production_mode() -> bool:
+    """
+    Returns whether production mode is on.
+
+    Returns:
+        bool: True if trace logging is disabled.
+    """
+    return not enabled
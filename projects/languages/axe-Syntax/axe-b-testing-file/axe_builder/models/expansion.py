@@ -0,0 +1,207 @@
+# axe_builder/models/expansion.py
+
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from axe_builder.models.nodes import MenuNode, Node, SubNode, from_models
+
+DEFAULT_MAX_ITEMS = 1_000_000
+
+
+class ExpansionLimitError(ValueError):
+    """
+    Raised when an expansion would exceed its configured limits.
+
+    Attributes:
+        size (int): The offending size (total items, or a single count).
+        limit (int): The limit it exceeds.
+    """
+
+    def __init__(self, message: str, size: int, limit: int):
+        super().__init__(message)
+        self.size = size
+        self.limit = limit
+
+
+class ExpandedNode(NamedTuple):
+    """
+    One concrete item of an expansion.
+
+    ``node`` is the source node itself, shared by all of its copies.
+    """
+
+    source: int  # position of the source command in the parse result
+    menu_copy: int  # 1-based copy of the enclosing menu, 0 for a top-level subcommand
+    copy: int  # 1-based copy of this node (equals menu_copy for a menu)
+    node: Node
+
+
+def menu_copies(menu: MenuNode) -> int:
+    """
+    Returns how many concrete menus a MenuNode declares.
+
+    ``[M+{3}]`` adds three menus; ``[M={2}]`` refers to a single menu (number 2).
+
+    Args:
+        menu (MenuNode): The menu.
+
+    Returns:
+        int: The number of copies.
+    """
+    if menu.operation == "+" and menu.count is not None:
+        return menu.count
+    return 1
+
+
+def sub_copies(sub: SubNode) -> int:
+    """
+    Returns how many concrete items a SubNode declares.
+
+    A custom subcommand with a count, as in ``(.)={6}``, stands for that many
+    items; anything else is a single item.
+
+    Args:
+        sub (SubNode): The subcommand.
+
+    Returns:
+        int: The number of copies.
+    """
+    if sub.type == "." and sub.count is not None:
+        return sub.count
+    return 1
+
+
+def _command_size(node: Node) -> int:
+    if isinstance(node, MenuNode):
+        block = 1 + sum(sub_copies(sub) for sub in node.subcommands)
+        return menu_copies(node) * block
+    return sub_copies(node)
+
+
+def expanded_size(commands: Iterable) -> int:
+    """
+    Returns the number of items a parse result expands to, without expanding it.
+
+    Args:
+        commands (Iterable): MenuNode/SubNode objects or MenuCommand/SubCommand models.
+
+    Returns:
+        int: Total number of ExpandedNode items.
+    """
+    return sum(_command_size(node) for node in from_models(commands))
+
+
+class CountExpansion:
+    """
+    A lazy, read-only view of a parse result with its counts unrolled.
+
+    Each menu copy is followed by its subcommands, with every custom
+    subcommand repeated ``count`` times. The total size is computed up front
+    from the counts alone, and checked against the limits before any item
+    exists. Items are produced on demand, by iteration or by position, so
+    memory use does not depend on the declared counts.
+    """
+
+    def __init__(
+        self,
+        commands: Iterable,
+        max_items: Optional[int] = DEFAULT_MAX_ITEMS,
+        max_count: Optional[int] = None,
+    ):
+        """
+        Initializes the CountExpansion.
+
+        Args:
+            commands (Iterable): MenuNode/SubNode objects or MenuCommand/SubCommand models.
+            max_items (Optional[int]): Maximum total number of items. None for no limit.
+            max_count (Optional[int]): Maximum value of any single count. None for no limit.
+
+        Raises:
+            ExpansionLimitError: If the expansion exceeds a limit.
+        """
+        self.nodes: List[Node] = from_models(commands)
+        if max_count is not None:
+            for node in self.nodes:
+                subcommands = getattr(node, "subcommands", ())
+                for count in [node.count, *(sub.count for sub in subcommands)]:
+                    if count is not None and count > max_count:
+                        raise ExpansionLimitError(
+                            f"Count {count} exceeds the limit of {max_count}.",
+                            count,
+                            max_count,
+                        )
+        # offsets[i] is the position of the first item of command i
+        self.offsets: List[int] = [0]
+        for node in self.nodes:
+            self.offsets.append(self.offsets[-1] + _command_size(node))
+        self.size = self.offsets[-1]
+        if max_items is not None and self.size > max_items:
+            raise ExpansionLimitError(
+                f"Expansion to {self.size} items exceeds the limit of {max_items}.",
+                self.size,
+                max_items,
+            )
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[ExpandedNode]:
+        for source, node in enumerate(self.nodes):
+            if isinstance(node, MenuNode):
+                for menu_copy in range(1, menu_copies(node) + 1):
+                    yield ExpandedNode(source, menu_copy, menu_copy, node)
+                    for sub in node.subcommands:
+                        for copy in range(1, sub_copies(sub) + 1):
+                            yield ExpandedNode(source, menu_copy, copy, sub)
+            else:
+                for copy in range(1, sub_copies(node) + 1):
+                    yield ExpandedNode(source, 0, copy, node)
+
+    def __getitem__(self, position: int) -> ExpandedNode:
+        """
+        Returns the item at a position, in O(log n) without expanding anything.
+
+        Args:
+            position (int): Item position; negative positions count from the end.
+
+        Returns:
+            ExpandedNode: The item.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if position < 0:
+            position += self.size
+        if not 0 <= position < self.size:
+            raise IndexError("expansion index out of range")
+        source = bisect_right(self.offsets, position) - 1
+        node = self.nodes[source]
+        local = position - self.offsets[source]
+        if not isinstance(node, MenuNode):
+            return ExpandedNode(source, 0, local + 1, node)
+        block = 1 + sum(sub_copies(sub) for sub in node.subcommands)
+        menu_copy, offset = divmod(local, block)
+        menu_copy += 1
+        if offset == 0:
+            return ExpandedNode(source, menu_copy, menu_copy, node)
+        offset -= 1
+        for sub in node.subcommands:
+            copies = sub_copies(sub)
+            if offset < copies:
+                return ExpandedNode(source, menu_copy, offset + 1, sub)
+            offset -= copies
+        raise RuntimeError("Expansion offsets and block sizes disagree.")
+
+    def window(self, start: int, stop: int) -> Iterator[ExpandedNode]:
+        """
+        Iterates over the items in ``[start, stop)``, e.g. the visible rows of a view.
+
+        Args:
+            start (int): First position.
+            stop (int): Position after the last one; clamped to the size.
+
+        Returns:
+            Iterator[ExpandedNode]: The items, in order.
+        """
+        positions = range(max(start, 0), min(stop, self.size))
+        return (self[position] for position in positions)
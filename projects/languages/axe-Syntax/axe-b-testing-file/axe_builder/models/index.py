@@ -0,0 +1,207 @@
+# axe_builder/models/index.py
+
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from axe_builder.models.nodes import MenuNode, Node, from_models
+
+NO_PARENT = -1
+PATH_SEPARATOR = "/"
+
+
+class MenuIndex:
+    """
+    The menu hierarchy of a parse result, built once and read-only afterwards.
+
+    Every menu and subcommand of the result is an entry, numbered in document
+    order. "M" menus are roots; an "N" menu nests under the closest preceding
+    "M" menu (or is a root if there is none); subcommands are children of their
+    menu, and a top-level subcommand (e.g. a chained title) belongs to the
+    closest preceding menu. Document order is then a preorder walk, so the
+    subtree of an entry is a contiguous range of entries.
+
+    Each entry has a path made of its ancestors' segments and its own, where a
+    segment is the entry's type followed by its 1-based rank among siblings of
+    the same type: ``M2/N3/.1`` is the first custom subcommand of the third
+    nested menu of the second main menu.
+    """
+
+    def __init__(self):
+        self.nodes: List[Node] = []
+        self.parents: List[int] = []
+        self.paths: List[str] = []
+        self._children: List[List[int]] = []
+        self._ends: List[int] = []
+        self._roots: List[int] = []
+        self._by_path: Dict[str, int] = {}
+        self._by_title: Dict[str, List[int]] = {}
+        # Number of children of each type per parent, for path ranks
+        self._ranks: Dict[Tuple[int, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @classmethod
+    def from_commands(cls, commands: Iterable) -> "MenuIndex":
+        """
+        Builds the index of a parse result.
+
+        Args:
+            commands (Iterable): MenuNode/SubNode objects or MenuCommand/SubCommand models.
+
+        Returns:
+            MenuIndex: The index.
+        """
+        index = cls()
+        current_main = NO_PARENT
+        current_menu = NO_PARENT
+        for node in from_models(commands):
+            if isinstance(node, MenuNode):
+                parent = current_main if node.type == "N" else NO_PARENT
+                entry = index._add(node, parent)
+                if node.type == "M":
+                    current_main = entry
+                current_menu = entry
+                for sub in node.subcommands:
+                    index._add(sub, entry)
+            else:
+                index._add(node, current_menu)
+        return index
+
+    def _add(self, node: Node, parent: int) -> int:
+        entry = len(self.nodes)
+        rank = self._ranks.get((parent, node.type), 0) + 1
+        self._ranks[(parent, node.type)] = rank
+        segment = f"{node.type}{rank}"
+        path = (
+            segment
+            if parent == NO_PARENT
+            else f"{self.paths[parent]}{PATH_SEPARATOR}{segment}"
+        )
+        if parent == NO_PARENT:
+            self._roots.append(entry)
+        else:
+            self._children[parent].append(entry)
+        self.nodes.append(node)
+        self.parents.append(parent)
+        self.paths.append(path)
+        self._children.append([])
+        self._ends.append(entry + 1)
+        self._by_path[path] = entry
+        # Extend the subtree range of every ancestor
+        while parent != NO_PARENT:
+            self._ends[parent] = entry + 1
+            parent = self.parents[parent]
+        if node.type == "T" and node.value is not None:
+            self._by_title.setdefault(node.value, []).append(entry)
+        return entry
+
+    def roots(self) -> Tuple[int, ...]:
+        """
+        Returns the top-level entries, in document order.
+        """
+        return tuple(self._roots)
+
+    def node(self, entry: int) -> Node:
+        """
+        Returns the node of an entry.
+        """
+        return self.nodes[entry]
+
+    def parent(self, entry: int) -> Optional[int]:
+        """
+        Returns the parent of an entry, or None for a root.
+        """
+        parent = self.parents[entry]
+        return None if parent == NO_PARENT else parent
+
+    def children(self, entry: int) -> Tuple[int, ...]:
+        """
+        Returns the direct children of an entry, in document order.
+        """
+        return tuple(self._children[entry])
+
+    def path(self, entry: int) -> str:
+        """
+        Returns the path of an entry, e.g. 'M2/N3/.1'.
+        """
+        return self.paths[entry]
+
+    def lookup(self, path: str) -> int:
+        """
+        Returns the entry at a path.
+
+        Args:
+            path (str): A path such as 'M2/N3/.1'.
+
+        Returns:
+            int: The entry.
+
+        Raises:
+            KeyError: If no entry has that path.
+        """
+        entry = self._by_path.get(path.strip(PATH_SEPARATOR))
+        if entry is None:
+            raise KeyError(f"No menu entry at path '{path}'")
+        return entry
+
+    def get(self, path: str) -> Optional[Node]:
+        """
+        Returns the node at a path, or None if there is none.
+        """
+        entry = self._by_path.get(path.strip(PATH_SEPARATOR))
+        return None if entry is None else self.nodes[entry]
+
+    def titled(self, title: str) -> List[int]:
+        """
+        Returns the entries that carry a title subcommand with the given value.
+
+        Args:
+            title (str): The title to look up.
+
+        Returns:
+            List[int]: The titled entries (the parents of the matching "T"
+                subcommands), in document order.
+        """
+        return [
+            self.parents[entry]
+            for entry in self._by_title.get(title, ())
+            if self.parents[entry] != NO_PARENT
+        ]
+
+    def subtree(self, entry: int) -> Iterator[int]:
+        """
+        Iterates over an entry and all its descendants, in document order.
+
+        Args:
+            entry (int): The subtree's root.
+
+        Returns:
+            Iterator[int]: The entries of the subtree.
+        """
+        return iter(range(entry, self._ends[entry]))
+
+    def estimate_size(self) -> int:
+        """
+        Estimates the memory held by the index itself (not its nodes), in bytes.
+
+        Returns:
+            int: Approximate size of the index's lists, dicts and paths.
+        """
+        size = sum(
+            sys.getsizeof(container)
+            for container in (
+                self.nodes,
+                self.parents,
+                self.paths,
+                self._children,
+                self._ends,
+                self._roots,
+                self._by_path,
+                self._by_title,
+                self._ranks,
+            )
+        )
+        size += sum(sys.getsizeof(path) for path in self.paths)
+        size += sum(sys.getsizeof(children) for children in self._children)
+        return size
@@ -0,0 +1,91 @@
+# axe_builder/models/loader.py
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from axe_builder.models.models import MenuCommand
+from pydantic import TypeAdapter, ValidationError
+
+MenuCommandList = List[MenuCommand]
+
+
+class CommandLoadError(ValueError):
+    """
+    Raised when a menu payload fails validation.
+
+    Attributes:
+        errors (List[Dict[str, Any]]): Every problem found, each with the path to the
+            offending node ('loc'), a message ('msg') and an error type ('type').
+    """
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self.errors = errors
+        lines = [
+            f"{'.'.join(str(part) for part in error['loc']) or '<root>'}: {error['msg']}"
+            for error in errors
+        ]
+        super().__init__(
+            f"{len(errors)} invalid node(s) in menu payload:\n" + "\n".join(lines)
+        )
+
+
+@lru_cache(maxsize=None)
+def commands_adapter() -> TypeAdapter:
+    """
+    Returns the shared TypeAdapter for List[MenuCommand].
+
+    Building the adapter compiles a validator for the whole list schema, so it is
+    built once, on first use, and reused by every load.
+
+    Returns:
+        TypeAdapter: The adapter.
+    """
+    return TypeAdapter(MenuCommandList)
+
+
+def load_commands(
+    payload: Union[str, bytes, Sequence[Any]], strict: bool = False
+) -> List[MenuCommand]:
+    """
+    Validates a whole list of menus in one call.
+
+    JSON text is parsed and validated in a single pass by pydantic-core, without
+    building intermediate Python dicts.
+
+    Args:
+        payload (Union[str, bytes, Sequence[Any]]): JSON text of a list of menus (e.g. a
+            dump written by dump_commands), or the already decoded list.
+        strict (bool): If True, values must already have the right types ("2" is not
+            accepted as a count), and nothing is coerced.
+
+    Returns:
+        List[MenuCommand]: The validated menus.
+
+    Raises:
+        CommandLoadError: If any node is invalid. Every invalid node is reported, with
+            its path (e.g. '3.subcommands.0').
+    """
+    adapter = commands_adapter()
+    try:
+        if isinstance(payload, (str, bytes)):
+            return adapter.validate_json(payload, strict=strict)
+        return adapter.validate_python(payload, strict=strict)
+    except ValidationError as e:
+        raise CommandLoadError(
+            e.errors(include_url=False, include_context=False)) from e
+
+
+def dump_commands(
+    commands: Sequence[MenuCommand], indent: Optional[int] = None
+) -> bytes:
+    """
+    Serializes a list of menus to JSON in one call.
+
+    Args:
+        commands (Sequence[MenuCommand]): The menus.
+        indent (Optional[int]): Indentation, or None for compact output.
+
+    Returns:
+        bytes: UTF-8 encoded JSON, loadable with load_commands.
+    """
+    return commands_adapter().dump_json(list(commands), indent=indent)
@@ -2,7 +2,8 @@
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from axe_builder.models.validation import check_menu_command, check_subcommand
+from pydantic import BaseModel, Field, model_validator
 
 
 class SubCommand(BaseModel):
@@ -11,24 +12,10 @@ class SubCommand(BaseModel):
     value: Optional[str] = None
     count: Optional[int] = None
 
-    @field_validator("type")
-    def validate_subcommand_type(cls, v):
-        if v not in {"T", "."}:
-            raise ValueError("Invalid SubCommand type. Must be 'T' or '.'")
-        return v
-
-    @field_validator("operation")
-    def validate_operation(cls, v, values):
-        if v and v not in {"+", "="}:
-            raise ValueError(
-                "Invalid operation in SubCommand. Must be '+' or '='")
-        return v
-
-    @field_validator("value")
-    def validate_value(cls, v, values):
-        if values["type"] == "T" and not v:
-            raise ValueError("Title SubCommand must have a value")
-        return v
+    @model_validator(mode="after")
+    def validate_subcommand(self):
+        check_subcommand(self.type, self.operation, self.value, self.count)
+        return self
 
 
 class MenuCommand(BaseModel):
@@ -37,29 +24,8 @@ class MenuCommand(BaseModel):
     count: Optional[int] = None
     subcommands: List[SubCommand] = Field(default_factory=list)
 
-    @field_validator("type")
-    def validate_menu_type(cls, v):
-        if v not in {"M", "N"}:
-            raise ValueError("Invalid MenuCommand type. Must be 'M' or 'N'")
-        return v
-
-    @field_validator("operation")
-    def validate_operation(cls, v):
-        if v and v not in {"+", "="}:
-            raise ValueError("Invalid operation. Must be '+' or '='")
-        return v
-
-    @field_validator("count")
-    def validate_count(cls, v):
-        if v is not None and v <= 0:
-            raise ValueError("Count must be a positive integer")
-        return v
+    @model_validator(mode="after")
+    def validate_menu_command(self):
+        check_menu_command(self.type, self.operation, self.count, self.subcommands)
+        return self
 
-    @field_validator("subcommands", pre=True, check_fields=True)
-    def check_subcommands(cls, v, values):
-        # Safely retrieve the operation field
-        operation = values.get("operation")
-        if operation == "+" and not v:
-            raise ValueError(
-                "SubCommands must be provided when operation is '+'")
-        return v
@@ -0,0 +1,306 @@
+# axe_builder/models/nodes.py
+# Compact, immutable internal representation of parsed commands.
+#
+# The parser, its caches and the exporter work on these named tuples. The
+# pydantic models in models.py are only built at the public API boundary
+# (AxeSyntaxParser.parse, JSON output), through to_models.
+
+import hashlib
+import json
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from axe_builder.models.models import MenuCommand, SubCommand
+from axe_builder.models.validation import check_menu_command, check_subcommand
+
+
+class SubNode(NamedTuple):
+    type: str  # "T" for Title, "." for Custom
+    operation: Optional[str] = None  # "+" or "=" if applicable
+    value: Optional[str] = None
+    count: Optional[int] = None
+
+
+class MenuNode(NamedTuple):
+    type: str  # "M" for Main Menu, "N" for Nested Menu
+    operation: Optional[str] = None  # "+" or "="
+    count: Optional[int] = None
+    subcommands: Tuple[SubNode, ...] = ()
+
+
+Node = Union[MenuNode, SubNode]
+
+
+def make_subnode(
+    type: str,
+    operation: Optional[str] = None,
+    value: Optional[str] = None,
+    count: Optional[int] = None,
+    trusted: bool = False,
+) -> SubNode:
+    """
+    Builds a SubNode, checking its fields exactly once.
+
+    Args:
+        type (str): "T" for Title, "." for Custom.
+        operation (Optional[str]): "+" or "=", if any.
+        value (Optional[str]): The title, for "T" subcommands.
+        count (Optional[int]): The count, for "." subcommands.
+        trusted (bool): Skip the check for fields that were already validated.
+
+    Returns:
+        SubNode: The new SubNode.
+
+    Raises:
+        CommandValidationError: If a field is invalid and the input is not trusted.
+    """
+    if not trusted:
+        check_subcommand(type, operation, value, count)
+    return SubNode(type, operation, value, count)
+
+
+def make_menunode(
+    type: str,
+    operation: Optional[str] = None,
+    count: Optional[int] = None,
+    subcommands: Iterable[SubNode] = (),
+    trusted: bool = False,
+) -> MenuNode:
+    """
+    Builds a MenuNode, checking its own fields exactly once.
+
+    The subcommands must already be valid SubNodes; they are not checked again.
+
+    Args:
+        type (str): "M" for Main Menu, "N" for Nested Menu.
+        operation (Optional[str]): "+" or "=", if any.
+        count (Optional[int]): The count, if any.
+        subcommands (Iterable[SubNode]): The menu's subcommands.
+        trusted (bool): Skip the check for fields that were already validated.
+
+    Returns:
+        MenuNode: The new MenuNode.
+
+    Raises:
+        CommandValidationError: If a field is invalid and the input is not trusted.
+    """
+    subcommands = tuple(subcommands)
+    if not trusted:
+        check_menu_command(type, operation, count, subcommands)
+    return MenuNode(type, operation, count, subcommands)
+
+
+class NodeInterner:
+    """
+    A flyweight table of nodes and titles.
+
+    Generated definitions repeat the same subcommands (and often whole menus)
+    many times. An interner hands out one shared instance per structurally
+    identical node, and one shared string per title, so repetitive input costs
+    memory per distinct node rather than per occurrence. Sharing is safe because
+    nodes are immutable. A node that is already interned is not validated again.
+
+    The table is cleared once it holds ``max_entries`` nodes; instances handed
+    out before that stay valid, they are just no longer shared with new ones.
+    """
+
+    def __init__(self, max_entries: int = 65536):
+        """
+        Initializes the NodeInterner.
+
+        Args:
+            max_entries (int): Maximum number of interned nodes and titles.
+
+        Raises:
+            ValueError: If max_entries is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+        self.max_entries = max_entries
+        self._nodes: Dict[Node, Node] = {}
+        self._titles: Dict[str, str] = {}
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes) + len(self._titles)
+
+    def clear(self) -> None:
+        """
+        Drops every interned node and title.
+        """
+        self._nodes.clear()
+        self._titles.clear()
+
+    def _shared(self, table: dict, key):
+        shared = table.get(key)
+        if shared is not None:
+            self.hits += 1
+            return shared
+        if len(self) >= self.max_entries:
+            self.clear()
+        table[key] = key
+        return key
+
+    def title(self, value: Optional[str]) -> Optional[str]:
+        """
+        Returns the shared instance of a title string.
+
+        Args:
+            value (Optional[str]): The title, or None.
+
+        Returns:
+            Optional[str]: An equal string, shared by every caller.
+        """
+        if value is None:
+            return None
+        return self._shared(self._titles, value)
+
+    def subnode(
+        self,
+        type: str,
+        operation: Optional[str] = None,
+        value: Optional[str] = None,
+        count: Optional[int] = None,
+    ) -> SubNode:
+        """
+        Returns the shared SubNode for the given fields, building it on first use.
+
+        Args:
+            type (str): "T" for Title, "." for Custom.
+            operation (Optional[str]): "+" or "=", if any.
+            value (Optional[str]): The title, for "T" subcommands.
+            count (Optional[int]): The count, for "." subcommands.
+
+        Returns:
+            SubNode: The shared SubNode.
+
+        Raises:
+            CommandValidationError: If a field is invalid.
+        """
+        key = SubNode(type, operation, value, count)
+        shared = self._nodes.get(key)
+        if shared is not None:
+            self.hits += 1
+            return shared
+        check_subcommand(type, operation, value, count)
+        return self._shared(
+            self._nodes, SubNode(type, operation, self.title(value), count))
+
+    def intern(self, node: Node) -> Node:
+        """
+        Returns the shared instance of an already validated node.
+
+        Args:
+            node (Node): A MenuNode or SubNode.
+
+        Returns:
+            Node: An equal node, shared by every caller.
+        """
+        return self._shared(self._nodes, node)
+
+
+def structural_hash(command: Union[MenuCommand, SubCommand, Node]) -> str:
+    """
+    Returns a stable hash of a command's structure.
+
+    Structurally identical commands hash the same whether they are nodes or
+    models, and across processes and runs (unlike hash(), which is salted for
+    strings), so the hash can key persistent caches.
+
+    Args:
+        command (Union[MenuCommand, SubCommand, Node]): The command to hash.
+
+    Returns:
+        str: A 32-character hex digest.
+    """
+    node = from_model(command)
+    if isinstance(node, MenuNode):
+        fields = ["menu", node.type, node.operation, node.count,
+                  [list(sub) for sub in node.subcommands]]
+    else:
+        fields = ["sub", *node]
+    canonical = json.dumps(fields, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def to_model(node: Node) -> Union[MenuCommand, SubCommand]:
+    """
+    Converts a node into its pydantic model.
+
+    The models are built with the validated pydantic constructors, so their
+    validators check the fields again.
+
+    Args:
+        node (Node): A MenuNode or SubNode.
+
+    Returns:
+        Union[MenuCommand, SubCommand]: The equivalent model.
+    """
+    if isinstance(node, MenuNode):
+        return MenuCommand(
+            type=node.type,
+            operation=node.operation,
+            count=node.count,
+            subcommands=[
+                SubCommand(
+                    type=sub.type,
+                    operation=sub.operation,
+                    value=sub.value,
+                    count=sub.count,
+                )
+                for sub in node.subcommands
+            ],
+        )
+    return SubCommand(
+        type=node.type, operation=node.operation, value=node.value, count=node.count
+    )
+
+
+def to_models(nodes: Iterable[Node]) -> List[Union[MenuCommand, SubCommand]]:
+    """
+    Converts nodes into pydantic models.
+
+    Args:
+        nodes (Iterable[Node]): MenuNodes and SubNodes.
+
+    Returns:
+        List[Union[MenuCommand, SubCommand]]: Fresh models, one per node.
+    """
+    return [to_model(node) for node in nodes]
+
+
+def from_model(cmd: Union[MenuCommand, SubCommand, Node]) -> Node:
+    """
+    Converts a pydantic model into a node. Nodes are returned unchanged.
+
+    Args:
+        cmd (Union[MenuCommand, SubCommand, Node]): The command to convert.
+
+    Returns:
+        Node: The equivalent node.
+    """
+    if isinstance(cmd, (MenuNode, SubNode)):
+        return cmd
+    if isinstance(cmd, MenuCommand):
+        return MenuNode(
+            cmd.type,
+            cmd.operation,
+            cmd.count,
+            tuple(
+                SubNode(sub.type, sub.operation, sub.value, sub.count)
+                for sub in cmd.subcommands
+            ),
+        )
+    return SubNode(cmd.type, cmd.operation, cmd.value, cmd.count)
+
+
+def from_models(commands: Iterable) -> List[Node]:
+    """
+    Converts pydantic models (or nodes) into nodes.
+
+    Args:
+        commands (Iterable): MenuCommand/SubCommand objects or nodes.
+
+    Returns:
+        List[Node]: The equivalent nodes.
+    """
+    return [from_model(cmd) for cmd in commands]
@@ -0,0 +1,356 @@
+# axe_builder/models/table.py
+
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from axe_builder.models.nodes import (
+    MenuNode,
+    Node,
+    SubNode,
+    from_models,
+    to_models,
+)
+
+# Column encodings. Counts use -1 for None: valid counts are always positive.
+MENU_TYPES = ("M", "N")
+SUB_TYPES = ("T", ".")
+OPERATIONS = (None, "+", "=")
+NO_COUNT = -1
+NO_VALUE = -1
+# Row kinds: a MenuCommand, or a SubCommand at the top level of a parse result
+KIND_MENU = 0
+KIND_SUB = 1
+
+_MENU_TYPE_CODES = {t: i for i, t in enumerate(MENU_TYPES)}
+_SUB_TYPE_CODES = {t: i for i, t in enumerate(SUB_TYPES)}
+_OPERATION_CODES = {op: i for i, op in enumerate(OPERATIONS)}
+
+# A count column: signed 64-bit, or a list once a count outgrows that range
+CountColumn = Union[array, List[int]]
+
+
+def _append_count(column: CountColumn, count: Optional[int]) -> CountColumn:
+    # Returns the column to keep: the same one, or a list holding a huge count
+    value = NO_COUNT if count is None else count
+    try:
+        column.append(value)
+    except OverflowError:
+        column = list(column)
+        column.append(value)
+    return column
+
+
+class StringPool:
+    """
+    An append-only pool of interned strings, addressed by integer id.
+    """
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def intern(self, value: Optional[str]) -> int:
+        """
+        Returns the id of a string, adding it to the pool on first use.
+
+        Args:
+            value (Optional[str]): The string. None maps to NO_VALUE.
+
+        Returns:
+            int: The string's id.
+        """
+        if value is None:
+            return NO_VALUE
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(value)
+            self._ids[value] = string_id
+        return string_id
+
+    def lookup(self, value: str) -> Optional[int]:
+        """
+        Returns the id of a string, or None if it is not in the pool.
+        """
+        return self._ids.get(value)
+
+    def get(self, string_id: int) -> Optional[str]:
+        """
+        Returns the string for an id. NO_VALUE maps to None.
+        """
+        return None if string_id == NO_VALUE else self.strings[string_id]
+
+
+class MenuTable:
+    """
+    A struct-of-arrays container for large parse results.
+
+    Each command of the result is a row. Row columns (kind, menu type,
+    operation, count) are typed arrays; subcommands are stored flat in their
+    own typed arrays, and ``sub_offsets`` holds CSR offsets: the subcommands of
+    row ``i`` are ``sub_offsets[i]:sub_offsets[i + 1]``. Titles are interned in
+    a StringPool and stored by id. A top-level SubCommand is a KIND_SUB row with
+    exactly one subcommand. A count column holding a count outside the signed
+    64-bit range is a plain list instead, so any count round-trips.
+
+    Tables are built once, from a parse result, and are read-only afterwards.
+    """
+
+    def __init__(self):
+        self.kind = array("b")
+        self.menu_type = array("b")
+        self.menu_operation = array("b")
+        self.menu_count: CountColumn = array("q")
+        self.sub_offsets = array("q", [0])
+        self.sub_type = array("b")
+        self.sub_operation = array("b")
+        self.sub_value = array("q")
+        self.sub_count: CountColumn = array("q")
+        self.titles = StringPool()
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    @classmethod
+    def from_commands(cls, commands: Iterable) -> "MenuTable":
+        """
+        Builds a table from a parse result.
+
+        Args:
+            commands (Iterable): MenuNode/SubNode objects or MenuCommand/SubCommand models.
+
+        Returns:
+            MenuTable: The table, one row per command.
+        """
+        table = cls()
+        for node in from_models(commands):
+            if isinstance(node, MenuNode):
+                table.kind.append(KIND_MENU)
+                table.menu_type.append(_MENU_TYPE_CODES[node.type])
+                table.menu_operation.append(_OPERATION_CODES[node.operation])
+                table.menu_count = _append_count(table.menu_count, node.count)
+                for sub in node.subcommands:
+                    table._append_sub(sub)
+            else:
+                table.kind.append(KIND_SUB)
+                table.menu_type.append(0)
+                table.menu_operation.append(0)
+                table.menu_count.append(NO_COUNT)
+                table._append_sub(node)
+            table.sub_offsets.append(len(table.sub_type))
+        return table
+
+    def _append_sub(self, sub: SubNode) -> None:
+        self.sub_type.append(_SUB_TYPE_CODES[sub.type])
+        self.sub_operation.append(_OPERATION_CODES[sub.operation])
+        self.sub_value.append(self.titles.intern(sub.value))
+        self.sub_count = _append_count(self.sub_count, sub.count)
+
+    def _sub_node(self, idx: int) -> SubNode:
+        count = self.sub_count[idx]
+        return SubNode(
+            SUB_TYPES[self.sub_type[idx]],
+            OPERATIONS[self.sub_operation[idx]],
+            self.titles.get(self.sub_value[idx]),
+            None if count == NO_COUNT else count,
+        )
+
+    def row(self, row: int) -> Node:
+        """
+        Rebuilds the node stored in a row.
+
+        Args:
+            row (int): Row index.
+
+        Returns:
+            Node: The MenuNode or (top-level) SubNode.
+        """
+        start, end = self.sub_offsets[row], self.sub_offsets[row + 1]
+        if self.kind[row] == KIND_SUB:
+            return self._sub_node(start)
+        count = self.menu_count[row]
+        return MenuNode(
+            MENU_TYPES[self.menu_type[row]],
+            OPERATIONS[self.menu_operation[row]],
+            None if count == NO_COUNT else count,
+            tuple(self._sub_node(idx) for idx in range(start, end)),
+        )
+
+    def to_nodes(self) -> List[Node]:
+        """
+        Rebuilds the whole parse result as nodes.
+
+        Returns:
+            List[Node]: The nodes, in row order.
+        """
+        return [self.row(row) for row in range(len(self))]
+
+    def to_commands(self) -> list:
+        """
+        Rebuilds the whole parse result as MenuCommand/SubCommand models.
+
+        Returns:
+            list: The models, in row order.
+        """
+        return to_models(self.to_nodes())
+
+    def filter(
+        self,
+        type: Optional[str] = None,
+        operation: Optional[str] = None,
+        min_count: Optional[int] = None,
+        max_count: Optional[int] = None,
+        title: Optional[str] = None,
+    ) -> List[int]:
+        """
+        Returns the rows of the menus matching every given condition.
+
+        Each condition narrows the candidate rows with one pass over its column.
+        Only menu rows (not top-level SubCommands) are considered.
+
+        Args:
+            type (Optional[str]): Menu type, "M" or "N".
+            operation (Optional[str]): Menu operation, "+" or "=".
+            min_count (Optional[int]): Minimum menu count; menus without a count never match.
+            max_count (Optional[int]): Maximum menu count; menus without a count never match.
+            title (Optional[str]): A title one of the menu's subcommands must have.
+
+        Returns:
+            List[int]: Matching row indices, in order.
+        """
+        rows = [row for row, kind in enumerate(self.kind) if kind == KIND_MENU]
+        if type is not None:
+            code = _MENU_TYPE_CODES[type]
+            column = self.menu_type
+            rows = [row for row in rows if column[row] == code]
+        if operation is not None:
+            code = _OPERATION_CODES[operation]
+            column = self.menu_operation
+            rows = [row for row in rows if column[row] == code]
+        if min_count is not None or max_count is not None:
+            low = 1 if min_count is None else min_count
+            high = max_count
+            column = self.menu_count
+            rows = [
+                row
+                for row in rows
+                if column[row] != NO_COUNT
+                and column[row] >= low
+                and (high is None or column[row] <= high)
+            ]
+        if title is not None:
+            matching = set(self.rows_with_title(title))
+            rows = [row for row in rows if row in matching]
+        return rows
+
+    def take(self, rows: Sequence[int]) -> "MenuTable":
+        """
+        Returns a new table holding only the given rows.
+
+        Args:
+            rows (Sequence[int]): Row indices, e.g. from filter.
+
+        Returns:
+            MenuTable: The selected rows, in the given order.
+        """
+        return MenuTable.from_commands(self.row(row) for row in rows)
+
+    def rows_with_title(self, title: str) -> List[int]:
+        """
+        Returns the rows holding a subcommand with the given title.
+
+        Args:
+            title (str): The title to look up.
+
+        Returns:
+            List[int]: Row indices, in order, without duplicates.
+        """
+        title_id = self.titles.lookup(title)
+        if title_id is None:
+            return []
+        rows: List[int] = []
+        offsets = self.sub_offsets
+        for idx, value in enumerate(self.sub_value):
+            if value == title_id:
+                row = bisect_right(offsets, idx) - 1
+                if not rows or rows[-1] != row:
+                    rows.append(row)
+        return rows
+
+    def count_by_type(self) -> Dict[str, int]:
+        """
+        Returns the number of menus of each type.
+
+        Returns:
+            Dict[str, int]: Menu count per menu type.
+        """
+        counts = Counter(
+            code for code, kind in zip(self.menu_type, self.kind) if kind == KIND_MENU
+        )
+        return {menu_type: counts[code] for code, menu_type in enumerate(MENU_TYPES)}
+
+    def subcommand_counts(self) -> Dict[str, int]:
+        """
+        Returns the number of subcommands of each type, top-level ones included.
+
+        Returns:
+            Dict[str, int]: Subcommand count per subcommand type.
+        """
+        counts = Counter(self.sub_type)
+        return {sub_type: counts[code] for code, sub_type in enumerate(SUB_TYPES)}
+
+    def total_count(self, type: Optional[str] = None) -> int:
+        """
+        Returns the sum of the menu counts, optionally for one menu type.
+
+        Args:
+            type (Optional[str]): Menu type to restrict the sum to.
+
+        Returns:
+            int: Sum of the counts of all menus that have one.
+        """
+        if type is None:
+            return sum(count for count in self.menu_count if count != NO_COUNT)
+        code = _MENU_TYPE_CODES[type]
+        return sum(
+            count
+            for count, menu_type, kind in zip(
+                self.menu_count, self.menu_type, self.kind
+            )
+            if kind == KIND_MENU and menu_type == code and count != NO_COUNT
+        )
+
+    def nbytes(self) -> int:
+        """
+        Returns the size of the table's column buffers, in bytes.
+
+        The title pool is not included. A count column that fell back to a list
+        is measured with the int objects it holds.
+
+        Returns:
+            int: Total size of the columns.
+        """
+        columns: List[Union[array, List[int]]] = [
+            self.kind,
+            self.menu_type,
+            self.menu_operation,
+            self.menu_count,
+            self.sub_offsets,
+            self.sub_type,
+            self.sub_operation,
+            self.sub_value,
+            self.sub_count,
+        ]
+        return sum(
+            column.itemsize * len(column)
+            if isinstance(column, array)
+            else sys.getsizeof(column) + sum(sys.getsizeof(v) for v in column)
+            for column in columns
+        )
+
@@ -0,0 +1,99 @@
+# axe_builder/models/validation.py
+
+from typing import Iterable, Optional, Sequence
+
+MENU_TYPES = frozenset({"M", "N"})
+SUB_TYPES = frozenset({"T", "."})
+OPERATIONS = frozenset({"+", "="})
+
+
+class CommandValidationError(ValueError):
+    """Raised when a MenuCommand or SubCommand breaks a field rule."""
+
+    pass
+
+
+def check_subcommand(
+    type_: str,
+    operation: Optional[str],
+    value: Optional[str],
+    count: Optional[int],
+) -> None:
+    """
+    Checks the fields of a SubCommand.
+
+    This is the only place SubCommand rules live; the model, the transformer and
+    the parser all go through it.
+
+    Args:
+        type_ (str): "T" for Title, "." for Custom.
+        operation (Optional[str]): "+" or "=", if any.
+        value (Optional[str]): The title, for "T" subcommands.
+        count (Optional[int]): The count, for "." subcommands.
+
+    Raises:
+        CommandValidationError: If a field is invalid.
+    """
+    if type_ not in SUB_TYPES:
+        raise CommandValidationError("Invalid SubCommand type. Must be 'T' or '.'")
+    if operation and operation not in OPERATIONS:
+        raise CommandValidationError(
+            "Invalid operation in SubCommand. Must be '+' or '='")
+    if type_ == "T" and not value:
+        raise CommandValidationError("Title SubCommand must have a value")
+    if count is not None and count <= 0:
+        raise CommandValidationError(
+            f"SubCommand count must be positive. Got: {count}")
+
+
+def check_menu_command(
+    type_: str,
+    operation: Optional[str],
+    count: Optional[int],
+    subcommands: Sequence,
+) -> None:
+    """
+    Checks the fields of a MenuCommand.
+
+    The subcommands themselves are not checked again; they were checked when
+    they were built.
+
+    Args:
+        type_ (str): "M" for Main Menu, "N" for Nested Menu.
+        operation (Optional[str]): "+" or "=", if any.
+        count (Optional[int]): The count, if any.
+        subcommands (Sequence): The menu's SubCommands.
+
+    Raises:
+        CommandValidationError: If a field is invalid.
+    """
+    if type_ not in MENU_TYPES:
+        raise CommandValidationError("Invalid MenuCommand type. Must be 'M' or 'N'")
+    if operation and operation not in OPERATIONS:
+        raise CommandValidationError("Invalid operation. Must be '+' or '='")
+    if count is not None and count <= 0:
+        raise CommandValidationError(
+            f"MenuCommand count must be positive. Got: {count}")
+    if operation == "+" and not subcommands and count is None:
+        raise CommandValidationError(
+            "SubCommands or a count must be provided when operation is '+'")
+
+
+def validate_commands(commands: Iterable) -> None:
+    """
+    Re-checks every node of a parse result, e.g. one built outside the parser.
+
+    Args:
+        commands (Iterable): MenuCommand and SubCommand objects.
+
+    Raises:
+        CommandValidationError: If any node is invalid.
+    """
+    for cmd in commands:
+        subcommands = getattr(cmd, "subcommands", None)
+        if subcommands is None:
+            check_subcommand(cmd.type, cmd.operation, cmd.value, cmd.count)
+            continue
+        for sub in subcommands:
+            check_subcommand(sub.type, sub.operation, sub.value, sub.count)
+        check_menu_command(cmd.type, cmd.operation, cmd.count, subcommands)
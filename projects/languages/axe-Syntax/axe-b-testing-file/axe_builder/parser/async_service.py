@@ -0,0 +1,238 @@
+# axe_builder/parser/async_service.py
+
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Deque, Iterable, List, Optional, Set
+
+from axe_builder.models.models import MenuCommand
+from axe_builder.models.nodes import to_models
+from axe_builder.parser.parser import (
+    AxeSyntaxParser,
+    ParseOutcome,
+    _init_worker,
+    _parse_in_worker,
+    get_parser,
+)
+from loguru import logger
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+class AsyncParseService:
+    """
+    An asyncio facade over AxeSyntaxParser with its own bounded executor.
+
+    Parses run on a dedicated thread or process pool, never on the event loop's
+    default executor. At most ``max_concurrency`` parses are submitted at once;
+    further calls wait on a semaphore, so a burst of requests queues inside the
+    service instead of piling up in the executor. Cancelling a call (directly or
+    through its timeout) drops it from the queue if it has not started yet. A
+    parse that is already running cannot be interrupted; its result is discarded.
+
+    Use as an async context manager, or call ``close()`` when done.
+    """
+
+    def __init__(
+        self,
+        parser: Optional[AxeSyntaxParser] = None,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initializes the AsyncParseService.
+
+        Args:
+            parser (Optional[AxeSyntaxParser]): Parser to use. Defaults to the shared parser.
+                In process mode, workers build their own parser for the same grammar
+                and mode, and this parser's result cache is consulted first.
+            executor (str): 'thread' or 'process'. Defaults to 'thread'.
+            max_workers (Optional[int]): Size of the pool. Defaults to the executor's default.
+            max_concurrency (Optional[int]): Maximum number of parses submitted at once.
+                Defaults to max_workers, or 8 if that is not set either.
+            timeout (Optional[float]): Default per-call timeout, in seconds. None waits forever.
+
+        Raises:
+            ValueError: If the executor kind or a limit is invalid.
+        """
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(
+                f"Invalid executor '{executor}'. Must be one of {EXECUTOR_KINDS}")
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+        max_concurrency = max_concurrency or max_workers or 8
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        self.parser = parser or get_parser()
+        self.executor_kind = executor
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._executor: Optional[Executor] = None
+        # Created on first use, inside the running loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending: Set["asyncio.Future[List[MenuCommand]]"] = set()
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncParseService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # Waiting for running parses blocks, so it must not happen on the loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(
+                        self.parser.grammar_file,
+                        self.parser.treeless,
+                        self.parser.limits,
+                    ),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="axe-parse"
+                )
+            logger.debug(
+                f"Started {self.executor_kind} pool for async parsing "
+                f"(max_concurrency={self.max_concurrency})."
+            )
+        return self._executor
+
+    async def parse(
+        self, syntax_str: str, timeout: Optional[float] = None
+    ) -> List[MenuCommand]:
+        """
+        Parses an axe:Syntax string on the service's executor.
+
+        Args:
+            syntax_str (str): The axe:Syntax string to parse.
+            timeout (Optional[float]): Timeout in seconds, covering both the wait for a
+                free slot and the parse itself. Defaults to the service's timeout.
+
+        Returns:
+            List[MenuCommand]: Parsed MenuCommand objects.
+
+        Raises:
+            ValueError: If the syntax is invalid.
+            RuntimeError: For unexpected parsing errors, or if the service is closed.
+            asyncio.TimeoutError: If the timeout expires.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        return await asyncio.wait_for(self._submit(syntax_str), timeout)
+
+    async def _submit(self, syntax_str: str) -> List[MenuCommand]:
+        if self._closed:
+            raise RuntimeError("AsyncParseService is closed.")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            if self.executor_kind == "thread":
+                call = (self.parser.parse, syntax_str)
+            else:
+                limits = self.parser.limits
+                if limits is not None:
+                    limits.check_input(syntax_str)
+                cached = self.parser.cached_nodes(syntax_str, limits)
+                if cached is not None:
+                    return to_models(cached)
+                call = (_parse_in_worker, syntax_str)
+
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._get_executor(), *call)
+            self._pending.add(future)
+            try:
+                # Cancelling this await also cancels the executor job if it is
+                # still queued.
+                result = await future
+            finally:
+                self._pending.discard(future)
+
+        if isinstance(result, ParseOutcome):
+            if result.error is not None:
+                raise result.error
+            self.parser.result_cache.put(
+                self.parser.grammar_version, syntax_str, result.commands)
+            return to_models(result.commands)
+        return result
+
+    async def _outcome(
+        self, syntax_str: str, timeout: Optional[float]
+    ) -> ParseOutcome:
+        try:
+            return ParseOutcome(await self.parse(syntax_str, timeout), None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return ParseOutcome(None, e)
+
+    async def parse_stream(
+        self, syntax_strs: Iterable[str], timeout: Optional[float] = None
+    ) -> AsyncIterator[ParseOutcome]:
+        """
+        Parses a batch of axe:Syntax strings, yielding outcomes as an async iterator.
+
+        Outcomes come in input order. Inputs are only read from ``syntax_strs`` as
+        slots free up, so at most ``max_concurrency`` parses are in flight and a
+        slow consumer holds back the producer. A failing input does not stop the
+        stream; its error is reported in its own ParseOutcome. Leaving the
+        ``async for`` early cancels the parses still in flight.
+
+        Args:
+            syntax_strs (Iterable[str]): The axe:Syntax strings to parse.
+            timeout (Optional[float]): Per-input timeout. Defaults to the service's timeout.
+
+        Yields:
+            ParseOutcome: One outcome per input, in input order.
+        """
+        inputs = iter(syntax_strs)
+        in_flight: Deque["asyncio.Task[ParseOutcome]"] = deque()
+        try:
+            while True:
+                while len(in_flight) < self.max_concurrency:
+                    syntax_str = next(inputs, None)
+                    if syntax_str is None:
+                        break
+                    in_flight.append(
+                        asyncio.ensure_future(self._outcome(syntax_str, timeout)))
+                if not in_flight:
+                    return
+                yield await in_flight.popleft()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    def cancel_pending(self) -> int:
+        """
+        Cancels every parse submitted to the executor that has not finished.
+
+        Returns:
+            int: Number of parses cancelled.
+        """
+        cancelled = 0
+        for future in list(self._pending):
+            if future.cancel():
+                cancelled += 1
+        logger.debug(f"Cancelled {cancelled} pending parse(s).")
+        return cancelled
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Cancels pending parses and shuts the executor down.
+
+        Args:
+            wait (bool): Whether to wait for running parses to finish.
+        """
+        self._closed = True
+        self.cancel_pending()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
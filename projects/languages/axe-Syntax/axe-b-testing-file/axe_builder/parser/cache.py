@@ -0,0 +1,215 @@
+# axe_builder/parser/cache.py
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from axe_builder.models.index import MenuIndex
+from axe_builder.models.nodes import Node, from_models
+from loguru import logger
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _Entry:
+    __slots__ = ("nodes", "size", "index")
+
+    def __init__(self, nodes: Tuple[Node, ...], size: int):
+        self.nodes = nodes
+        self.size = size  # estimated bytes, including the index once built
+        self.index: Optional[MenuIndex] = None
+
+
+def content_hash(text: str) -> str:
+    """
+    Returns the SHA-256 hex digest of a string.
+
+    Args:
+        text (str): The text to hash.
+
+    Returns:
+        str: Hex digest of the UTF-8 encoded text.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _node_size(node) -> int:
+    size = sys.getsizeof(node)
+    for value in node:
+        if isinstance(value, str):
+            size += sys.getsizeof(value)
+    return size
+
+
+def estimate_size(commands) -> int:
+    """
+    Estimates the memory held by a parse result, in bytes.
+
+    Args:
+        commands: Parsed MenuNode/SubNode objects.
+
+    Returns:
+        int: Approximate size of the result and the nodes it holds.
+    """
+    size = sys.getsizeof(commands)
+    for cmd in commands:
+        size += _node_size(cmd)
+        subcommands = getattr(cmd, "subcommands", ())
+        size += sys.getsizeof(subcommands)
+        for sub in subcommands:
+            size += _node_size(sub)
+    return size
+
+
+class ParseResultCache:
+    """
+    A thread-safe, bounded LRU cache of parse results.
+
+    Entries are keyed by the grammar version and a hash of the syntax string, and
+    evicted least-recently-used first once either the entry or the byte limit is
+    exceeded. Results are stored as immutable nodes, so cache hits can be shared
+    between callers without copying. The MenuIndex of a result is built on first
+    request and kept (and evicted) with it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initializes the ParseResultCache.
+
+        Args:
+            max_entries (int): Maximum number of cached results. 0 disables the cache.
+            max_bytes (int): Maximum estimated size of all cached results, in bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, grammar_version: str, syntax_str: str) -> Optional[List[Node]]:
+        """
+        Returns the cached result for a syntax string, if any.
+
+        Args:
+            grammar_version (str): Version hash of the grammar that produced the result.
+            syntax_str (str): The axe:Syntax string.
+
+        Returns:
+            Optional[List[Node]]: The cached nodes, or None on a miss.
+        """
+        key = (grammar_version, content_hash(syntax_str))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return list(entry.nodes)
+
+    def get_index(
+        self, grammar_version: str, syntax_str: str
+    ) -> Optional[MenuIndex]:
+        """
+        Returns the MenuIndex of a cached result, building it on first request.
+
+        Args:
+            grammar_version (str): Version hash of the grammar that produced the result.
+            syntax_str (str): The axe:Syntax string.
+
+        Returns:
+            Optional[MenuIndex]: The index, or None if the result is not cached.
+        """
+        key = (grammar_version, content_hash(syntax_str))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            if entry.index is None:
+                entry.index = MenuIndex.from_commands(entry.nodes)
+                index_size = entry.index.estimate_size()
+                entry.size += index_size
+                self.current_bytes += index_size
+                self._evict(keep=key)
+            return entry.index
+
+    def put(self, grammar_version: str, syntax_str: str, commands) -> None:
+        """
+        Stores a parse result, evicting old entries if needed.
+
+        Args:
+            grammar_version (str): Version hash of the grammar that produced the result.
+            syntax_str (str): The axe:Syntax string.
+            commands: The parsed nodes. MenuCommand/SubCommand models are converted.
+        """
+        if self.max_entries <= 0:
+            return
+        frozen = tuple(from_models(commands))
+        size = estimate_size(frozen)
+        if size > self.max_bytes:
+            logger.debug(f"Parse result of {size} bytes is too large to cache.")
+            return
+        key = (grammar_version, content_hash(syntax_str))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.size
+            self._entries[key] = _Entry(frozen, size)
+            self.current_bytes += size
+            self._evict()
+
+    def _evict(self, keep: Optional[Tuple[str, str]] = None) -> None:
+        # Called with the lock held. The most recent entry (``keep``) survives
+        # even if it alone exceeds the byte limit.
+        while (
+            len(self._entries) > self.max_entries
+            or self.current_bytes > self.max_bytes
+        ):
+            if keep is not None and next(iter(self._entries)) == keep:
+                break
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes all entries. Counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters.
+
+        Returns:
+            Dict[str, int]: Hits, misses, evictions, entries and estimated bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+            }
+
+
+# Shared by every parser; keys include the grammar version, so parsers for
+# different grammars never see each other's results.
+parse_result_cache = ParseResultCache()
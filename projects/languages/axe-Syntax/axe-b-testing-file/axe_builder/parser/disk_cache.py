@@ -0,0 +1,270 @@
+# axe_builder/parser/disk_cache.py
+
+import hashlib
+import marshal
+import os
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import List, Optional, Union
+
+from axe_builder.models.nodes import MenuNode, Node, SubNode, from_models
+from axe_builder.parser.cache import content_hash
+from loguru import logger
+
+CACHE_DIR_ENV = "AXE_BUILDER_CACHE_DIR"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Puts between two scans of the directory, which pick up other processes' writes
+RESCAN_INTERVAL = 256
+# Pruning frees this fraction of max_bytes below the limit, so the next prune is
+# many puts away
+_PRUNE_HEADROOM = 0.1
+# Temp files older than this were left behind by a writer that died; younger
+# ones may still be renamed into place
+_TMP_GRACE_SECONDS = 60 * 60
+_TMP_SUFFIX = ".tmp"
+
+# Entries are marshalled tuples rather than pickles: loading one never runs
+# code. marshal is not hardened against malicious data, though, so the cache
+# directory must only be writable by trusted users, and decoded entries are
+# rejected unless they hold nothing but the expected tuples of str, int and
+# None. The header pins the format and marshal version.
+_MAGIC = b"AXEPC1" + bytes([marshal.version])
+_SUFFIX = ".axec"
+
+
+def encode_commands(commands) -> bytes:
+    """
+    Encodes a parse result into the compact on-disk format.
+
+    Args:
+        commands: Parsed nodes, or MenuCommand/SubCommand models.
+
+    Returns:
+        bytes: Header followed by zlib-compressed, marshalled tuples.
+    """
+    rows = []
+    for node in from_models(commands):
+        if isinstance(node, MenuNode):
+            subs = tuple(tuple(sub) for sub in node.subcommands)
+            rows.append(("M", node.type, node.operation, node.count, subs))
+        else:
+            rows.append(("S",) + tuple(node))
+    return _MAGIC + zlib.compress(marshal.dumps(tuple(rows)))
+
+
+def decode_commands(data: bytes) -> List[Node]:
+    """
+    Decodes a parse result written by encode_commands.
+
+    Entries only ever hold validated parse results, so the nodes are rebuilt
+    without validating them again.
+
+    Args:
+        data (bytes): The encoded entry.
+
+    Returns:
+        List[Node]: The decoded MenuNode/SubNode objects.
+
+    Raises:
+        ValueError: If the data is not a valid entry for this format.
+    """
+    if not data.startswith(_MAGIC):
+        raise ValueError("Unrecognized parse cache entry.")
+    rows = marshal.loads(zlib.decompress(data[len(_MAGIC):]))
+    if type(rows) is not tuple:
+        raise ValueError("Malformed parse cache entry.")
+    commands: List[Node] = []
+    for row in rows:
+        if type(row) is tuple and len(row) == 5 and row[0] == "M":
+            _, type_, operation, count, subs = row
+            if type(subs) is not tuple or not _is_primitive_row(row[:4]):
+                raise ValueError("Malformed parse cache entry.")
+            commands.append(
+                MenuNode(type_, operation, count, tuple(_sub_node(sub) for sub in subs))
+            )
+        elif type(row) is tuple and len(row) == 5 and row[0] == "S":
+            commands.append(_sub_node(row[1:]))
+        else:
+            raise ValueError("Malformed parse cache entry.")
+    return commands
+
+
+def _is_primitive_row(row: tuple) -> bool:
+    return all(value is None or type(value) in (str, int) for value in row)
+
+
+def _sub_node(row) -> SubNode:
+    if type(row) is not tuple or len(row) != 4 or not _is_primitive_row(row):
+        raise ValueError("Malformed parse cache entry.")
+    return SubNode(*row)
+
+
+class DiskParseCache:
+    """
+    An on-disk cache of parse results shared across processes.
+
+    Each entry is a single file named after a hash of the grammar version and the
+    input, written atomically (temp file + rename) so concurrent readers never see
+    a partial entry. Reads refresh the entry's mtime, and the directory is pruned
+    least-recently-used first whenever it grows past its size limit.
+
+    Puts track the directory size with a running estimate and only scan the
+    directory when the estimate passes the limit, or every RESCAN_INTERVAL puts.
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Initializes the DiskParseCache.
+
+        Args:
+            directory (Union[str, Path]): Directory holding the cache entries. Created if missing.
+            max_bytes (int): Maximum total size of the entries, in bytes.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Size of the entries as of the last scan plus this cache's writes since;
+        # None until the first scan
+        self._size_estimate: Optional[int] = None
+        self._puts_since_scan = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["DiskParseCache"]:
+        """
+        Returns a cache in the directory named by AXE_BUILDER_CACHE_DIR, if set.
+
+        Returns:
+            Optional[DiskParseCache]: The configured cache, or None.
+        """
+        directory = os.environ.get(CACHE_DIR_ENV)
+        return cls(directory) if directory else None
+
+    def _entry_path(self, grammar_version: str, syntax_str: str) -> Path:
+        key = hashlib.sha256(
+            f"{grammar_version}:{content_hash(syntax_str)}".encode("ascii")
+        ).hexdigest()
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(
+        self, grammar_version: str, syntax_str: str
+    ) -> Optional[List[Node]]:
+        """
+        Returns the cached result for a syntax string, if any.
+
+        Args:
+            grammar_version (str): Version hash of the grammar that produced the result.
+            syntax_str (str): The axe:Syntax string.
+
+        Returns:
+            Optional[List[Node]]: The cached nodes, or None on a miss.
+        """
+        path = self._entry_path(grammar_version, syntax_str)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to read parse cache entry {path}: {e}")
+            return None
+        try:
+            commands = decode_commands(data)
+        except Exception as e:
+            logger.warning(f"Discarding corrupt parse cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # Pruned by another process in the meantime
+        return commands
+
+    def put(self, grammar_version: str, syntax_str: str, commands) -> None:
+        """
+        Stores a parse result, then prunes the cache if it may be over its size limit.
+
+        Args:
+            grammar_version (str): Version hash of the grammar that produced the result.
+            syntax_str (str): The axe:Syntax string.
+            commands: The parsed nodes, or MenuCommand/SubCommand models.
+        """
+        path = self._entry_path(grammar_version, syntax_str)
+        data = encode_commands(commands)
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=_TMP_SUFFIX)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write parse cache entry {path}: {e}")
+            return
+        self._puts_since_scan += 1
+        if self._size_estimate is not None:
+            # Overestimates when an entry is overwritten, which only prunes early
+            self._size_estimate += len(data)
+        if (
+            self._size_estimate is None
+            or self._size_estimate > self.max_bytes
+            or self._puts_since_scan >= RESCAN_INTERVAL
+        ):
+            self.prune()
+
+    def prune(self) -> None:
+        """
+        Scans the cache and, if it is over max_bytes, deletes least-recently-used
+        entries until it is a tenth of max_bytes below the limit.
+
+        Temp files abandoned by writers that died are deleted, whatever the size;
+        recent ones count toward the limit but are left to their writer.
+        """
+        entries = []
+        total = 0
+        stale_before = time.time() - _TMP_GRACE_SECONDS
+        for entry in os.scandir(self.directory):
+            is_tmp = entry.name.endswith(_TMP_SUFFIX)
+            if not is_tmp and not entry.name.endswith(_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if is_tmp:
+                if stat.st_mtime < stale_before:
+                    Path(entry.path).unlink(missing_ok=True)
+                else:
+                    total += stat.st_size
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+        self._puts_since_scan = 0
+        self._size_estimate = total
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * (1 - _PRUNE_HEADROOM))
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(entry_path)
+            except FileNotFoundError:
+                pass  # Already pruned by another process
+            total -= size
+        self._size_estimate = total
+        logger.debug(f"Pruned parse cache {self.directory} to {total} bytes.")
+
+    def clear(self) -> None:
+        """
+        Deletes every entry in the cache.
+        """
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                Path(entry.path).unlink(missing_ok=True)
+        self._size_estimate = None
@@ -0,0 +1,185 @@
+# axe_builder/parser/fast_parser.py
+
+import re
+from typing import List, Tuple, Union
+
+from axe_builder.logger import trace
+from axe_builder.models.nodes import MenuNode, Node, SubNode
+from axe_builder.parser.limits import ParseLimitError, current_budget
+from axe_builder.parser.parser import AxeSyntaxParser
+from axe_builder.parser.transformer import AxeSyntaxTransformer
+from loguru import logger
+
+# One alternative per terminal of axe_syntax.lark. WS, INT and ESCAPED_STRING
+# mirror the definitions in Lark's common.lark; anything else is unmatched.
+_TOKEN = re.compile(
+    r"""
+    (?P<ws>[ \t\f\r\n]+)
+    |(?P<num>\{[0-9]+\})
+    |(?P<str>"(?:[^"\\\n]|\\[^\n])*")
+    |(?P<punct>[\[\]():+=MNT.])
+    |(?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_NUM = "NUM"
+_STR = "STR"
+_OPERATORS = frozenset("+=")
+
+# (kind, value): kind is the punctuation character itself, _NUM or _STR
+_Token = Tuple[str, Union[str, int]]
+
+
+class _UnsupportedSyntaxError(Exception):
+    """Raised when the fast path cannot handle an input; Lark takes over."""
+
+
+def tokenize(syntax_str: str) -> List[_Token]:
+    """
+    Splits an axe:Syntax string into tokens, dropping whitespace.
+
+    Args:
+        syntax_str (str): The axe:Syntax string.
+
+    Returns:
+        List[Tuple[str, Union[str, int]]]: (kind, value) pairs. NUM_VAR values are
+            already converted to int and string values stripped of their quotes.
+
+    Raises:
+        ValueError: If the string contains a character no terminal accepts.
+    """
+    tokens: List[_Token] = []
+    for match in _TOKEN.finditer(syntax_str):
+        kind = match.lastgroup
+        text = match.group()
+        if kind == "punct":
+            tokens.append((text, text))
+        elif kind == "num":
+            tokens.append((_NUM, int(text[1:-1])))
+        elif kind == "str":
+            tokens.append((_STR, text.strip('"')))
+        elif kind == "other":
+            raise ValueError(
+                f"Unexpected character {text!r} at offset {match.start()}")
+    return tokens
+
+
+class FastAxeSyntaxParser(AxeSyntaxParser):
+    """
+    An AxeSyntaxParser with a hand-written recursive-descent fast path.
+
+    Valid input is tokenized with a single regular expression and parsed by
+    hand, calling the same AxeSyntaxTransformer callbacks as the Lark path, so
+    the resulting nodes are identical. Input the fast path rejects
+    for any reason is re-parsed by Lark, which produces the error (with its
+    line and column) exactly as AxeSyntaxParser would.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the FastAxeSyntaxParser.
+
+        Takes the same arguments as AxeSyntaxParser; the Lark parser is still
+        built, for error reporting.
+        """
+        super().__init__(*args, **kwargs)
+        self._transformer = AxeSyntaxTransformer(self.interner)
+        self.fallbacks = 0
+
+    def _parse(self, syntax_str: str) -> List[Node]:
+        """
+        Parses the given axe:Syntax string without consulting the result cache.
+
+        Args:
+            syntax_str (str): The axe:Syntax string to parse.
+
+        Returns:
+            List[Node]: Parsed MenuNode and SubNode objects.
+
+        Raises:
+            AxeSyntaxError: If the syntax is invalid.
+            RuntimeError: For transformation or validation errors.
+        """
+        try:
+            result = self._fast_parse(syntax_str)
+        except ParseLimitError:
+            raise
+        except Exception as e:
+            if trace.enabled:
+                logger.debug("Fast path declined input, falling back to Lark: {}", e)
+            self.fallbacks += 1
+            budget = current_budget()
+            if budget is not None:
+                # Lark re-parses from the start; commands are charged again
+                budget.commands = 0
+            return super()._parse(syntax_str)
+        if trace.enabled:
+            logger.debug("Fast-path parsing completed successfully.")
+        return result
+
+    def _fast_parse(self, syntax_str: str) -> List[Node]:
+        tokens = tokenize(syntax_str)
+        tokens.append(("", ""))  # end-of-input sentinel
+        commands: List[Node] = []
+        pos = 0
+        while True:
+            kind = tokens[pos][0]
+            if kind == "[":
+                command, pos = self._menu_command(tokens, pos + 1)
+            elif kind == "(":
+                command, pos = self._sub_command(tokens, pos + 1)
+            else:
+                raise _UnsupportedSyntaxError(f"Expected a command, got {kind!r}")
+            commands.append(self._transformer.command(command))
+
+            kind = tokens[pos][0]
+            if kind == "":
+                break
+            if kind != ":":
+                raise _UnsupportedSyntaxError(f"Expected ':', got {kind!r}")
+            pos += 1
+        return commands
+
+    def _menu_command(self, tokens: List[_Token], pos: int) -> Tuple[MenuNode, int]:
+        menu_type = tokens[pos][0]
+        if menu_type not in ("M", "N"):
+            raise _UnsupportedSyntaxError(f"Expected a menu type, got {menu_type!r}")
+        pos += 1
+        operations: list = []
+        while tokens[pos][0] != "]":
+            op = tokens[pos][0]
+            if op not in _OPERATORS:
+                raise _UnsupportedSyntaxError(f"Expected an operator, got {op!r}")
+            kind, value = tokens[pos + 1]
+            if kind == "(":
+                value, pos = self._sub_command(tokens, pos + 2)
+            elif kind == _NUM or kind == _STR:
+                pos += 2
+            else:
+                raise _UnsupportedSyntaxError(f"Expected a menu operand, got {kind!r}")
+            operations.append(op)
+            operations.append(value)
+        return self._transformer.menu_command(menu_type, *operations), pos + 1
+
+    def _sub_command(self, tokens: List[_Token], pos: int) -> Tuple[SubNode, int]:
+        sub_type = tokens[pos][0]
+        if sub_type not in ("T", "."):
+            raise _UnsupportedSyntaxError(
+                f"Expected a subcommand type, got {sub_type!r}"
+            )
+        pos += 1
+        operations: list = []
+        while tokens[pos][0] != ")":
+            op = tokens[pos][0]
+            if op not in _OPERATORS:
+                raise _UnsupportedSyntaxError(f"Expected an operator, got {op!r}")
+            kind, value = tokens[pos + 1]
+            if kind != _NUM and kind != _STR:
+                raise _UnsupportedSyntaxError(
+                    f"Expected a subcommand operand, got {kind!r}"
+                )
+            operations.append(op)
+            operations.append(value)
+            pos += 2
+        return self._transformer.sub_command(sub_type, *operations), pos + 1
@@ -0,0 +1,193 @@
+# axe_builder/parser/incremental.py
+
+import re
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+
+from axe_builder.logger import trace
+from axe_builder.models.index import MenuIndex
+from axe_builder.models.models import MenuCommand
+from axe_builder.models.nodes import Node, to_models
+from axe_builder.parser.parser import AxeSyntaxError, AxeSyntaxParser, get_parser
+from loguru import logger
+
+# A quoted string (which may itself contain ':') or a top-level command separator
+_SEPARATOR_OR_STRING = re.compile(r'"(?:\\.|[^"\\])*"|:')
+
+
+def split_segments(syntax_str: str) -> List[Tuple[int, str]]:
+    """
+    Splits an axe:Syntax command line into its top-level command segments.
+
+    Only ':' outside quoted strings separates commands, matching the
+    ``command_line`` rule of the grammar.
+
+    Args:
+        syntax_str (str): The axe:Syntax string.
+
+    Returns:
+        List[Tuple[int, str]]: (offset, text) of every segment, in order.
+    """
+    segments = []
+    start = 0
+    for match in _SEPARATOR_OR_STRING.finditer(syntax_str):
+        if match.group() == ":":
+            segments.append((start, syntax_str[start:match.start()]))
+            start = match.end()
+    segments.append((start, syntax_str[start:]))
+    return segments
+
+
+class IncrementalParser:
+    """
+    Re-parses only the command segments that changed since the previous parse.
+
+    Top-level commands are independent of each other, so each ':'-separated
+    segment is parsed on its own and its result kept. After an edit, unchanged
+    segments are reused and only new or modified ones go through Lark.
+    """
+
+    def __init__(self, parser: Optional[AxeSyntaxParser] = None):
+        """
+        Initializes the IncrementalParser.
+
+        Args:
+            parser (Optional[AxeSyntaxParser]): Parser for changed segments. Defaults to
+                the shared treeless parser.
+        """
+        self._parser = parser
+        self._segments: Dict[str, List[Node]] = {}
+        # The latest input and its result, for parse_index
+        self._latest: Optional[Tuple[str, List[Node]]] = None
+        self.reparsed = 0
+
+    @property
+    def parser(self) -> AxeSyntaxParser:
+        if self._parser is None:
+            self._parser = get_parser(treeless=True)
+        return self._parser
+
+    def parse(self, syntax_str: str) -> List[MenuCommand]:
+        """
+        Parses an axe:Syntax string, reusing results for unchanged segments.
+
+        Args:
+            syntax_str (str): The full, edited axe:Syntax string.
+
+        Returns:
+            List[MenuCommand]: Parsed MenuCommand objects for the whole string.
+
+        Raises:
+            AxeSyntaxError: If a segment is invalid; line and column refer to the full string.
+            ParseLimitError: If the input exceeds the parser's limits.
+            RuntimeError: For unexpected parsing or transformation errors.
+        """
+        return to_models(self.parse_nodes(syntax_str))
+
+    def parse_nodes(self, syntax_str: str) -> List[Node]:
+        """
+        Like parse, but returns the internal MenuNode/SubNode representation.
+
+        Unchanged segments cost nothing at all here, as their nodes are reused
+        as they are.
+
+        Args:
+            syntax_str (str): The full, edited axe:Syntax string.
+
+        Returns:
+            List[Node]: Parsed nodes for the whole string.
+
+        Raises:
+            AxeSyntaxError: If a segment is invalid; line and column refer to the full string.
+            ParseLimitError: If the input exceeds the parser's limits.
+            RuntimeError: For unexpected parsing or transformation errors.
+        """
+        previous = self._segments
+        current: Dict[str, List[Node]] = {}
+        result: List[Node] = []
+        self.reparsed = 0
+        limits = self.parser.limits
+        if limits is not None:
+            limits.check_input(syntax_str)
+
+        # One budget (and deadline) covers every re-parsed segment
+        with limits.guard() if limits is not None else nullcontext():
+            for offset, segment in split_segments(syntax_str):
+                commands = current.get(segment)
+                if commands is None:
+                    commands = previous.get(segment)
+                if commands is None:
+                    commands = self._parse_segment(syntax_str, offset, segment)
+                    self.reparsed += 1
+                current[segment] = commands
+                result.extend(commands)
+        if limits is not None:
+            # Reused segments were not charged during this parse
+            limits.check_result(result)
+
+        # Only segments of the latest input are kept, so the cache never outgrows it
+        self._segments = current
+        self._latest = (syntax_str, result)
+        if trace.enabled:
+            logger.debug("Incremental parse re-parsed {} segment(s).", self.reparsed)
+        return result
+
+    def parse_index(self, syntax_str: str) -> MenuIndex:
+        """
+        Parses an axe:Syntax string and returns the MenuIndex of the result.
+
+        The index is kept with the result in the parser's result cache, like
+        AxeSyntaxParser.parse_index, so it is built once per distinct input. The
+        latest input is not re-parsed.
+
+        Args:
+            syntax_str (str): The full, edited axe:Syntax string.
+
+        Returns:
+            MenuIndex: The menu hierarchy of the parsed commands.
+
+        Raises:
+            AxeSyntaxError: If a segment is invalid; line and column refer to the full string.
+            ParseLimitError: If the input exceeds the parser's limits.
+            RuntimeError: For unexpected parsing or transformation errors.
+        """
+        if self._latest is not None and self._latest[0] == syntax_str:
+            nodes = self._latest[1]
+        else:
+            nodes = self.parse_nodes(syntax_str)
+        cache, version = self.parser.result_cache, self.parser.grammar_version
+        index = cache.get_index(version, syntax_str)
+        if index is None:
+            cache.put(version, syntax_str, nodes)
+            index = cache.get_index(version, syntax_str)
+        if index is None:
+            # Result not cached (cache disabled, or result too large)
+            index = MenuIndex.from_commands(nodes)
+        return index
+
+    def _parse_segment(
+        self, syntax_str: str, offset: int, segment: str
+    ) -> List[Node]:
+        try:
+            return self.parser._parse(segment)
+        except AxeSyntaxError as e:
+            # Translate the position from the segment to the full input
+            line, column = e.line, e.column
+            if line is not None and column is not None:
+                prefix = syntax_str[:offset]
+                line_start = prefix.rfind("\n") + 1
+                if line == 1:
+                    column += offset - line_start
+                line += prefix.count("\n")
+            raise AxeSyntaxError(
+                f"Invalid axe:Syntax input at line {line}, column {column}",
+                line=line,
+                column=column,
+            ) from e
+
+    def reset(self) -> None:
+        """
+        Forgets all previously parsed segments.
+        """
+        self._segments = {}
+        self._latest = None
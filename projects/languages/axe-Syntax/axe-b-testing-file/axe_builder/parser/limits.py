@@ -0,0 +1,234 @@
+# axe_builder/parser/limits.py
+# Resource limits for parsing untrusted axe:Syntax input.
+#
+# ParseLimits.check_input runs before parsing. During a parse, ParseLimits.guard
+# activates a budget that the transformer callbacks charge through
+# current_budget(), so limits are enforced as commands are built. While a
+# budget is active, AxeSyntaxParser always parses with the transformer inline
+# with the LALR parser (tree-mode parsers switch to a treeless one), so an
+# input over a limit or the deadline is stopped mid-parse, never after a whole
+# parse tree has been built. Cached results are re-checked with
+# ParseLimits.check_result, since the cache may be shared with parsers using
+# looser limits.
+#
+# Hot-path call sites charge the budget as
+#
+#     if limits.active:
+#         budget = limits.current_budget()
+#         if budget is not None:
+#             budget.command()
+#
+# so parsers without limits pay for one module attribute lookup.
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, Optional, Union
+
+from loguru import logger
+
+
+class ParseLimitError(ValueError):
+    """
+    Raised when an input exceeds a parse limit.
+
+    Attributes:
+        limit (str): Name of the exceeded limit (e.g. 'max_bytes').
+        value (Union[int, float, str]): The offending value.
+        maximum (float): The configured limit.
+        line (Optional[int]): 1-based line of a file input, when known.
+    """
+
+    def __init__(
+        self,
+        limit: str,
+        value: Union[int, float, str],
+        maximum: float,
+        line: Optional[int] = None,
+    ):
+        location = f" at line {line}" if line is not None else ""
+        super().__init__(f"Input exceeds {limit}{location}: {value} > {maximum}")
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+        self.line = line
+
+    def __reduce__(self):
+        # Keeps the error picklable, for batches parsed in worker processes
+        return (type(self), (self.limit, self.value, self.maximum, self.line))
+
+
+class ParseLimits:
+    """
+    Upper bounds for a single parse. Every limit is optional; None means unbounded.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_commands: Optional[int] = None,
+        max_count: Optional[int] = None,
+        max_subcommands: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initializes the ParseLimits.
+
+        Args:
+            max_bytes (Optional[int]): Maximum size of the input, in UTF-8 bytes.
+            max_commands (Optional[int]): Maximum number of top-level commands.
+            max_count (Optional[int]): Maximum value of any {count}.
+            max_subcommands (Optional[int]): Maximum number of subcommands in one menu.
+            timeout (Optional[float]): Wall-clock deadline for one parse, in seconds.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        for name, value in (
+            ("max_bytes", max_bytes),
+            ("max_commands", max_commands),
+            ("max_count", max_count),
+            ("max_subcommands", max_subcommands),
+            ("timeout", timeout),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive")
+        self.max_bytes = max_bytes
+        self.max_commands = max_commands
+        self.max_count = max_count
+        self.max_subcommands = max_subcommands
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        return (
+            f"ParseLimits(max_bytes={self.max_bytes}, "
+            f"max_commands={self.max_commands}, max_count={self.max_count}, "
+            f"max_subcommands={self.max_subcommands}, timeout={self.timeout})"
+        )
+
+    def check_input(self, syntax_str: str) -> None:
+        """
+        Checks the input size, before anything is parsed.
+
+        Args:
+            syntax_str (str): The axe:Syntax string.
+
+        Raises:
+            ParseLimitError: If the input is too large.
+        """
+        if self.max_bytes is None:
+            return
+        size = len(syntax_str)
+        # A character takes 1 to 4 bytes; only encode when the length is ambiguous
+        if size <= self.max_bytes < 4 * size:
+            size = len(syntax_str.encode("utf-8"))
+        if size > self.max_bytes:
+            self._fail("max_bytes", size, self.max_bytes)
+
+    def check_result(self, commands: Iterable) -> None:
+        """
+        Checks an already parsed result (e.g. a cache hit) against the limits.
+
+        Args:
+            commands (Iterable): Parsed MenuNode/SubNode objects.
+
+        Raises:
+            ParseLimitError: If the result exceeds a limit.
+        """
+        budget = _Budget(self, deadline=None)
+        for cmd in commands:
+            budget.command()
+            subcommands = getattr(cmd, "subcommands", None)
+            if subcommands is not None:
+                budget.menu(len(subcommands))
+                for sub in subcommands:
+                    budget.count(sub.count)
+            budget.count(cmd.count)
+
+    @contextmanager
+    def guard(self) -> Iterator["_Budget"]:
+        """
+        Activates a fresh budget for the parse run inside the with-block.
+
+        Yields:
+            _Budget: The active budget.
+        """
+        global active
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        budget = _Budget(self, deadline)
+        token = _active_budget.set(budget)
+        with _active_lock:
+            active += 1
+        try:
+            yield budget
+        finally:
+            with _active_lock:
+                active -= 1
+            _active_budget.reset(token)
+
+    @staticmethod
+    def _fail(limit: str, value: Union[int, float, str], maximum: float) -> None:
+        logger.warning(f"Rejected input: {limit} exceeded ({value} > {maximum}).")
+        raise ParseLimitError(limit, value, maximum)
+
+
+class _Budget:
+    """
+    Per-parse counters, charged by the transformer as it builds commands.
+    """
+
+    __slots__ = ("limits", "deadline", "commands")
+
+    def __init__(self, limits: ParseLimits, deadline: Optional[float]):
+        self.limits = limits
+        self.deadline = deadline
+        self.commands = 0
+
+    def check_deadline(self) -> None:
+        if self.deadline is not None:
+            now = time.monotonic()
+            if now > self.deadline:
+                timeout = self.limits.timeout
+                self.limits._fail(
+                    "timeout", round(timeout + now - self.deadline, 3), timeout)
+
+    def command(self) -> None:
+        self.commands += 1
+        maximum = self.limits.max_commands
+        if maximum is not None and self.commands > maximum:
+            self.limits._fail("max_commands", self.commands, maximum)
+        self.check_deadline()
+
+    def menu(self, subcommands: int) -> None:
+        maximum = self.limits.max_subcommands
+        if maximum is not None and subcommands > maximum:
+            self.limits._fail("max_subcommands", subcommands, maximum)
+        self.check_deadline()
+
+    def count(self, count: Optional[int]) -> None:
+        maximum = self.limits.max_count
+        if maximum is not None and count is not None and count > maximum:
+            self.limits._fail("max_count", count, maximum)
+
+    def count_digits(self, digits: str) -> None:
+        # Rejects huge counts before paying for the int conversion
+        maximum = self.limits.max_count
+        if maximum is not None:
+            digits = digits.lstrip("0")
+            if len(digits) > len(str(maximum)):
+                self.limits._fail(
+                    "max_count", f"{len(digits)}-digit number", maximum)
+
+
+# Number of guards active in the process, in any thread; read by the hot path
+active = 0
+_active_lock = threading.Lock()
+
+_active_budget: "ContextVar[Optional[_Budget]]" = ContextVar(
+    "axe_parse_budget", default=None
+)
+
+# The budget of the parse running in this thread or task, or None when no
+# limits are active. Bound method, so the hot path pays for a single call.
+current_budget = _active_budget.get
@@ -1,14 +1,98 @@
 # axe_builder/parser/parser.py
 
 import asyncio
-from functools import lru_cache
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from axe_builder.logger import trace
+from axe_builder.models.index import MenuIndex
 from axe_builder.models.models import MenuCommand
-from axe_builder.parser.transformer import AxeSyntaxTransformer
+from axe_builder.models.nodes import Node, NodeInterner, to_models
+from axe_builder.models.validation import CommandValidationError
+from axe_builder.parser.cache import (
+    ParseResultCache,
+    content_hash,
+    parse_result_cache,
+)
+from axe_builder.parser.disk_cache import DiskParseCache
+from axe_builder.parser.limits import ParseLimitError, ParseLimits, current_budget
+from axe_builder.parser.transformer import (
+    AxeSyntaxTransformer,
+    TransformationError,
+)
 from lark import Lark, UnexpectedInput, exceptions
 from loguru import logger
+from pydantic import ValidationError
+
+
+def grammar_cache_path(grammar_path: Path, treeless: bool = False) -> Path:
+    """
+    Returns the path of the serialized parser-table cache for a grammar file.
+
+    Args:
+        grammar_path (Path): Path to the Lark grammar file.
+        treeless (bool): Whether the cache is for the treeless parser.
+
+    Returns:
+        Path: The cache file, stored next to the grammar (e.g. 'axe_syntax.lark.cache',
+            or 'axe_syntax.lark.treeless.cache' for the treeless parser).
+    """
+    suffix = ".treeless.cache" if treeless else ".cache"
+    return grammar_path.with_name(grammar_path.name + suffix)
+
+
+def grammar_version(grammar_file: Optional[str] = None) -> str:
+    """
+    Returns the version hash of a grammar file without building a parser.
+
+    Args:
+        grammar_file (Optional[str]): Path to the Lark grammar file. Defaults to 'axe_syntax.lark'.
+
+    Returns:
+        str: The same hash as AxeSyntaxParser.grammar_version for that grammar.
+    """
+    grammar_path = Path(__file__).parent / (grammar_file or "axe_syntax.lark")
+    return content_hash(grammar_path.read_text(encoding="utf-8"))
+
+
+class AxeSyntaxError(ValueError):
+    """
+    Raised for invalid axe:Syntax input, with the position of the error.
+
+    Attributes:
+        line (Optional[int]): 1-based line of the error.
+        column (Optional[int]): 1-based column of the error.
+    """
+
+    def __init__(
+        self, message: str, line: Optional[int] = None, column: Optional[int] = None
+    ):
+        super().__init__(message)
+        self.line = line
+        self.column = column
+
+
+class ParseOutcome(NamedTuple):
+    """
+    The result of parsing one input of a batch.
+
+    Exactly one of ``commands`` and ``error`` is set.
+    """
+
+    commands: Optional[List[MenuCommand]]
+    error: Optional[Exception]
 
 
 class AxeSyntaxParser:
@@ -16,14 +100,54 @@ class AxeSyntaxParser:
     A class to parse axe:Syntax strings into structured MenuCommand objects.
     """
 
-    def __init__(self, grammar_file: Optional[str] = None):
+    def __init__(
+        self,
+        grammar_file: Optional[str] = None,
+        treeless: bool = False,
+        use_grammar_cache: bool = True,
+        result_cache: Optional[ParseResultCache] = None,
+        disk_cache: Optional[DiskParseCache] = None,
+        intern_nodes: bool = False,
+        limits: Optional[ParseLimits] = None,
+    ):
         """
         Initializes the AxeSyntaxParser with the specified grammar.
 
         Args:
             grammar_file (Optional[str]): Path to the Lark grammar file. Defaults to 'axe_syntax.lark'.
+            treeless (bool): If True, the transformer runs inline with the LALR parser and
+                MenuCommand/SubCommand objects are built during the parse, without an
+                intermediate parse tree. Defaults to False.
+            use_grammar_cache (bool): If True, the compiled LALR tables are loaded from
+                (or saved to) a cache file next to the grammar. Defaults to True.
+            result_cache (Optional[ParseResultCache]): Cache for parse results. Defaults to
+                the process-wide cache shared by all parsers.
+            disk_cache (Optional[DiskParseCache]): Persistent cache shared across processes.
+                Defaults to the directory named by AXE_BUILDER_CACHE_DIR, if set.
+            intern_nodes (bool): If True, structurally identical subcommands and menus
+                share one node instance and titles are interned, across all parses of
+                this parser. Saves memory on repetitive input. Defaults to False.
+            limits (Optional[ParseLimits]): Resource limits enforced on every parse, for
+                untrusted input. Inputs that exceed them raise ParseLimitError. Limited
+                parses always run the transformer inline, so they stop mid-parse.
+                Defaults to None (unbounded).
         """
         self.grammar_file = grammar_file or "axe_syntax.lark"
+        self.treeless = treeless
+        self.use_grammar_cache = use_grammar_cache
+        self.result_cache = (
+            result_cache if result_cache is not None else parse_result_cache
+        )
+        self.disk_cache = (
+            disk_cache if disk_cache is not None else DiskParseCache.from_env()
+        )
+        self.interner = NodeInterner() if intern_nodes else None
+        self.limits = limits
+        self.grammar_version = ""
+        self._grammar: Tuple[Path, str] = (Path(), "")
+        # Treeless parser for parses under limits, built on first use
+        self._limited_parser: Optional[Lark] = None
+        self._limited_parser_lock = threading.Lock()
         self.parser = self._initialize_parser()
 
     def _initialize_parser(self) -> Lark:
@@ -41,22 +165,66 @@ def _initialize_parser(self) -> Lark:
 
         with grammar_path.open(encoding="utf-8") as f:
             axe_syntax_grammar = f.read()
+        self.grammar_version = content_hash(axe_syntax_grammar)
+        self._grammar = (grammar_path, axe_syntax_grammar)
+        self._limited_parser = None
+
+        parser = self._build_lark(self.treeless)
+        logger.debug(
+            f"Lark parser initialized successfully (treeless={self.treeless}).")
+        return parser
 
-        parser = Lark(
+    def _build_lark(self, treeless: bool) -> Lark:
+        grammar_path, axe_syntax_grammar = self._grammar
+        # Lark keys the cache on a hash of the grammar, the parser options and
+        # its own version, and rebuilds the tables when the stored hash is stale.
+        # The two modes differ in propagate_positions, so each gets its own file;
+        # a shared one would be rewritten whenever the other mode is built.
+        cache = (
+            str(grammar_cache_path(grammar_path, treeless))
+            if self.use_grammar_cache
+            else False
+        )
+        return Lark(
             axe_syntax_grammar,
             start="start",
             parser="lalr",
-            propagate_positions=True,
+            propagate_positions=not treeless,
             maybe_placeholders=False,
+            transformer=AxeSyntaxTransformer(self.interner) if treeless else None,
+            cache=cache,
         )
-        logger.debug("Lark parser initialized successfully.")
+
+    def _inline_parser(self) -> Lark:
+        """
+        Returns a Lark parser that runs the transformer inline with the LALR parser.
+
+        Parses under limits use it even in tree mode: the transformer charges the
+        budget and checks the deadline as the input is consumed, instead of after
+        a whole parse tree has been built. Tree-mode parsers build it on first use.
+
+        Returns:
+            Lark: The treeless Lark parser.
+        """
+        if self.treeless:
+            return self.parser
+        parser = self._limited_parser
+        if parser is None:
+            with self._limited_parser_lock:
+                if self._limited_parser is None:
+                    logger.debug("Building inline parser for limited parses.")
+                    self._limited_parser = self._build_lark(treeless=True)
+                parser = self._limited_parser
         return parser
 
-    @lru_cache(maxsize=128)
     def parse(self, syntax_str: str) -> List[MenuCommand]:
         """
         Parses the given axe:Syntax string and returns a list of MenuCommand objects.
 
+        Results are served from the parser's in-memory result cache, then from its
+        disk cache (if any), when possible. Every call returns freshly built models,
+        so callers may modify the result freely.
+
         Args:
             syntax_str (str): The axe:Syntax string to parse.
 
@@ -65,94 +233,296 @@ def parse(self, syntax_str: str) -> List[MenuCommand]:
 
         Raises:
             ValueError: If the syntax is invalid.
+            ParseLimitError: If the input exceeds the parser's limits.
+            RuntimeError: For unexpected parsing or transformation errors.
+        """
+        return to_models(self.parse_nodes(syntax_str))
+
+    def parse_nodes(self, syntax_str: str) -> List[Node]:
+        """
+        Parses the given axe:Syntax string into the internal node representation.
+
+        Like parse, but returns immutable MenuNode/SubNode tuples instead of
+        pydantic models, which makes it the cheaper choice for internal callers
+        (e.g. the exporter) that do not need the models.
+
+        Args:
+            syntax_str (str): The axe:Syntax string to parse.
+
+        Returns:
+            List[Node]: Parsed MenuNode and SubNode objects.
+
+        Raises:
+            ValueError: If the syntax is invalid.
+            ParseLimitError: If the input exceeds the parser's limits.
             RuntimeError: For unexpected parsing or transformation errors.
         """
-        logger.info("Starting parsing of axe:Syntax.")
+        return self._parse_nodes(syntax_str, self.limits)
+
+    def _parse_nodes(
+        self, syntax_str: str, limits: Optional[ParseLimits]
+    ) -> List[Node]:
+        if limits is not None:
+            limits.check_input(syntax_str)
+        cached = self.cached_nodes(syntax_str, limits)
+        if cached is not None:
+            if trace.enabled:
+                logger.debug("Parse result served from cache.")
+            return cached
+        if self.disk_cache is not None:
+            cached = self.disk_cache.get(self.grammar_version, syntax_str)
+            if cached is not None:
+                if limits is not None:
+                    limits.check_result(cached)
+                if trace.enabled:
+                    logger.debug("Parse result served from disk cache.")
+                self.result_cache.put(self.grammar_version, syntax_str, cached)
+                return cached
+        result = self._guarded_parse(syntax_str, limits)
+        self.result_cache.put(self.grammar_version, syntax_str, result)
+        if self.disk_cache is not None:
+            self.disk_cache.put(self.grammar_version, syntax_str, result)
+        return result
+
+    def cached_nodes(
+        self, syntax_str: str, limits: Optional[ParseLimits] = None
+    ) -> Optional[List[Node]]:
+        """
+        Returns the in-memory cached result for a string, if any, without parsing.
+
+        The cache is shared with other parsers, so a hit is checked against the
+        limits before it is returned.
+
+        Args:
+            syntax_str (str): The axe:Syntax string.
+            limits (Optional[ParseLimits]): Limits to check a hit against.
+
+        Returns:
+            Optional[List[Node]]: The cached nodes, or None on a miss.
+
+        Raises:
+            ParseLimitError: If the cached result exceeds the limits.
+        """
+        cached = self.result_cache.get(self.grammar_version, syntax_str)
+        if cached is not None and limits is not None:
+            limits.check_result(cached)
+        return cached
+
+    def _guarded_parse(
+        self, syntax_str: str, limits: Optional[ParseLimits]
+    ) -> List[Node]:
+        # _parse, with the limits' budget active for the whole parse
+        if limits is None:
+            return self._parse(syntax_str)
+        with limits.guard():
+            return self._parse(syntax_str)
+
+    def parse_index(self, syntax_str: str) -> MenuIndex:
+        """
+        Parses the given axe:Syntax string and returns the MenuIndex of the result.
+
+        The index is cached with the parse result, so repeated calls for the same
+        string (and parse_nodes calls in between) share one index.
+
+        Args:
+            syntax_str (str): The axe:Syntax string to parse.
+
+        Returns:
+            MenuIndex: The menu hierarchy of the parsed commands.
+
+        Raises:
+            ValueError: If the syntax is invalid.
+            RuntimeError: For unexpected parsing or transformation errors.
+        """
+        nodes = self.parse_nodes(syntax_str)
+        index = self.result_cache.get_index(self.grammar_version, syntax_str)
+        if index is None:
+            # Result not cached (cache disabled, or result too large)
+            index = MenuIndex.from_commands(nodes)
+        return index
+
+    def iter_parse_file(
+        self, file_path: Union[str, Path], encoding: str = "utf-8"
+    ) -> Iterator[List[MenuCommand]]:
+        """
+        Parses a file holding one axe:Syntax command line per line, incrementally.
+
+        The file is read line by line and each parsed line is yielded before the
+        next one is read, so memory use does not grow with the file size. Blank
+        lines are skipped. Results bypass the parse caches, which would otherwise
+        fill up with every line of the file.
+
+        Args:
+            file_path (Union[str, Path]): Path to the axe:Syntax file.
+            encoding (str): Text encoding of the file. Defaults to 'utf-8'.
+
+        Yields:
+            List[MenuCommand]: Parsed MenuCommand objects for one line.
+
+        Raises:
+            AxeSyntaxError: If a line is invalid; line and column refer to the file.
+            ParseLimitError: If a line exceeds the limits; its line number is set.
+            RuntimeError: For transformation errors, with the offending line number.
+        """
+        logger.info(f"Streaming axe:Syntax from {file_path}")
+        with open(file_path, encoding=encoding) as f:
+            for lineno, line in enumerate(f, start=1):
+                line = line.rstrip("\r\n")
+                if not line.strip():
+                    continue
+                try:
+                    if self.limits is not None:
+                        self.limits.check_input(line)
+                    yield to_models(self._guarded_parse(line, self.limits))
+                except ParseLimitError as e:
+                    raise ParseLimitError(
+                        e.limit, e.value, e.maximum, line=lineno) from e
+                except AxeSyntaxError as e:
+                    raise AxeSyntaxError(
+                        f"Invalid axe:Syntax input at line {lineno}, column {e.column}",
+                        line=lineno,
+                        column=e.column,
+                    ) from e
+                except RuntimeError as e:
+                    raise RuntimeError(f"Line {lineno}: {e}") from e
+
+    def _parse(self, syntax_str: str) -> List[Node]:
+        """
+        Parses the given axe:Syntax string without consulting the result cache.
+
+        Args:
+            syntax_str (str): The axe:Syntax string to parse.
+
+        Returns:
+            List[Node]: Parsed MenuNode and SubNode objects.
+        """
+        if trace.enabled:
+            logger.info("Starting parsing of axe:Syntax.")
         try:
-            parse_tree = self.parser.parse(syntax_str)
-            transformer = AxeSyntaxTransformer()
-            result = transformer.transform(parse_tree)
+            if self.treeless or current_budget() is not None:
+                # A limited parse must be stoppable mid-way; see _inline_parser
+                result = self._inline_parser().parse(syntax_str)
+            else:
+                parse_tree = self.parser.parse(syntax_str)
+                transformer = AxeSyntaxTransformer(self.interner)
+                result = transformer.transform(parse_tree)
             if not isinstance(result, list):
                 result = [result]
-            self._validate_commands(result)
-            logger.info("Parsing completed successfully.")
+            # No separate validation pass: the transformer validated every node
+            # as it was built.
+            if trace.enabled:
+                logger.info("Parsing completed successfully.")
             return result
         except UnexpectedInput as e:
             logger.error(
                 f"Syntax Error at line {e.line}, column {e.column}: {e}")
-            raise ValueError(
-                f"Invalid axe:Syntax input at line {e.line}, column {e.column}: {e}"
+            raise AxeSyntaxError(
+                f"Invalid axe:Syntax input at line {e.line}, column {e.column}: {e}",
+                line=e.line,
+                column=e.column,
             ) from e
+        except ParseLimitError:
+            # Raised directly by inline transformers and the fast path
+            raise
         except exceptions.VisitError as e:
-            logger.error(f"Transformation Error: {e.orig}")
-            raise RuntimeError(f"Error during transformation: {e.orig}") from e
+            if isinstance(e.orig_exc, ParseLimitError):
+                raise e.orig_exc from None
+            logger.error(f"Transformation Error: {e.orig_exc}")
+            raise RuntimeError(
+                f"Error during transformation: {e.orig_exc}") from e
+        except (TransformationError, CommandValidationError, ValidationError) as e:
+            # Raised directly, without a VisitError wrapper, by inline transformers
+            logger.error(f"Transformation Error: {e}")
+            raise RuntimeError(f"Error during transformation: {e}") from e
         except Exception as e:
             logger.exception("Unexpected parsing error.")
             raise RuntimeError(
                 f"An unexpected error occurred during parsing: {e}"
             ) from e
 
-    def _validate_commands(self, commands: List[MenuCommand]) -> None:
+    def parse_many(
+        self,
+        syntax_strs: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: int = 64,
+    ) -> List[ParseOutcome]:
         """
-        Validates the list of MenuCommand objects to ensure data integrity.
+        Parses many axe:Syntax strings, spreading the work over a process pool.
+
+        Each worker builds (or loads from the grammar cache) its parser once, in the
+        pool initializer. Inputs already in this parser's result cache are answered
+        without leaving the process. A failing input does not stop the batch; its
+        error is reported in its own ParseOutcome.
 
         Args:
-            commands (List[MenuCommand]): List of MenuCommand objects to validate.
+            syntax_strs (Iterable[str]): The axe:Syntax strings to parse.
+            workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+                With 1 worker the batch is parsed in the calling process.
+            chunksize (int): Number of inputs sent to a worker at a time.
 
-        Raises:
-            ValueError: If any command fails validation.
-        """
-        logger.debug("Validating parsed MenuCommand objects.")
-        for cmd in commands:
-            if not cmd.type or cmd.type not in {"M", "N"}:
-                logger.error(f"Invalid MenuCommand type: {cmd.type}")
-                raise ValueError(f"Invalid MenuCommand type: {cmd.type}")
-            if cmd.operation and cmd.operation not in {"+", "="}:
-                logger.error(
-                    f"Invalid operation '{cmd.operation}' in MenuCommand type '{cmd.type}'."
-                )
-                raise ValueError(
-                    f"Invalid operation '{cmd.operation}' in MenuCommand type '{cmd.type}'."
-                )
-            if cmd.count is not None and cmd.count <= 0:
-                logger.error(
-                    f"MenuCommand count must be positive. Got: {cmd.count}")
-                raise ValueError(
-                    f"MenuCommand count must be positive. Got: {cmd.count}"
-                )
-            for sub in cmd.subcommands:
-                if not sub.type or sub.type not in {"T", "."}:
-                    logger.error(f"Invalid SubCommand type: {sub.type}")
-                    raise ValueError(f"Invalid SubCommand type: {sub.type}")
-                if sub.operation and sub.operation not in {"+", "="}:
-                    logger.error(
-                        f"Invalid operation '{sub.operation}' in SubCommand type '{sub.type}'."
-                    )
-                    raise ValueError(
-                        f"Invalid operation '{sub.operation}' in SubCommand type '{sub.type}'."
-                    )
-                if sub.type == "T" and not sub.value:
-                    logger.error("Title SubCommand must have a value.")
-                    raise ValueError("Title SubCommand must have a value.")
-                if sub.count is not None and sub.count <= 0:
-                    logger.error(
-                        f"SubCommand count must be positive. Got: {sub.count}")
-                    raise ValueError(
-                        f"SubCommand count must be positive. Got: {sub.count}"
+        Returns:
+            List[ParseOutcome]: One outcome per input, in input order.
+        """
+        items = list(syntax_strs)
+        workers = workers or os.cpu_count() or 1
+        outcomes: List[Optional[ParseOutcome]] = [None] * len(items)
+        pending: List[int] = []
+        for idx, syntax_str in enumerate(items):
+            try:
+                if self.limits is not None:
+                    self.limits.check_input(syntax_str)
+                cached = self.cached_nodes(syntax_str, self.limits)
+            except ParseLimitError as e:
+                outcomes[idx] = ParseOutcome(None, e)
+                continue
+            if cached is not None:
+                outcomes[idx] = ParseOutcome(to_models(cached), None)
+            else:
+                pending.append(idx)
+
+        logger.info(
+            f"Batch parsing {len(items)} inputs ({len(pending)} uncached) "
+            f"with {workers} worker(s)."
+        )
+        if workers == 1 or len(pending) <= 1:
+            results = [_parse_outcome(self, items[idx]) for idx in pending]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.grammar_file, self.treeless, self.limits),
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _parse_in_worker,
+                        (items[idx] for idx in pending),
+                        chunksize=max(1, chunksize),
                     )
-        logger.debug("All MenuCommand objects validated successfully.")
+                )
+
+        # Workers send back nodes, which pickle far smaller than models
+        for idx, outcome in zip(pending, results):
+            if outcome.error is None:
+                self.result_cache.put(
+                    self.grammar_version, items[idx], outcome.commands)
+                outcome = ParseOutcome(to_models(outcome.commands), None)
+            outcomes[idx] = outcome
+        return outcomes  # type: ignore[return-value]
 
     async def async_parse(self, syntax_str: str) -> List[MenuCommand]:
         """
         Asynchronously parses the given axe:Syntax string.
 
+        Runs on the loop's default executor. Services that need a bounded pool,
+        timeouts or cancellation should use AsyncParseService instead.
+
         Args:
             syntax_str (str): The axe:Syntax string to parse.
 
         Returns:
             List[MenuCommand]: Parsed MenuCommand objects.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, self.parse, syntax_str)
 
     def reload_grammar(self) -> None:
@@ -160,14 +530,88 @@ def reload_grammar(self) -> None:
         Reloads the grammar file and reinitializes the parser.
         """
         logger.info("Reloading grammar and reinitializing parser.")
+        # Results cached under the previous grammar version age out of the cache
         self.parser = self._initialize_parser()
-        self.parse.cache_clear()
         logger.debug("Grammar reloaded and parser reinitialized successfully.")
 
-    # Singleton parser instance
 
+def _parse_outcome(
+    parser: AxeSyntaxParser,
+    syntax_str: str,
+    limits: Optional[ParseLimits] = None,
+) -> ParseOutcome:
+    # Outcome holding nodes; callers convert them for their own callers
+    try:
+        return ParseOutcome(
+            parser._parse_nodes(syntax_str, limits or parser.limits), None)
+    except Exception as e:
+        return ParseOutcome(None, e)
+
+
+def _init_worker(
+    grammar_file: str, treeless: bool, limits: Optional[ParseLimits] = None
+) -> None:
+    """
+    Process pool initializer: builds the worker's parser once, up front.
+    """
+    global _worker_parser_key, _worker_limits
+    _worker_parser_key = (grammar_file, treeless)
+    _worker_limits = limits
+    get_parser(grammar_file, treeless)
+
+
+def _parse_in_worker(syntax_str: str) -> ParseOutcome:
+    return _parse_outcome(
+        get_parser(*_worker_parser_key), syntax_str, _worker_limits)
+
+
+# Process-wide parser registry, built lazily on first use
+_parsers: Dict[Tuple[Path, bool, bool], AxeSyntaxParser] = {}
+_parsers_lock = threading.Lock()
+# Parser used by _parse_in_worker, set by _init_worker in pool processes
+_worker_parser_key: Tuple[Optional[str], bool] = (None, False)
+# Limits of the parser that started the pool, set by _init_worker
+_worker_limits: Optional[ParseLimits] = None
+
+
+def get_parser(
+    grammar_file: Optional[str] = None, treeless: bool = False, fast: bool = False
+) -> AxeSyntaxParser:
+    """
+    Returns the shared AxeSyntaxParser for a grammar file, building it on first use.
+
+    One compiled parser is kept per grammar file and mode, so every entry point
+    (CLI, TUI, library callers) reuses warm parser state. Safe to call from many
+    threads at once; the parser is only ever built once.
+
+    Args:
+        grammar_file (Optional[str]): Path to the Lark grammar file. Defaults to 'axe_syntax.lark'.
+        treeless (bool): Whether to return the treeless (inline transformer) parser.
+        fast (bool): Whether to return a FastAxeSyntaxParser, which parses valid
+            input with a hand-written fast path and falls back to Lark otherwise.
+
+    Returns:
+        AxeSyntaxParser: The shared parser instance.
+    """
+    grammar_path = (Path(__file__).parent /
+                    (grammar_file or "axe_syntax.lark")).resolve()
+    key = (grammar_path, treeless, fast)
+    parser = _parsers.get(key)
+    if parser is None:
+        with _parsers_lock:
+            parser = _parsers.get(key)
+            if parser is None:
+                logger.debug(f"Building shared parser for {grammar_path}")
+                parser_class = AxeSyntaxParser
+                if fast:
+                    # Imported here: fast_parser subclasses AxeSyntaxParser
+                    from axe_builder.parser.fast_parser import FastAxeSyntaxParser
 
-_parser_instance = AxeSyntaxParser()
+                    parser_class = FastAxeSyntaxParser
+                parser = parser_class(
+                    grammar_file=str(grammar_path), treeless=treeless)
+                _parsers[key] = parser
+    return parser
 
 
 def parse_axesyntax(syntax_str: str) -> List[MenuCommand]:
@@ -184,4 +628,4 @@ def parse_axesyntax(syntax_str: str) -> List[MenuCommand]:
         ValueError: If the syntax is invalid.
         RuntimeError: For unexpected parsing or transformation errors.
     """
-    return _parser_instance.parse(syntax_str)
+    return get_parser().parse(syntax_str)
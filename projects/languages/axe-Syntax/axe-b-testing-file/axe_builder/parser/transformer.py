@@ -2,8 +2,17 @@
 
 from typing import List, Optional
 
-from axe_builder.models.models import MenuCommand, SubCommand
-from lark import Transformer, v_args
+from axe_builder.logger import trace
+from axe_builder.models.nodes import (
+    MenuNode,
+    Node,
+    NodeInterner,
+    SubNode,
+    make_menunode,
+    make_subnode,
+)
+from axe_builder.parser import limits
+from lark import Transformer, Tree, v_args
 from loguru import logger
 
 
@@ -16,48 +25,83 @@ class TransformationError(Exception):
 @v_args(inline=True)
 class AxeSyntaxTransformer(Transformer):
     """
-    Transforms the parse tree from axe:Syntax into MenuCommand and SubCommand objects.
+    Transforms the parse tree from axe:Syntax into MenuNode and SubNode objects.
+
+    Nodes are the parser's internal representation; AxeSyntaxParser.parse
+    converts them to MenuCommand and SubCommand models. The transformer only
+    checks what depends on the syntax (operand kinds, repeated counts, custom
+    subcommands sized by their menu). Field rules are checked once, as each
+    node is built, by axe_builder.models.validation.
+
+    With a NodeInterner, structurally identical subcommands and menus come back
+    as one shared instance, and titles are interned.
     """
 
-    def start(self, *commands) -> List[MenuCommand]:
+    def __init__(self, interner: Optional[NodeInterner] = None):
+        """
+        Initializes the AxeSyntaxTransformer.
+
+        Args:
+            interner (Optional[NodeInterner]): Interning table for the built nodes.
+                Defaults to None, which builds a fresh node every time.
         """
-        Transforms the start rule into a list of MenuCommand objects.
+        super().__init__()
+        self.interner = interner
+
+    def start(self, commands) -> List[Node]:
         """
-        logger.debug(f"Transforming start with commands: {commands}")
-        return list(commands)
+        Transforms the start rule into a list of nodes.
+        """
+        if trace.enabled:
+            logger.debug("Transforming start with commands: {}", commands)
+        return commands
 
-    def command_line(self, *commands) -> List[MenuCommand]:
+    def command_line(self, *commands) -> List[Node]:
         """
-        Transforms the command_line rule into a list of MenuCommand objects.
+        Transforms the command_line rule into a list of nodes.
         """
-        logger.debug(f"Transforming command_line with commands: {commands}")
+        if trace.enabled:
+            logger.debug("Transforming command_line with commands: {}", commands)
         return list(commands)
 
-    def command(self, command) -> MenuCommand:
+    def command(self, command) -> Node:
         """
-        Transforms the command rule into a single MenuCommand object.
+        Transforms the command rule into a single MenuNode or SubNode.
         """
-        logger.debug(f"Transforming command: {command}")
-        if not isinstance(command, MenuCommand):
-            logger.error("Transformed command is not a MenuCommand instance.")
+        if trace.enabled:
+            logger.debug("Transforming command: {}", command)
+        if not isinstance(command, (MenuNode, SubNode)):
+            logger.error("Transformed command is not a MenuNode instance.")
             raise TransformationError("Invalid command transformation.")
+        if limits.active:
+            budget = limits.current_budget()
+            if budget is not None:
+                budget.command()
+        if isinstance(command, SubNode):
+            self._check_custom_count(command)
         return command
 
-    def menu_command(self, menu_type: str, *operations) -> MenuCommand:
+    def menu_command(self, menu_type: str, *operations) -> MenuNode:
         """
-        Transforms the menu_command rule into a MenuCommand object.
+        Transforms the menu_command rule into a MenuNode.
         """
-        logger.debug(
-            f"Transforming menu_command: type={menu_type}, operations={operations}"
-        )
+        if trace.enabled:
+            logger.debug(
+                "Transforming menu_command: type={}, operations={}",
+                menu_type,
+                operations,
+            )
         operation = None
         count = None
-        subcommands: List[SubCommand] = []
+        subcommands: List[SubNode] = []
 
         idx = 0
         while idx < len(operations):
             op, operand = operations[idx], operations[idx + 1]
-            logger.debug(f"Processing operation: {op} with operand: {operand}")
+            if trace.enabled:
+                logger.debug("Processing operation: {} with operand: {}", op, operand)
+            if operation is None:
+                operation = op
             if op == "+":
                 if isinstance(operand, int):
                     if count is not None:
@@ -66,7 +110,7 @@ def menu_command(self, menu_type: str, *operations) -> MenuCommand:
                         )
                         raise TransformationError("Multiple counts specified.")
                     count = operand
-                elif isinstance(operand, SubCommand):
+                elif isinstance(operand, SubNode):
                     subcommands.append(operand)
                 else:
                     logger.error(
@@ -83,7 +127,16 @@ def menu_command(self, menu_type: str, *operations) -> MenuCommand:
                         )
                         raise TransformationError("Multiple counts specified.")
                     count = operand
-                elif isinstance(operand, SubCommand):
+                    # A count assigned after a custom subcommand, as in
+                    # [N+(.)={6}], also sizes that subcommand.
+                    # The menu count is checked below, so the copy needs no check.
+                    subcommands = [
+                        self._shared(sub._replace(count=operand))
+                        if sub.type == "." and sub.count is None
+                        else sub
+                        for sub in subcommands
+                    ]
+                elif isinstance(operand, SubNode):
                     subcommands.append(operand)
                 else:
                     logger.error(
@@ -104,19 +157,29 @@ def menu_command(self, menu_type: str, *operations) -> MenuCommand:
                 "MenuCommand with title subcommand must have a count."
             )
 
-        menu_command = MenuCommand(
-            type=menu_type, operation=operation, count=count, subcommands=subcommands
-        )
-        logger.debug(f"Created MenuCommand: {menu_command}")
+        for sub in subcommands:
+            self._check_custom_count(sub)
+
+        if limits.active:
+            budget = limits.current_budget()
+            if budget is not None:
+                budget.menu(len(subcommands))
+                budget.count(count)
+
+        menu_command = self._shared(
+            make_menunode(menu_type, operation, count, subcommands))
+        if trace.enabled:
+            logger.debug("Created MenuCommand: {}", menu_command)
         return menu_command
 
-    def sub_command(self, sub_type: str, *operations) -> SubCommand:
+    def sub_command(self, sub_type: str, *operations) -> SubNode:
         """
-        Transforms the sub_command rule into a SubCommand object.
+        Transforms the sub_command rule into a SubNode.
         """
-        logger.debug(
-            f"Transforming sub_command: type={sub_type}, operations={operations}"
-        )
+        if trace.enabled:
+            logger.debug(
+                "Transforming sub_command: type={}, operations={}", sub_type, operations
+            )
         operation = None
         value = None
         count = None
@@ -124,7 +187,8 @@ def sub_command(self, sub_type: str, *operations) -> SubCommand:
         idx = 0
         while idx < len(operations):
             op, operand = operations[idx], operations[idx + 1]
-            logger.debug(f"Processing operation: {op} with operand: {operand}")
+            if trace.enabled:
+                logger.debug("Processing operation: {} with operand: {}", op, operand)
             if op == "=":
                 if sub_type == "T":
                     if not isinstance(operand, str):
@@ -152,40 +216,65 @@ def sub_command(self, sub_type: str, *operations) -> SubCommand:
                     f"Unsupported operator in sub_command: {op}")
             idx += 2
 
-        if sub_type == "T" and not value:
-            logger.error("Title SubCommand must have a value.")
-            raise TransformationError("Title SubCommand must have a value.")
+        if limits.active:
+            budget = limits.current_budget()
+            if budget is not None:
+                budget.count(count)
+                budget.check_deadline()
 
-        if sub_type == "." and count is None:
+        if self.interner is not None:
+            sub_command = self.interner.subnode(sub_type, operation, value, count)
+        else:
+            sub_command = make_subnode(sub_type, operation, value, count)
+        if trace.enabled:
+            logger.debug("Created SubCommand: {}", sub_command)
+        return sub_command
+
+    def _shared(self, node: Node) -> Node:
+        """
+        Returns the interned instance of a validated node, if interning is on.
+        """
+        if self.interner is None:
+            return node
+        return self.interner.intern(node)
+
+    def _check_custom_count(self, sub: SubNode) -> None:
+        """
+        Ensures a custom SubCommand ends up with a count, either its own or
+        one assigned by the enclosing menu_command.
+        """
+        if sub.type == "." and sub.count is None:
             logger.error("Custom SubCommand must have a count.")
             raise TransformationError("Custom SubCommand must have a count.")
 
-        sub_command = SubCommand(
-            type=sub_type, operation=operation, value=value, count=count
-        )
-        logger.debug(f"Created SubCommand: {sub_command}")
-        return sub_command
-
     def operator(self, op: str) -> str:
         """
         Transforms the operator rule into a string.
         """
-        logger.debug(f"Operator parsed: {op}")
-        return op
+        if trace.enabled:
+            logger.debug("Operator parsed: {}", op)
+        return str(op)
 
     def operand(self, operand) -> Optional[object]:
         """
         Transforms the operand rule into an object (int or str).
         """
-        logger.debug(f"Operand parsed: {operand}")
+        if trace.enabled:
+            logger.debug("Operand parsed: {}", operand)
         return operand
 
+    # The grammar keeps separate operator/operand rules for menus and
+    # subcommands; both transform the same way.
+    menu_operator = sub_operator = operator
+    menu_operand = sub_operand = operand
+
     def MENU_TYPE(self, token) -> str:
         """
         Transforms the MENU_TYPE token into a string.
         """
         menu_type = token.value
-        logger.debug(f"MENU_TYPE parsed: {menu_type}")
+        if trace.enabled:
+            logger.debug("MENU_TYPE parsed: {}", menu_type)
         return menu_type
 
     def SUB_TYPE(self, token) -> str:
@@ -193,15 +282,22 @@ def SUB_TYPE(self, token) -> str:
         Transforms the SUB_TYPE token into a string.
         """
         sub_type = token.value
-        logger.debug(f"SUB_TYPE parsed: {sub_type}")
+        if trace.enabled:
+            logger.debug("SUB_TYPE parsed: {}", sub_type)
         return sub_type
 
     def NUM_VAR(self, token) -> int:
         """
         Transforms the NUM_VAR token into an integer.
         """
-        num_var = int(token.value.strip("{}"))
-        logger.debug(f"NUM_VAR parsed: {num_var}")
+        digits = token.value.strip("{}")
+        if limits.active:
+            budget = limits.current_budget()
+            if budget is not None:
+                budget.count_digits(digits)
+        num_var = int(digits)
+        if trace.enabled:
+            logger.debug("NUM_VAR parsed: {}", num_var)
         return num_var
 
     def value(self, token) -> str:
@@ -209,14 +305,21 @@ def value(self, token) -> str:
         Transforms the value token into a string.
         """
         val = token.value.strip('"')
-        logger.debug(f"value parsed: {val}")
+        if trace.enabled:
+            logger.debug("value parsed: {}", val)
         return val
 
     def __default__(self, data, children, meta):
         """
         Handles any unprocessed rules.
+
+        When attached to the LALR parser (treeless mode), Lark also routes its
+        internal repetition rules (e.g. ``__command_line_star_0``) here, without
+        metadata. Those must come back as a Tree so Lark can inline them.
         """
+        if data.startswith("_"):
+            return Tree(data, children, meta)
+        location = f" at line {meta.line}, column {meta.column}" if meta else ""
         logger.warning(
-            f"Unhandled rule: {data} with children: {children} at line {meta.line}, column {meta.column}"
-        )
+            f"Unhandled rule: {data} with children: {children}{location}")
         return children
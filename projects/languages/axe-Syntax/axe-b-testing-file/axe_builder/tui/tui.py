@@ -4,8 +4,8 @@
 from typing import List, Optional
 
 from axe_builder.logger.logger import logger
-from axe_builder.models.models import MenuCommand
-from axe_builder.parser.parser import parse_axesyntax
+from axe_builder.models.nodes import Node
+from axe_builder.parser.incremental import IncrementalParser
 from textual.app import App, ComposeResult
 from textual.containers import Container, Grid
 from textual.widgets import Button, DataTable, Footer, Header, Input, Static
@@ -36,8 +36,10 @@ def __init__(self, syntax: str, **kwargs):
         """
         super().__init__(**kwargs)
         self.syntax = syntax
-        self.parsed_commands: List[MenuCommand] = []
+        self.parsed_commands: List[Node] = []
         self.export_path: str = "cli_template.py"
+        # Keeps per-segment results so re-parsing after an edit stays cheap
+        self.incremental_parser = IncrementalParser()
 
     def on_load(self) -> None:
         """Bind keys for the application."""
@@ -120,8 +122,10 @@ async def parse_syntax(self) -> None:
 
         try:
             logger.info("Parsing syntax from TUI input")
-            self.parsed_commands = parse_axesyntax(syntax)
-            self.menu_tree.update_menu_commands(self.parsed_commands)
+            self.parsed_commands = self.incremental_parser.parse_nodes(syntax)
+            # Cached with the result, so an unchanged input reuses its hierarchy
+            index = self.incremental_parser.parse_index(syntax)
+            self.menu_tree.update_menu_commands(self.parsed_commands, index)
             self.status.update("Status: Parsing successful!")
             logger.success("Syntax parsed and tree updated")
             await self.display_logs()
@@ -1,37 +1,83 @@
 # axe_builder/tui/widgets.py
 
-from typing import List
+from typing import Dict, List, Optional
 
-from axe_builder.models.models import MenuCommand
+from axe_builder.models.expansion import CountExpansion, menu_copies
+from axe_builder.models.index import MenuIndex
+from axe_builder.models.nodes import MenuNode, Node
 from loguru import logger
 from textual.widgets import Tree
 
+# Expanded items listed under a "+{N}" menu; the rest are only counted
+MAX_EXPANDED_ROWS = 50
+
+
+def _label(cmd: Node) -> str:
+    if isinstance(cmd, MenuNode):
+        return f"{cmd.type} (Op: {cmd.operation}, Count: {cmd.count})"
+    if cmd.type == "T":
+        return f"Title: {cmd.value}"
+    if cmd.type == ".":
+        return f"Custom Command (Count: {cmd.count})"
+    return f"SubCommand: {cmd.type}"
+
 
 class MenuTree(Tree):
-    def __init__(self, title: str, parsed_commands: List[MenuCommand]):
+    def __init__(
+        self,
+        title: str,
+        parsed_commands: List[Node],
+        index: Optional[MenuIndex] = None,
+    ):
         super().__init__(title, "menu_tree")
         self.parsed_commands = parsed_commands
+        self.index = index
         self.populate_tree()
 
     def populate_tree(self):
         self.clear()
-        for cmd in self.parsed_commands:
-            node_label = f"{cmd.type} (Op: {cmd.operation}, Count: {cmd.count})"
-            node = self.add(node_label)
-            for sub in cmd.subcommands:
-                if sub.type == "T":
-                    sub_label = f"Title: {sub.value}"
-                elif sub.type == ".":
-                    sub_label = f"Custom Command (Count: {sub.count})"
-                else:
-                    sub_label = f"SubCommand: {sub.type}"
-                self.add(sub_label, parent=node)
+        # Nested menus are shown under their main menu. The index normally comes
+        # from the parser's cache; it is only built here when none was given.
+        index = self.index
+        if index is None:
+            index = self.index = MenuIndex.from_commands(self.parsed_commands)
+        # "+{N}" menus also list their copies. The expansion is lazy, so only
+        # the rows shown are ever built, however large the counts.
+        self.expansion = CountExpansion(self.parsed_commands, max_items=None)
+        self._sources: Dict[int, int] = {}
+        entry = 0
+        for source, cmd in enumerate(self.expansion.nodes):
+            self._sources[entry] = source
+            entry += 1 + len(getattr(cmd, "subcommands", ()))
+        for entry in index.roots():
+            self._add_entry(index, entry, None)
         logger.debug("Menu tree populated successfully.")
 
-    def update_menu_commands(self, new_commands: List[MenuCommand]):
+    def _add_entry(self, index: MenuIndex, entry: int, parent):
+        cmd = index.node(entry)
+        node = self.add(_label(cmd), parent=parent)
+        for child in index.children(entry):
+            self._add_entry(index, child, node)
+        if isinstance(cmd, MenuNode) and menu_copies(cmd) > 1:
+            self._add_expansion(self._sources[entry], node)
+
+    def _add_expansion(self, source: int, parent):
+        start = self.expansion.offsets[source]
+        stop = self.expansion.offsets[source + 1]
+        node = self.add(f"Expanded: {stop - start} items", parent=parent)
+        shown = min(stop, start + MAX_EXPANDED_ROWS)
+        for item in self.expansion.window(start, shown):
+            self.add(f"{_label(item.node)} #{item.copy}", parent=node)
+        if stop > shown:
+            self.add(f"... {stop - shown} more", parent=node)
+
+    def update_menu_commands(
+        self, new_commands: List[Node], index: Optional[MenuIndex] = None
+    ):
         self.parsed_commands = new_commands
+        self.index = index
         self.populate_tree()
         logger.debug("Menu tree updated with new commands.")
 
-    def add(self, node_label):
+    def add(self, node_label, parent=None):
         pass
@@ -1,9 +1,43 @@
 # axe_builder/utils/utils.py
 
+import re
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional, Tuple
 
 from axe_builder.logger.logger import logger
+from axe_builder.parser.parser import AxeSyntaxError
+
+# The language of axe_syntax.lark, as one regular expression. Nesting is at most
+# two levels deep ([...(...)...]), so the grammar is regular. The terminals
+# mirror WS, INT and ESCAPED_STRING from Lark's common.lark.
+_WS = r"[ \t\f\r\n]*"
+_NUM = r"\{[0-9]+\}"
+_STR = r'"(?:[^"\\\n]|\\.)*"'
+_SUB = rf"\({_WS}[T.](?:{_WS}[+=]{_WS}(?:{_NUM}|{_STR}))*{_WS}\)"
+_MENU = rf"\[{_WS}[MN](?:{_WS}[+=]{_WS}(?:{_SUB}|{_NUM}|{_STR}))*{_WS}\]"
+_COMMAND = rf"(?:{_MENU}|{_SUB})"
+_COMMANDS = re.compile(rf"{_WS}{_COMMAND}(?:{_WS}:{_WS}{_COMMAND})*")
+_VALID = re.compile(rf"{_COMMANDS.pattern}{_WS}")
+_WS_RUN = re.compile(_WS)
+_NUM_TOKEN = re.compile(_NUM)
+_STR_TOKEN = re.compile(_STR)
+
+
+class SyntaxIssue(NamedTuple):
+    """
+    The first syntax error found in an axe:Syntax string.
+    """
+
+    offset: int  # 0-based character offset
+    message: str
+
+    def position(self, syntax: str) -> Tuple[int, int]:
+        """
+        Returns the 1-based (line, column) of the error in the checked string.
+        """
+        line = syntax.count("\n", 0, self.offset) + 1
+        column = self.offset - (syntax.rfind("\n", 0, self.offset) + 1) + 1
+        return line, column
 
 
 def read_file(file_path: str) -> str:
@@ -43,6 +77,43 @@ def write_file(file_path: str, content: str) -> None:
         raise
 
 
+def check_syntax(syntax: str) -> Optional[SyntaxIssue]:
+    """
+    Checks the structure of an axe:Syntax string in a single linear pass.
+
+    Brackets and parentheses, tokens, {INT} counts and quoted strings are checked
+    against the grammar without building a parse tree, so invalid input is
+    rejected for a fraction of the cost of a full parse. Accepted input is
+    syntactically valid; field rules (e.g. a title needs a value) are still
+    checked by the parser.
+
+    Args:
+        syntax (str): The axe:Syntax string to check.
+
+    Returns:
+        Optional[SyntaxIssue]: The first error, or None if the string is valid.
+    """
+    if _VALID.fullmatch(syntax):
+        return None
+    # Skip the run of valid commands in one C-level match, then find the
+    # exact error position in the rest by hand.
+    match = _COMMANDS.match(syntax)
+    if match is None:
+        return _scan_command(syntax, _skip_ws(syntax, 0))[1]
+    pos = _skip_ws(syntax, match.end())
+    while True:
+        if pos == len(syntax):
+            # Unreachable for input the full match rejected
+            return None
+        if syntax[pos] != ":":
+            return SyntaxIssue(
+                pos, f"Expected ':' between commands, got {syntax[pos]!r}")
+        pos, issue = _scan_command(syntax, _skip_ws(syntax, pos + 1))
+        if issue is not None:
+            return issue
+        pos = _skip_ws(syntax, pos)
+
+
 def validate_syntax(syntax: str) -> bool:
     """
     Validates the axe:Syntax string format.
@@ -53,5 +124,82 @@ def validate_syntax(syntax: str) -> bool:
     Returns:
         bool: True if valid, False otherwise.
     """
-    # Placeholder for actual validation logic
-    return True
+    return check_syntax(syntax) is None
+
+
+def check_syntax_or_fail(syntax: str) -> None:
+    """
+    Rejects structurally invalid input before it reaches the parser.
+
+    Args:
+        syntax (str): The axe:Syntax string.
+
+    Raises:
+        AxeSyntaxError: With the line and column of the first error.
+    """
+    issue = check_syntax(syntax)
+    if issue is not None:
+        line, column = issue.position(syntax)
+        raise AxeSyntaxError(
+            f"Invalid axe:Syntax input at line {line}, column {column}: "
+            f"{issue.message}",
+            line=line,
+            column=column,
+        )
+
+
+def _skip_ws(syntax: str, pos: int) -> int:
+    return _WS_RUN.match(syntax, pos).end()
+
+
+def _unexpected(syntax: str, pos: int, expected: str) -> SyntaxIssue:
+    if pos >= len(syntax):
+        return SyntaxIssue(pos, f"Unexpected end of input, expected {expected}")
+    return SyntaxIssue(pos, f"Unexpected {syntax[pos]!r}, expected {expected}")
+
+
+def _scan_operand(
+    syntax: str, pos: int, allow_sub: bool
+) -> Tuple[int, Optional[SyntaxIssue]]:
+    char = syntax[pos] if pos < len(syntax) else ""
+    if char == "{":
+        match = _NUM_TOKEN.match(syntax, pos)
+        if match is None:
+            return pos, SyntaxIssue(pos, "Malformed count, expected {INT}")
+        return match.end(), None
+    if char == '"':
+        match = _STR_TOKEN.match(syntax, pos)
+        if match is None:
+            return pos, SyntaxIssue(pos, "Unterminated string")
+        return match.end(), None
+    if char == "(" and allow_sub:
+        return _scan_command(syntax, pos)
+    expected = "a subcommand, {INT} or a string" if allow_sub else "{INT} or a string"
+    return pos, _unexpected(syntax, pos, expected)
+
+
+def _scan_command(syntax: str, pos: int) -> Tuple[int, Optional[SyntaxIssue]]:
+    # Scans one [menu] or (subcommand) starting at pos
+    char = syntax[pos] if pos < len(syntax) else ""
+    if char == "[":
+        close, types, allow_sub = "]", "MN", True
+    elif char == "(":
+        close, types, allow_sub = ")", "T.", False
+    else:
+        return pos, _unexpected(syntax, pos, "'[' or '('")
+    start = pos
+    pos = _skip_ws(syntax, pos + 1)
+    if pos >= len(syntax) or syntax[pos] not in types:
+        kind = "menu" if allow_sub else "subcommand"
+        return pos, _unexpected(syntax, pos, f"a {kind} type ({' or '.join(types)})")
+    pos = _skip_ws(syntax, pos + 1)
+    while pos < len(syntax) and syntax[pos] != close:
+        if syntax[pos] not in "+=":
+            return pos, _unexpected(syntax, pos, f"'+', '=' or {close!r}")
+        pos, issue = _scan_operand(syntax, _skip_ws(syntax, pos + 1), allow_sub)
+        if issue is not None:
+            return pos, issue
+        pos = _skip_ws(syntax, pos)
+    if pos >= len(syntax):
+        return pos, SyntaxIssue(start, f"Unclosed {syntax[start]!r}")
+    return pos + 1, None
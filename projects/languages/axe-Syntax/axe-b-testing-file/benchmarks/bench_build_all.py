@@ -0,0 +1,67 @@
+# benchmarks/bench_build_all.py
+# Compares building a directory of .axe files with one `axe_builder build`
+# process per file against a single `build-all` run, cold and then up to date.
+#
+# Usage:
+#     python benchmarks/bench_build_all.py [--files N] [--jobs J]
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from axe_builder.exporter.build import build_all, collect_targets
+from loguru import logger
+
+
+def write_inputs(directory: Path, n: int) -> None:
+    directory.mkdir()
+    for i in range(n):
+        menus = ":".join(
+            f'[M+{{{j % 5 + 1}}}]:(T="Menu {i}.{j}"):[N+(.)={{3}}]' for j in range(20)
+        )
+        (directory / f"menu{i}.axe").write_text(menus, encoding="utf-8")
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Batch build benchmark")
+    arg_parser.add_argument("--files", type=int, default=50)
+    arg_parser.add_argument("--jobs", type=int, default=None)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    env = dict(os.environ, PYTHONPATH=str(Path.cwd()))
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = Path(tmp) / "menus"
+        write_inputs(inputs, args.files)
+
+        def per_file() -> None:
+            for source in sorted(inputs.glob("*.axe")):
+                output = Path(tmp) / "single" / f"{source.stem}.py"
+                output.parent.mkdir(exist_ok=True)
+                command = [sys.executable, "-m", "axe_builder.cli", "build"]
+                command += ["--file", str(source), "--output", str(output), "-w"]
+                subprocess.run(command, env=env, check=True, capture_output=True)
+
+        targets = collect_targets([str(inputs)], Path(tmp) / "batch")
+        single = timed(per_file)
+        cold = timed(lambda: build_all(targets, workers=args.jobs))
+        warm = timed(lambda: build_all(targets, workers=args.jobs))
+
+    print(f"files: {args.files}")
+    print(f"one process per file:  {single:7.2f} s")
+    print(f"build-all, cold:       {cold:7.2f} s")
+    print(f"build-all, up to date: {warm:7.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_export.py
+# Compares peak memory and time of a large CLI export rendered into one string
+# and then written (the former exporter) against the streaming exporter and
+# the AST backend.
+#
+# Usage:
+#     python benchmarks/bench_export.py [--menus N]
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from axe_builder.exporter.ast_exporter import export_cli_ast
+from axe_builder.exporter.environment import get_environment
+from axe_builder.exporter.exporter import CLI_TEMPLATE, export_cli_template
+from axe_builder.models.nodes import MenuNode, SubNode
+from loguru import logger
+
+
+def menus(n: int):
+    return [
+        MenuNode(
+            "N" if i % 4 else "M",
+            "+",
+            i + 1,
+            (SubNode("T", "=", f"Title {i}"), SubNode(".", "=", None, 3)),
+        )
+        for i in range(n)
+    ]
+
+
+def render_then_write(commands, output: Path) -> None:
+    template = get_environment().get_template(CLI_TEMPLATE)
+    rendered = template.render(menus=commands)
+    with open(output, "w") as f:
+        f.write(rendered)
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Streaming export benchmark")
+    arg_parser.add_argument("--menus", type=int, default=50_000)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    commands = menus(args.menus)
+    get_environment().get_template(CLI_TEMPLATE)  # compile outside the timings
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "cli.py"
+        rendered_ms, rendered_peak = measure(render_then_write, commands, output)
+        size = output.stat().st_size
+        streamed_ms, streamed_peak = measure(export_cli_template, commands, output)
+        ast_ms, ast_peak = measure(export_cli_ast, commands, output)
+        ast_size = output.stat().st_size
+
+    print(f"menus: {args.menus}  output: {size / 2**20:.1f} MiB")
+    print(f"render, then write: {rendered_ms:9.1f} ms  peak {rendered_peak:7.1f} MiB")
+    print(f"streaming export:   {streamed_ms:9.1f} ms  peak {streamed_peak:7.1f} MiB")
+    print(f"AST backend:        {ast_ms:9.1f} ms  peak {ast_peak:7.1f} MiB")
+    print(f"AST output: {ast_size / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_fast_parser.py
+# Compares the hand-written fast-path parser with the Lark tree and treeless paths.
+#
+# Usage:
+#     python benchmarks/bench_fast_parser.py [--iterations N]
+
+import argparse
+import time
+
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.fast_parser import FastAxeSyntaxParser
+from axe_builder.parser.parser import AxeSyntaxParser
+from loguru import logger
+
+SAMPLES = [
+    "[M+{3}]",
+    "[M={2}]:[N+{3}]",
+    '[M={1}]:(T="Menu One Title")',
+    "[M={1}]:[N+(.)={6}]",
+    '[M={1}]:[N+(T="Nested Menu 1 Title")={2}]:[N+(.)={4}]',
+]
+
+
+def bench(parser: AxeSyntaxParser, iterations: int) -> float:
+    for syntax in SAMPLES:  # warm-up
+        parser.parse(syntax)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for syntax in SAMPLES:
+            parser.parse(syntax)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(SAMPLES)) * 1e6
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Fast-path parser benchmark")
+    arg_parser.add_argument("--iterations", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    # Measure parsing, not log formatting
+    logger.remove()
+
+    # Disabled result caches so every call pays the full parse cost
+    parsers = {
+        "lark tree": AxeSyntaxParser(result_cache=ParseResultCache(max_entries=0)),
+        "treeless": AxeSyntaxParser(
+            treeless=True, result_cache=ParseResultCache(max_entries=0)
+        ),
+        "fast path": FastAxeSyntaxParser(result_cache=ParseResultCache(max_entries=0)),
+    }
+    baseline = None
+    for label, parser in parsers.items():
+        us_per_parse = bench(parser, args.iterations)
+        baseline = baseline or us_per_parse
+        print(
+            f"{label:>9}: {us_per_parse:8.1f} us/parse "
+            f"({baseline / us_per_parse:.1f}x vs lark tree)"
+        )
+
+
+if __name__ == "__main__":
+    main()
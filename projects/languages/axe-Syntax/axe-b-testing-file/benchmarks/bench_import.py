@@ -0,0 +1,77 @@
+# benchmarks/bench_import.py
+# Measures the import time of axe_builder.cli, and the first get_parser() + parse
+# in a new process with and without the serialized parser-table cache. Importing
+# the CLI does not build a parser, so only the first parse depends on the cache.
+#
+# Usage:
+#     python benchmarks/bench_import.py [--runs N]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from axe_builder.parser.disk_cache import CACHE_DIR_ENV
+from axe_builder.parser.parser import grammar_cache_path
+
+ROOT = Path(__file__).resolve().parent.parent
+GRAMMAR_PATH = ROOT / "axe_builder" / "parser" / "axe_syntax.lark"
+
+IMPORT_CLI = "import axe_builder.cli"
+FIRST_PARSE = """
+import time
+from loguru import logger
+logger.remove()
+from axe_builder.parser.parser import get_parser
+start = time.perf_counter()
+get_parser().parse("[M+{2}]:[N+{3}]")
+print(time.perf_counter() - start)
+"""
+
+
+def _run(code: str) -> float:
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    # A persistent parse cache would answer the parse without the parser
+    env.pop(CACHE_DIR_ENV, None)
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    lines = result.stdout.strip().splitlines()
+    return float(lines[-1]) if lines else elapsed
+
+
+def _median_ms(code: str, runs: int, clear_cache: bool = False) -> float:
+    samples = []
+    for _ in range(runs):
+        if clear_cache:
+            for treeless in (False, True):
+                grammar_cache_path(GRAMMAR_PATH, treeless).unlink(missing_ok=True)
+        samples.append(_run(code))
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="axe_builder import-time benchmark")
+    arg_parser.add_argument("--runs", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    import_cli = _median_ms(IMPORT_CLI, args.runs)
+    print(f"import axe_builder.cli:         {import_cli:8.1f} ms")
+    cold = _median_ms(FIRST_PARSE, args.runs, clear_cache=True)
+    print(f"first parse, no table cache:    {cold:8.1f} ms")
+    warm = _median_ms(FIRST_PARSE, args.runs)
+    print(f"first parse, warm table cache:  {warm:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_incremental.py
+# Measures edit-to-result latency of IncrementalParser against a full re-parse
+# on a long menu definition (node results, as the TUI uses them), and compares
+# it with a 60 fps frame budget.
+#
+# Usage:
+#     python benchmarks/bench_incremental.py [--segments N] [--edits N]
+
+import argparse
+import time
+
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.incremental import IncrementalParser
+from axe_builder.parser.parser import AxeSyntaxParser
+from loguru import logger
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def definition(segments: int, edit: int = 0) -> str:
+    parts = []
+    for i in range(segments):
+        count = i + 1 + (edit if i == segments // 2 else 0)
+        parts.append(f'[N+(T="Nested Menu {i}")={{{count}}}]')
+    return "[M={1}]:" + ":".join(parts)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Incremental parse benchmark")
+    arg_parser.add_argument("--segments", type=int, default=2000)
+    arg_parser.add_argument("--edits", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    parser = AxeSyntaxParser(
+        treeless=True, result_cache=ParseResultCache(max_entries=0)
+    )
+    incremental = IncrementalParser(parser)
+    incremental.parse_nodes(definition(args.segments))
+
+    full_ms = []
+    incremental_ms = []
+    for edit in range(1, args.edits + 1):
+        syntax = definition(args.segments, edit)
+
+        start = time.perf_counter()
+        parser.parse_nodes(syntax)
+        full_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        incremental.parse_nodes(syntax)
+        incremental_ms.append((time.perf_counter() - start) * 1000)
+
+    full = sum(full_ms) / len(full_ms)
+    inc = sum(incremental_ms) / len(incremental_ms)
+    print(f"segments: {args.segments}, frame budget: {FRAME_BUDGET_MS:.1f} ms")
+    print(f"full re-parse:   {full:8.2f} ms/edit")
+    print(f"incremental:     {inc:8.2f} ms/edit ({full / inc:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_index.py
+# Compares path and title lookups through a MenuIndex with rescanning the flat
+# parse result, as consumers did before the index existed.
+#
+# Usage:
+#     python benchmarks/bench_index.py [--menus N] [--lookups N]
+
+import argparse
+import time
+
+from axe_builder.models.index import MenuIndex
+from axe_builder.models.nodes import MenuNode, SubNode
+from loguru import logger
+
+
+def menu_set(n: int) -> list:
+    return [
+        MenuNode(
+            "N" if i % 10 else "M",
+            "+",
+            i % 50 + 1,
+            (SubNode("T", "=", f"Title {i}"),),
+        )
+        for i in range(n)
+    ]
+
+
+def scan_for_title(nodes: list, title: str):
+    for node in nodes:
+        for sub in node.subcommands:
+            if sub.value == title:
+                return node
+    return None
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="MenuIndex benchmark")
+    arg_parser.add_argument("--menus", type=int, default=100_000)
+    arg_parser.add_argument("--lookups", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    nodes = menu_set(args.menus)
+    titles = [f"Title {i * args.menus // args.lookups}" for i in range(args.lookups)]
+
+    index_holder = []
+    build = timed(lambda: index_holder.append(MenuIndex.from_commands(nodes)))
+    index = index_holder[0]
+    scan = timed(lambda: [scan_for_title(nodes, title) for title in titles])
+    indexed = timed(lambda: [index.titled(title) for title in titles])
+    paths = [index.path(entry) for entry in range(0, len(index), 97)]
+    by_path = timed(lambda: [index.get(path) for path in paths])
+
+    print(f"menus: {args.menus}  entries: {len(index)}")
+    print(f"build index:             {build:9.1f} ms")
+    print(f"{args.lookups} title scans:        {scan:9.1f} ms")
+    print(f"{args.lookups} indexed titles:     {indexed:9.3f} ms")
+    print(f"{len(paths)} path lookups:     {by_path:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
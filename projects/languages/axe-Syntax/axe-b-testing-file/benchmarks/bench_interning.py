@@ -0,0 +1,53 @@
+# benchmarks/bench_interning.py
+# Measures the memory held by parse results of a repetitive corpus, with and
+# without node interning, and the parse time of both.
+#
+# Usage:
+#     python benchmarks/bench_interning.py [--lines N] [--menus N]
+
+import argparse
+import time
+import tracemalloc
+
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.fast_parser import FastAxeSyntaxParser
+from loguru import logger
+
+
+def corpus(lines: int, menus: int) -> list:
+    line = ":".join(
+        '[N+(T="Section %d")={%d}]:[N+(.)={%d}]' % (i % 5, i % 3 + 1, i % 4 + 1)
+        for i in range(menus)
+    )
+    # Distinct strings with the same content, as read from separate files
+    return ["[M={%d}]:%s" % (n % 7 + 1, line) for n in range(lines)]
+
+
+def held(parser: FastAxeSyntaxParser, inputs: list):
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = [parser.parse_nodes(s) for s in inputs]
+    elapsed = (time.perf_counter() - start) * 1000
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, current, elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Node interning benchmark")
+    arg_parser.add_argument("--lines", type=int, default=500)
+    arg_parser.add_argument("--menus", type=int, default=100)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    inputs = corpus(args.lines, args.menus)
+    for intern_nodes in (False, True):
+        parser = FastAxeSyntaxParser(
+            result_cache=ParseResultCache(max_entries=0), intern_nodes=intern_nodes)
+        _, size, elapsed = held(parser, inputs)
+        label = "interned" if intern_nodes else "plain"
+        print(f"{label:>8}: {size / 2**20:8.2f} MiB held  {elapsed:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
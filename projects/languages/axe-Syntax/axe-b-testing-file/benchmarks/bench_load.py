@@ -0,0 +1,59 @@
+# benchmarks/bench_load.py
+# Compares loading a large JSON menu dump in one TypeAdapter call with the
+# per-object path (json.loads, then MenuCommand.model_validate per menu).
+#
+# Usage:
+#     python benchmarks/bench_load.py [--menus N]
+
+import argparse
+import json
+import time
+
+from axe_builder.models.loader import commands_adapter, dump_commands, load_commands
+from axe_builder.models.models import MenuCommand
+from axe_builder.models.nodes import MenuNode, SubNode, to_models
+from loguru import logger
+
+
+def menu_dump(n: int) -> bytes:
+    nodes = [
+        MenuNode(
+            "N" if i % 4 else "M",
+            "+",
+            i % 50 + 1,
+            (SubNode("T", "=", f"Title {i}"), SubNode(".", "=", None, 3)),
+        )
+        for i in range(n)
+    ]
+    return dump_commands(to_models(nodes))
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Bulk menu loading benchmark")
+    arg_parser.add_argument("--menus", type=int, default=100_000)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    payload = menu_dump(args.menus)
+    commands_adapter()  # build the shared adapter outside the timings
+
+    per_object = timed(
+        lambda: [MenuCommand.model_validate(d) for d in json.loads(payload)])
+    bulk = timed(lambda: load_commands(payload))
+    bulk_strict = timed(lambda: load_commands(payload, strict=True))
+
+    print(f"menus: {args.menus}  payload: {len(payload) / 2**20:.1f} MiB")
+    print(f"per-object model_validate: {per_object:9.1f} ms")
+    print(f"load_commands:             {bulk:9.1f} ms")
+    print(f"load_commands strict:      {bulk_strict:9.1f} ms")
+    print(f"speedup: {per_object / bulk:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_logging.py
+# Measures parse throughput under the logging setups the parser runs with:
+# a DEBUG sink (as with the shipped log files), an INFO-only sink (trace
+# messages skipped unformatted), and production mode (trace calls skipped).
+#
+# Usage:
+#     python benchmarks/bench_logging.py [--iterations N]
+
+import argparse
+import time
+
+from axe_builder.logger import trace
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import AxeSyntaxParser
+from loguru import logger
+
+SAMPLES = [
+    "[M+{3}]",
+    "[M={2}]:[N+{3}]",
+    '[M={1}]:(T="Menu One Title")',
+    "[M={1}]:[N+(.)={6}]",
+    '[M={1}]:[N+(T="Nested Menu 1 Title")={2}]:[N+(.)={4}]',
+]
+
+
+def bench(parser: AxeSyntaxParser, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for syntax in SAMPLES:
+            parser.parse(syntax)
+    return iterations * len(SAMPLES) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Hot-path logging benchmark")
+    arg_parser.add_argument("--iterations", type=int, default=500)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    # A disabled result cache so every call pays the full parse cost
+    parser = AxeSyntaxParser(
+        treeless=True, result_cache=ParseResultCache(max_entries=0)
+    )
+
+    cases = [
+        ("debug sink", "DEBUG", False),
+        ("info sink", "INFO", False),
+        ("production", "DEBUG", True),
+    ]
+    baseline = None
+    for label, level, production in cases:
+        # Formats and discards every record it accepts, like a file sink minus I/O
+        handler_id = logger.add(lambda _: None, level=level)
+        trace.set_production_mode(production)
+        try:
+            bench(parser, 10)  # warm-up
+            rate = bench(parser, args.iterations)
+        finally:
+            logger.remove(handler_id)
+            trace.set_production_mode(False)
+        baseline = baseline or rate
+        print(f"{label:>10}: {rate:8.0f} parses/s ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_nodes.py
+# Compares the internal MenuNode/SubNode tuples with the pydantic models:
+# memory per node and construction throughput.
+#
+# Usage:
+#     python benchmarks/bench_nodes.py [--menus N]
+
+import argparse
+import time
+import tracemalloc
+
+from axe_builder.models.models import MenuCommand, SubCommand
+from axe_builder.models.nodes import make_menunode, make_subnode, to_models
+from loguru import logger
+
+
+def pydantic_models(n: int) -> list:
+    return [
+        MenuCommand(
+            type="N",
+            operation="+",
+            count=i + 1,
+            subcommands=[SubCommand(type="T", operation="=", value="Title")],
+        )
+        for i in range(n)
+    ]
+
+
+def nodes(n: int) -> list:
+    return [
+        make_menunode("N", "+", i + 1, (make_subnode("T", "=", "Title"),))
+        for i in range(n)
+    ]
+
+
+def measure(build, n: int):
+    start = time.perf_counter()
+    build(n)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = build(n)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    # Each menu holds one subcommand: two nodes per menu
+    return n / elapsed, current / (2 * n)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Node vs model benchmark")
+    arg_parser.add_argument("--menus", type=int, default=100_000)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+
+    cases = [
+        ("pydantic models", pydantic_models),
+        ("nodes", nodes),
+    ]
+    for label, build in cases:
+        rate, bytes_per_node = measure(build, args.menus)
+        print(f"{label:>15}: {rate:10.0f} menus/s | {bytes_per_node:6.0f} B/node")
+
+    sample = nodes(args.menus)
+    start = time.perf_counter()
+    to_models(sample)
+    rate = args.menus / (time.perf_counter() - start)
+    print(f"{'to_models':>15}: {rate:10.0f} menus/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_parse_many.py
+# Measures AxeSyntaxParser.parse_many throughput for increasing worker counts.
+#
+# Usage:
+#     python benchmarks/bench_parse_many.py [--inputs N] [--max-workers N]
+
+import argparse
+import os
+import time
+
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import AxeSyntaxParser
+from loguru import logger
+
+
+def corpus(size: int):
+    # Distinct inputs, so neither the result cache nor the disk cache can help
+    for i in range(size):
+        yield (
+            f'[M={{{i % 9 + 1}}}]:[N+(T="Nested Menu {i}")={{{i % 7 + 1}}}]'
+            f":[N+(.)={{{i % 5 + 1}}}]:[M+{{{i + 1}}}]"
+        )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="parse_many throughput benchmark")
+    arg_parser.add_argument("--inputs", type=int, default=20000)
+    arg_parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument("--chunksize", type=int, default=256)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    inputs = list(corpus(args.inputs))
+
+    baseline = None
+    workers = 1
+    while workers <= args.max_workers:
+        parser = AxeSyntaxParser(
+            treeless=True, result_cache=ParseResultCache(max_entries=0)
+        )
+        start = time.perf_counter()
+        outcomes = parser.parse_many(
+            inputs, workers=workers, chunksize=args.chunksize)
+        elapsed = time.perf_counter() - start
+        assert all(outcome.error is None for outcome in outcomes)
+
+        rate = len(inputs) / elapsed
+        baseline = baseline or rate
+        print(
+            f"{workers:>3} worker(s): {rate:10.0f} parses/s "
+            f"({rate / baseline:4.2f}x)"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_table.py
+# Compares a MenuTable with a plain list of MenuCommand models for a large
+# menu set: memory, and the cost of typical aggregations and filters.
+#
+# Usage:
+#     python benchmarks/bench_table.py [--menus N]
+
+import argparse
+import time
+import tracemalloc
+from collections import Counter
+
+from axe_builder.models.nodes import MenuNode, SubNode, to_models
+from axe_builder.models.table import MenuTable
+from loguru import logger
+
+
+def menu_set(n: int) -> list:
+    return [
+        MenuNode(
+            "N" if i % 4 else "M",
+            "+",
+            i % 50 + 1,
+            (SubNode("T", "=", f"Title {i % 1000}"), SubNode(".", "=", None, 3)),
+        )
+        for i in range(n)
+    ]
+
+
+def traced(build):
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="MenuTable benchmark")
+    arg_parser.add_argument("--menus", type=int, default=200_000)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    nodes = menu_set(args.menus)
+    models, models_bytes = traced(lambda: to_models(nodes))
+    table, table_bytes = traced(lambda: MenuTable.from_commands(nodes))
+
+    print(f"menus: {args.menus}")
+    print(f"memory   models: {models_bytes / 2**20:8.1f} MiB")
+    print(f"memory    table: {table_bytes / 2**20:8.1f} MiB")
+
+    cases = [
+        (
+            "count by type",
+            lambda: Counter(menu.type for menu in models),
+            table.count_by_type,
+        ),
+        (
+            "filter N, count >= 25",
+            lambda: [
+                i
+                for i, menu in enumerate(models)
+                if menu.type == "N" and menu.count >= 25
+            ],
+            lambda: table.filter(type="N", min_count=25),
+        ),
+        (
+            "title lookup",
+            lambda: [
+                i
+                for i, menu in enumerate(models)
+                if any(sub.value == "Title 7" for sub in menu.subcommands)
+            ],
+            lambda: table.rows_with_title("Title 7"),
+        ),
+    ]
+    for label, on_models, on_table in cases:
+        print(
+            f"{label:>22}: models {timed(on_models):8.1f} ms | "
+            f"table {timed(on_table):8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmarks/bench_templates.py
+# Compares loading the CLI template once per export with a fresh Jinja
+# environment (the template is compiled every time) against the shared, cached
+# environment, in process and across processes (on-disk bytecode and
+# precompiled modules).
+#
+# Usage:
+#     python benchmarks/bench_templates.py [--exports N]
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from axe_builder.exporter.environment import (
+    TEMPLATE_DIR,
+    clear_environments,
+    get_environment,
+    precompile_templates,
+)
+from axe_builder.parser.disk_cache import CACHE_DIR_ENV
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from loguru import logger
+
+TEMPLATE = "cli_template.jinja2"
+
+# Loads and renders the bundled template once in a fresh interpreter
+COLD_START = (
+    "import sys; from loguru import logger; logger.remove(); "
+    "from axe_builder.exporter.environment import get_environment; "
+    f"get_environment(sys.argv[1]).get_template({TEMPLATE!r})"
+)
+
+
+def fresh_environment_load(template_dir: Path) -> None:
+    env = Environment(
+        loader=FileSystemLoader(searchpath=str(template_dir)),
+        autoescape=select_autoescape(["jinja2"]),
+    )
+    env.get_template(TEMPLATE)
+
+
+def cold_start(template_dir: Path, cache_dir: str, runs: int) -> float:
+    env = {CACHE_DIR_ENV: cache_dir, "PYTHONPATH": str(Path.cwd())}
+    start = time.perf_counter()
+    for _ in range(runs):
+        subprocess.run(
+            [sys.executable, "-c", COLD_START, str(template_dir)], env=env, check=True
+        )
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Template environment benchmark")
+    arg_parser.add_argument("--exports", type=int, default=500)
+    arg_parser.add_argument("--processes", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    with tempfile.TemporaryDirectory() as tmp:
+        template_dir = Path(tmp) / "templates"
+        shutil.copytree(TEMPLATE_DIR, template_dir)
+
+        start = time.perf_counter()
+        for _ in range(args.exports):
+            fresh_environment_load(template_dir)
+        fresh = (time.perf_counter() - start) * 1000
+
+        clear_environments()
+        start = time.perf_counter()
+        for _ in range(args.exports):
+            get_environment(template_dir).get_template(TEMPLATE)
+        shared = (time.perf_counter() - start) * 1000
+
+        cache_dir = str(Path(tmp) / "cache")
+        cold_start(template_dir, cache_dir, 1)  # fill the bytecode cache
+        bytecode = cold_start(template_dir, cache_dir, args.processes)
+        os.environ[CACHE_DIR_ENV] = cache_dir
+        precompile_templates(template_dir)
+        precompiled = cold_start(template_dir, cache_dir, args.processes)
+
+    print(f"template loads: {args.exports}")
+    print(f"fresh environment per export: {fresh:9.1f} ms")
+    print(f"shared environment:           {shared:9.1f} ms")
+    print(f"speedup: {fresh / shared:.1f}x")
+    print(f"new process, bytecode cache:  {bytecode:9.1f} ms/process")
+    print(f"new process, precompiled:     {precompiled:9.1f} ms/process")
+
+
+if __name__ == "__main__":
+    main()
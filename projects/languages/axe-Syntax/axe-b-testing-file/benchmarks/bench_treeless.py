@@ -0,0 +1,73 @@
+# benchmarks/bench_treeless.py
+# Compares the default tree-building parse path with the treeless (inline transformer) path.
+#
+# Usage:
+#     python benchmarks/bench_treeless.py [--iterations N]
+
+import argparse
+import time
+import tracemalloc
+
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import AxeSyntaxParser
+from loguru import logger
+
+SAMPLES = [
+    "[M+{3}]",
+    "[M={2}]:[N+{3}]",
+    '[M={1}]:(T="Menu One Title")',
+    "[M={1}]:[N+(.)={6}]",
+    '[M={1}]:[N+(T="Nested Menu 1 Title")={2}]:[N+(.)={4}]',
+]
+
+
+def _parse_all(parser: AxeSyntaxParser, iterations: int) -> None:
+    for _ in range(iterations):
+        for syntax in SAMPLES:
+            parser.parse(syntax)
+
+
+def bench(parser: AxeSyntaxParser, iterations: int) -> dict:
+    _parse_all(parser, 10)  # warm-up
+
+    start = time.perf_counter()
+    _parse_all(parser, iterations)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    _parse_all(parser, 1)
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocations = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    parses = iterations * len(SAMPLES)
+    return {
+        "us_per_parse": elapsed / parses * 1e6,
+        "peak_bytes": peak,
+        "live_blocks": allocations,
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Tree vs treeless parse benchmark")
+    arg_parser.add_argument("--iterations", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    # Measure parsing, not log formatting
+    logger.remove()
+
+    for label, treeless in (("tree", False), ("treeless", True)):
+        # A disabled result cache so every call pays the full parse cost
+        parser = AxeSyntaxParser(
+            treeless=treeless, result_cache=ParseResultCache(max_entries=0)
+        )
+        result = bench(parser, args.iterations)
+        print(
+            f"{label:>9}: {result['us_per_parse']:8.1f} us/parse | "
+            f"peak {result['peak_bytes']:>8} B | {result['live_blocks']:>6} live blocks"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_validate_syntax.py
+# Compares the single-pass check_syntax gate with a full Lark parse, for valid
+# input, for garbage, and for a large input with an error near its end.
+#
+# Usage:
+#     python benchmarks/bench_validate_syntax.py [--menus N] [--repeat N]
+
+import argparse
+import time
+
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import AxeSyntaxParser
+from axe_builder.utils.utils import check_syntax
+from loguru import logger
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def lark_rejects(parser: AxeSyntaxParser, syntax: str) -> None:
+    try:
+        parser.parse(syntax)
+    except (ValueError, RuntimeError):
+        pass
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="check_syntax benchmark")
+    arg_parser.add_argument("--menus", type=int, default=5000)
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+    parser = AxeSyntaxParser(result_cache=ParseResultCache(max_entries=0))
+    valid = ":".join(
+        f'[N+(T="Menu {i}")={{{i % 9 + 1}}}]:[N+(.)={{{i % 5 + 1}}}]'
+        for i in range(args.menus)
+    )
+    cases = [
+        ("valid", valid),
+        ("garbage", "<html>" + "x" * len(valid)),
+        ("error at end", valid + ":[N+{oops}]"),
+    ]
+    print(f"input: {len(valid) / 1024:.0f} KiB")
+    for label, syntax in cases:
+        gate = timed(lambda: check_syntax(syntax), args.repeat)
+        full = timed(lambda: lark_rejects(parser, syntax), max(1, args.repeat // 10))
+        print(
+            f"{label:>13}: check_syntax {gate:10.1f} us  "
+            f"lark parse {full:10.1f} us  ({full / gate:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/bench_validation.py
+# Measures the cost of validating 10k commands: the old triple validation
+# (pydantic constructors, then a full re-walk of the result) against the
+# pydantic constructors alone, which check each model once, as to_models does.
+# Building the parser's nodes, checked or trusted, is measured for reference.
+#
+# Usage:
+#     python benchmarks/bench_validation.py [--commands N] [--repeat N]
+
+import argparse
+import time
+
+from axe_builder.models.models import MenuCommand, SubCommand
+from axe_builder.models.nodes import make_menunode, make_subnode
+from axe_builder.models.validation import validate_commands
+from loguru import logger
+
+
+def constructors(n: int) -> list:
+    return [
+        MenuCommand(
+            type="N",
+            operation="+",
+            count=2,
+            subcommands=[SubCommand(type="T", operation="=", value=f"Title {i}")],
+        )
+        for i in range(n)
+    ]
+
+
+def constructors_and_rewalk(n: int) -> None:
+    validate_commands(constructors(n))
+
+
+def nodes(n: int, trusted: bool = False) -> list:
+    return [
+        make_menunode(
+            "N",
+            "+",
+            2,
+            (make_subnode("T", "=", f"Title {i}", trusted=trusted),),
+            trusted=trusted,
+        )
+        for i in range(n)
+    ]
+
+
+def bench(fn, n: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(n)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 * 10_000 / n
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="Validation cost benchmark")
+    arg_parser.add_argument("--commands", type=int, default=10_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logger.remove()
+
+    cases = [
+        ("pydantic + re-walk", constructors_and_rewalk),
+        ("constructors", constructors),
+        ("checked nodes", nodes),
+        ("trusted nodes", lambda n: nodes(n, trusted=True)),
+    ]
+    baseline = None
+    for label, fn in cases:
+        ms = bench(fn, args.commands, args.repeat)
+        baseline = baseline or ms
+        print(f"{label:>18}: {ms:8.2f} ms per 10k commands ({baseline / ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 # tests/cli/test_cli.py
 
-from unittest.mock import patch
-
 from axe_builder.cli import app
+from axe_builder.logger import trace
+from axe_builder.parser.parser import get_parser
 from typer.testing import CliRunner
 
 runner = CliRunner()
@@ -10,7 +10,7 @@
 
 def test_parse_command_success():
     syntax = "[M+{2}]:[N+{3}]"
-    result = runner.invoke(app, ["parse-command", syntax])
+    result = runner.invoke(app, ["parse", syntax])
     assert result.exit_code == 0
     assert '"type": "M"' in result.stdout
     assert '"operation": "' in result.stdout
@@ -19,19 +19,69 @@ def test_parse_command_success():
 
 def test_parse_command_failure():
     syntax = "[X+{2}]"
-    result = runner.invoke(app, ["parse-command", syntax])
+    result = runner.invoke(app, ["parse", syntax])
     assert result.exit_code != 0
     assert "Error" in result.stderr
+    # Rejected by the syntax check, with the position of the error
+    assert "line 1, column 2" in result.stderr
+
+
+def test_parse_command_fast():
+    result = runner.invoke(app, ["parse", "--fast", "[M+{2}]:[N+{3}]"])
+    assert result.exit_code == 0
+    assert '"count": 3' in result.stdout
+
+
+def test_parse_command_stream(tmp_path):
+    path = tmp_path / "menus.axe"
+    path.write_text("[M+{2}]\n\n[N+{3}]\n")
+    result = runner.invoke(app, ["parse", "--file", str(path), "--stream"])
+    assert result.exit_code == 0
+    assert '"count": 2' in result.stdout
+    assert '"count": 3' in result.stdout
+
+    path.write_text("[M+{2}]\n[X]\n")
+    result = runner.invoke(app, ["parse", "--file", str(path), "--stream"])
+    assert result.exit_code != 0
+    assert "Error" in result.stderr
+
+
+def test_parse_command_stream_requires_file():
+    result = runner.invoke(app, ["parse", "--stream", "[M+{2}]"])
+    assert result.exit_code != 0
+    assert "--stream requires --file" in result.stderr
+
 
+def test_parse_command_cache_dir(tmp_path):
+    cache_dir = tmp_path / "cache"
+    syntax = "[M={7}]:[N+{5}]:[N={9}]"
+    result = runner.invoke(app, ["--cache-dir", str(cache_dir), "parse", syntax])
+    assert result.exit_code == 0
+    assert list(cache_dir.iterdir())
+    # The shared parsers do not pick up the option
+    for fast in (False, True):
+        disk_cache = get_parser(fast=fast).disk_cache
+        assert disk_cache is None or disk_cache.directory != cache_dir
+
+
+def test_production_flag_is_scoped_to_the_invocation():
+    assert not trace.is_production_mode()
+    result = runner.invoke(app, ["--production", "parse", "[M+{2}]"])
+    assert result.exit_code == 0
+    assert not trace.is_production_mode()
 
-def test_build_command_success():
+
+def test_build_command_success(tmp_path):
     syntax = "[M={1}]:[N+{2}]"
-    output = "test_cli.py"
-    with patch("axe_builder.exporter.exporter.export_cli_template") as mock_export:
-        result = runner.invoke(app, ["build", syntax, "--output", output])
-        assert result.exit_code == 0
-        assert f"CLI template exported to {output}" in result.stdout
-        mock_export.assert_called_once()
+    output = str(tmp_path / "test_cli.py")
+    result = runner.invoke(app, ["build", syntax, "--output", output])
+    assert result.exit_code == 0
+    assert f"CLI template exported to {output}" in result.stdout
+
+    # Nothing changed: the second build is skipped
+    result = runner.invoke(app, ["build", syntax, "--output", output])
+    assert result.exit_code == 0
+    assert "is up to date" in result.stdout
 
 
 def test_build_command_failure():
@@ -42,6 +92,19 @@ def test_build_command_failure():
     assert "Error" in result.stderr
 
 
+def test_build_all_command(tmp_path):
+    for i in range(3):
+        (tmp_path / f"menu{i}.axe").write_text(f"[M={{{i + 1}}}]:[N+{{2}}]")
+    out = str(tmp_path / "out")
+    args = ["build-all", str(tmp_path), "--output-dir", out, "-j", "1"]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "3 written" in result.stdout
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "3 up to date" in result.stdout
+
+
 def test_tui_command():
     syntax = "[M+{1}]:[N+{2}]"
     result = runner.invoke(app, ["tui", syntax])
@@ -0,0 +1,123 @@
+# tests/exporter/test_ast_exporter.py
+
+import ast
+
+import pytest
+from axe_builder.exporter.ast_exporter import (
+    CliModuleBuilder,
+    build_cli_module,
+    compile_cli_module,
+    export_cli_ast,
+)
+from axe_builder.models.models import MenuCommand, SubCommand
+from axe_builder.models.nodes import MenuNode, SubNode
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+MENUS = [
+    MenuNode("M", "=", 1, (SubNode("T", "=", 'Say "hi" {there}\n \\ """'),)),
+    SubNode("T", "=", "Chained title"),
+    MenuNode("N", "+", 2, (SubNode(".", "=", None, 6), SubNode(".", "=", None, 6))),
+    MenuNode("M", "=", 1, (SubNode("T", "=", 'Say "hi" {there}\n \\ """'),)),
+]
+
+_sub = st.one_of(
+    st.builds(SubNode, st.just("T"), st.just("="), st.text(max_size=20)),
+    st.builds(
+        SubNode, st.just("."), st.just("="), st.none(), st.integers(1, 99) | st.none()
+    ),
+)
+_menu = st.builds(
+    MenuNode,
+    st.sampled_from(["M", "N"]),
+    st.sampled_from(["+", "="]),
+    st.integers(1, 99) | st.none(),
+    st.lists(_sub, max_size=3).map(tuple),
+)
+
+
+def _commands(code) -> dict:
+    namespace = {"__name__": "generated_cli"}
+    exec(code, namespace)
+    commands = namespace["app"].registered_commands
+    return {command.name: command.callback for command in commands}
+
+
+def test_generated_module_registers_unique_commands():
+    commands = _commands(compile_cli_module(MENUS))
+    assert list(commands) == [
+        "M1",
+        "M1_T_1",
+        "M1_T_2",
+        "N2",
+        "N2_custom6_1",
+        "N2_custom6_2",
+        "M1_2",
+        "M1_2_T_1",
+    ]
+    assert len({callback.__name__ for callback in commands.values()}) == len(commands)
+
+
+def test_values_are_emitted_as_constants(capsys):
+    commands = _commands(compile_cli_module(MENUS))
+    commands["M1_T_1"](input="x")
+    assert capsys.readouterr().out == 'Say "hi" {there}\n \\ """\n'
+
+
+def test_identical_subcommands_share_a_body():
+    builder = CliModuleBuilder()
+    functions = [
+        stmt for stmt in builder.statements(MENUS) if isinstance(stmt, ast.FunctionDef)
+    ]
+    by_name = {function.name: function for function in functions}
+    assert by_name["m1_t_1"].body is by_name["m1_2_t_1"].body
+    assert by_name["n2_custom6_1"].body is by_name["n2_custom6_2"].body
+    assert by_name["m1"].body is by_name["m1_2"].body
+    assert builder.reused_bodies == 3
+
+
+@pytest.mark.parametrize("max_cached_bodies", [0, 1, 1024])
+def test_bounded_body_cache_builds_same_module(max_cached_bodies):
+    builder = CliModuleBuilder(max_cached_bodies=max_cached_bodies)
+    module = ast.Module(body=list(builder.statements(MENUS)), type_ignores=[])
+    assert ast.dump(module) == ast.dump(build_cli_module(MENUS))
+
+
+def test_types_must_form_identifiers():
+    with pytest.raises(ValueError, match="Cannot name a command"):
+        build_cli_module([MenuNode("M-", "=", 1)])
+
+
+def test_export_matches_module(tmp_path):
+    output = tmp_path / "cli.py"
+    result = export_cli_ast(MENUS, str(output))
+    source = output.read_text(encoding="utf-8")
+    assert result.changed and result.characters == len(source)
+    assert ast.dump(ast.parse(source)) == ast.dump(build_cli_module(MENUS))
+
+    result = export_cli_ast(MENUS, str(output), skip_unchanged=True)
+    assert not result.changed
+
+
+def test_accepts_models():
+    models = [
+        MenuCommand(
+            type="M",
+            operation="+",
+            count=2,
+            subcommands=[SubCommand(type="T", operation="=", value="Title")],
+        )
+    ]
+    assert list(_commands(compile_cli_module(models))) == ["M2", "M2_T_1"]
+
+
+@settings(max_examples=200, deadline=None)
+@given(st.lists(st.one_of(_menu, _sub), max_size=8))
+def test_output_is_always_valid_python(menus):
+    module = build_cli_module(menus)
+    source = ast.unparse(module)
+    compile(source, "<generated>", "exec")
+    compile(module, "<generated>", "exec")
+
+    exported = "".join(CliModuleBuilder().source_chunks(menus))
+    assert ast.dump(ast.parse(exported)) == ast.dump(module)
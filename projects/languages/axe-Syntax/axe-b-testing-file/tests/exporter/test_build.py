@@ -0,0 +1,203 @@
+# tests/exporter/test_build.py
+
+import os
+
+import pytest
+from axe_builder.exporter import build
+from axe_builder.exporter.build import (
+    FAILED,
+    MANIFEST_NAME,
+    SKIPPED,
+    UNCHANGED,
+    WRITTEN,
+    BuildManifest,
+    BuildTarget,
+    build_all,
+    build_key,
+    build_output,
+    collect_targets,
+)
+
+SYNTAX = '[M={1}]:(T="Menu One Title"):[N+{2}]'
+
+
+@pytest.fixture
+def output(tmp_path):
+    return tmp_path / "cli.py"
+
+
+def test_build_key_covers_every_input(monkeypatch):
+    key = build_key(SYNTAX)
+    assert build_key(SYNTAX) == key
+    assert build_key(SYNTAX + ":[N+{3}]") != key
+    assert build_key(SYNTAX, backend="ast") != key
+    monkeypatch.setattr(build, "EXPORTER_VERSION", "other")
+    assert build_key(SYNTAX) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(build, "grammar_version", lambda: "other")
+    assert build_key(SYNTAX) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(build, "template_set_hash", lambda: "other")
+    assert build_key(SYNTAX) != key
+
+
+def test_build_records_and_skips(output):
+    manifest = BuildManifest.load(output.parent)
+    key = build_key(SYNTAX)
+    assert not manifest.is_current(output, key)
+
+    result = build_output(SYNTAX, output, manifest, key=key)
+    assert result.status == WRITTEN
+    assert output.exists()
+    manifest.save()
+
+    reloaded = BuildManifest.load(output.parent)
+    assert reloaded.entries == manifest.entries
+    assert reloaded.is_current(output, key)
+    assert not reloaded.is_current(output, build_key(SYNTAX + ":[N+{3}]"))
+
+
+def test_rebuild_with_same_bytes_keeps_mtime(output):
+    manifest = BuildManifest(output.parent)
+    build_output(SYNTAX, output, manifest)
+    stat = output.stat()
+    os.utime(output, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    mtime = output.stat().st_mtime_ns
+
+    # A different key (e.g. a new exporter version) with identical output
+    result = build_output(SYNTAX, output, manifest, key="new-key")
+    assert result.status == UNCHANGED
+    assert output.stat().st_mtime_ns == mtime
+    assert manifest.is_current(output, "new-key")
+
+
+def test_edited_output_is_not_current(output):
+    manifest = BuildManifest(output.parent)
+    key = build_key(SYNTAX)
+    build_output(SYNTAX, output, manifest, key=key)
+    output.write_text("edited by hand")
+    assert not manifest.is_current(output, key)
+
+    output.unlink()
+    assert not manifest.is_current(output, key)
+
+
+def test_switching_backend_rebuilds(output):
+    manifest = BuildManifest(output.parent)
+    build_output(SYNTAX, output, manifest)
+    key = build_key(SYNTAX, backend="ast")
+    assert not manifest.is_current(output, key)
+    result = build_output(SYNTAX, output, manifest, key=key, backend="ast")
+    assert result.status == WRITTEN
+    assert "@app.command(name='M1'" in output.read_text()
+    with pytest.raises(ValueError, match="Unknown exporter backend"):
+        build_output(SYNTAX, output, manifest, backend="text")
+
+
+def test_unreadable_manifest_is_empty(tmp_path):
+    (tmp_path / MANIFEST_NAME).write_text("{not json")
+    assert BuildManifest.load(tmp_path).entries == {}
+    (tmp_path / MANIFEST_NAME).write_text('{"format": 0, "outputs": {"a": {}}}')
+    assert BuildManifest.load(tmp_path).entries == {}
+
+
+def test_invalid_syntax_leaves_manifest_alone(output):
+    manifest = BuildManifest(output.parent)
+    with pytest.raises(ValueError):
+        build_output("[X+{2}]", output, manifest)
+    assert manifest.entries == {}
+    assert not output.exists()
+
+
+@pytest.fixture
+def sources(tmp_path):
+    menus = tmp_path / "menus"
+    (menus / "sub").mkdir(parents=True)
+    for i in range(1, 4):
+        (menus / f"m{i}.axe").write_text(f'[M={{1}}]:(T="Menu {i}"):[N+{{{i}}}]\n')
+    (menus / "sub" / "s.axe").write_text("[M={1}]")
+    (menus / "notes.txt").write_text("not an input")
+    return menus
+
+
+def test_collect_targets_from_directory_and_glob(sources, tmp_path):
+    out = tmp_path / "out"
+    targets = collect_targets([str(sources)], out, pattern="{stem}_cli.py")
+    assert [t.output.relative_to(out).as_posix() for t in targets] == [
+        "m1_cli.py",
+        "m2_cli.py",
+        "m3_cli.py",
+        "sub/s_cli.py",
+    ]
+    # A glob keeps paths relative to its fixed part; duplicates are dropped
+    patterns = [str(sources / "**" / "*.axe"), str(sources / "m1.axe")]
+    globbed = collect_targets(patterns, out, pattern="{stem}_cli.py")
+    assert globbed == targets
+
+    beside = collect_targets([str(sources / "m1.axe")])
+    assert beside == [BuildTarget(sources / "m1.axe", sources / "m1.py")]
+
+
+def test_collect_targets_errors(sources, tmp_path):
+    with pytest.raises(ValueError, match="No input files"):
+        collect_targets([str(tmp_path / "missing" / "*.axe")])
+    with pytest.raises(ValueError, match="Invalid output pattern"):
+        collect_targets([str(sources)], pattern="{path}.py")
+    with pytest.raises(ValueError, match="both map to"):
+        collect_targets([str(sources)], tmp_path / "out", pattern="cli.py")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_all(sources, tmp_path, workers):
+    (sources / "sub" / "bad.axe").write_text("[X+{2}]")
+    targets = collect_targets([str(sources)], tmp_path / "out")
+    summary = build_all(targets, workers=workers)
+    assert [o.status for o in summary.outcomes] == [WRITTEN] * 3 + [FAILED, WRITTEN]
+    assert "4 written, 0 unchanged, 0 up to date, 1 failed" in summary.format()
+    # Rejected by check_syntax, as in the single-input commands
+    assert (
+        "bad.axe: Invalid axe:Syntax input at line 1, column 2: Unexpected 'X'"
+        in summary.format()
+    )
+    assert (tmp_path / "out" / "sub" / "s.py").exists()
+
+    # Only the changed input is rebuilt
+    (sources / "m2.axe").write_text("[M={2}]")
+    summary = build_all(targets, workers=workers)
+    statuses = [o.status for o in summary.outcomes]
+    assert statuses == [SKIPPED, WRITTEN, SKIPPED, FAILED, SKIPPED]
+
+    summary = build_all(targets, workers=workers, force=True)
+    assert summary.count(UNCHANGED) == 4
+
+
+def test_build_all_sizes_the_pool_to_the_pending_targets(
+    sources, tmp_path, monkeypatch
+):
+    pools = []
+
+    class RecordingExecutor:
+        def __init__(self, max_workers, initializer, initargs):
+            pools.append(max_workers)
+            initializer(*initargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, jobs, chunksize):
+            return map(fn, jobs)
+
+    monkeypatch.setattr(build, "ProcessPoolExecutor", RecordingExecutor)
+    targets = collect_targets([str(sources)], tmp_path / "out")
+    summary = build_all(targets, workers=8)
+    assert pools == [4]
+    assert "with 4 worker(s)" in summary.format()
+
+    # One stale target is built in this process, and reported as such
+    (sources / "m2.axe").write_text("[M={2}]")
+    summary = build_all(targets, workers=8)
+    assert pools == [4]
+    assert "with 1 worker(s)" in summary.format()
@@ -0,0 +1,116 @@
+# tests/exporter/test_environment.py
+
+import os
+
+import pytest
+from axe_builder.exporter import environment
+from axe_builder.exporter.environment import (
+    clear_environments,
+    compiled_templates_path,
+    get_environment,
+    precompile_templates,
+)
+from jinja2 import ChoiceLoader, FileSystemLoader
+
+
+@pytest.fixture(autouse=True)
+def fresh_environments(tmp_path, monkeypatch):
+    monkeypatch.setenv(environment.CACHE_DIR_ENV, str(tmp_path / "cache"))
+    clear_environments()
+    yield
+    clear_environments()
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    directory = tmp_path / "templates"
+    directory.mkdir()
+    (directory / "menu.jinja2").write_text(
+        "{% for idx, menu in enumerate(menus, start=1) %}"
+        "{{ idx }}:{{ menu }}{{ ',' }}{% endfor %}"
+    )
+    return directory
+
+
+def test_environment_is_shared_per_directory(template_dir, tmp_path):
+    other = tmp_path / "other"
+    other.mkdir()
+    env = get_environment(template_dir)
+    assert get_environment(str(template_dir)) is env
+    assert get_environment(other) is not env
+    assert get_environment() is get_environment(environment.TEMPLATE_DIR)
+
+
+def test_template_is_compiled_once(template_dir, monkeypatch):
+    env = get_environment(template_dir)
+    compiled = []
+    original = env.compile
+    monkeypatch.setattr(
+        env, "compile", lambda *a, **kw: compiled.append(a) or original(*a, **kw)
+    )
+    template = env.get_template("menu.jinja2")
+    assert template.render(menus=["M", "N"]) == "1:M,2:N,"
+    assert env.get_template("menu.jinja2") is template
+    # The bytecode cache was empty, so the template was compiled exactly once
+    assert len(compiled) == 1
+
+
+def test_bytecode_is_cached_on_disk(template_dir, tmp_path, monkeypatch):
+    get_environment(template_dir).get_template("menu.jinja2")
+    assert list((tmp_path / "cache" / "templates").glob("__jinja2_*.cache"))
+
+    # A fresh environment loads the bytecode instead of compiling
+    clear_environments()
+    env = get_environment(template_dir)
+    monkeypatch.setattr(env, "compile", lambda *a, **kw: pytest.fail("compiled"))
+    assert env.get_template("menu.jinja2").render(menus=["M"]) == "1:M,"
+
+
+def test_changed_template_is_reloaded(template_dir):
+    env = get_environment(template_dir)
+    assert env.get_template("menu.jinja2").render(menus=["M"]) == "1:M,"
+    path = template_dir / "menu.jinja2"
+    path.write_text("{{ menus | length }}")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert env.get_template("menu.jinja2").render(menus=["M"]) == "1"
+
+
+def test_precompiled_templates_are_used_until_stale(template_dir, tmp_path):
+    compiled_dir = precompile_templates(template_dir)
+    assert compiled_dir == compiled_templates_path(template_dir)
+    assert (tmp_path / "cache" / "templates") in compiled_dir.parents
+    assert list(compiled_dir.glob("tmpl_*.py"))
+    # Nothing is written next to the templates
+    assert [path.name for path in template_dir.iterdir()] == ["menu.jinja2"]
+
+    env = get_environment(template_dir)
+    assert isinstance(env.loader, ChoiceLoader)
+    assert env.get_template("menu.jinja2").render(menus=["M"]) == "1:M,"
+
+    (template_dir / "menu.jinja2").write_text("{{ menus | length }}")
+    clear_environments()
+    env = get_environment(template_dir)
+    assert isinstance(env.loader, FileSystemLoader)
+    assert env.get_template("menu.jinja2").render(menus=["M"]) == "1"
+
+
+def test_precompile_skips_broken_templates(template_dir):
+    (template_dir / "broken.jinja2").write_text("{% endmacro %}")
+    compiled_dir = precompile_templates(template_dir)
+    assert len(list(compiled_dir.glob("tmpl_*.py"))) == 1
+    env = get_environment(template_dir)
+    assert env.get_template("menu.jinja2").render(menus=["M"]) == "1:M,"
+
+
+def test_precompile_missing_directory(tmp_path):
+    with pytest.raises(ValueError, match="not found"):
+        precompile_templates(tmp_path / "missing")
+
+
+def test_precompile_needs_a_cache_dir(template_dir, monkeypatch):
+    monkeypatch.delenv(environment.CACHE_DIR_ENV)
+    assert compiled_templates_path(template_dir) is None
+    with pytest.raises(ValueError, match=environment.CACHE_DIR_ENV):
+        precompile_templates(template_dir)
+    assert isinstance(get_environment(template_dir).loader, FileSystemLoader)
@@ -1,13 +1,17 @@
 # tests/exporter/test_exporter.py
 
-from unittest.mock import mock_open, patch
+import hashlib
+import os
 
-from axe_builder.exporter.exporter import export_cli_template
+import pytest
+from axe_builder.exporter import exporter
+from axe_builder.exporter.exporter import export_cli_template, write_atomic
 from axe_builder.models.models import MenuCommand, SubCommand
 
 
-def test_export_cli_template():
-    parsed_commands = [
+@pytest.fixture
+def parsed_commands():
+    return [
         MenuCommand(
             type="M",
             operation="+",
@@ -24,9 +28,64 @@ def test_export_cli_template():
             subcommands=[SubCommand(type=".", operation="+", count=6)],
         ),
     ]
-    m = mock_open()
-    with patch("builtins.open", m):
-        export_cli_template(parsed_commands, "dummy_output.py")
-        m.assert_called_once_with("dummy_output.py", "w")
-        handle = m()
-        handle.write.assert_called()
+
+
+def test_export_cli_template(parsed_commands, tmp_path):
+    output = tmp_path / "dummy_output.py"
+    export_cli_template(parsed_commands, str(output))
+    source = output.read_text(encoding="utf-8")
+    compile(source, str(output), "exec")
+    assert '@app.command(name="M2"' in source
+    assert '@app.command(name="N3"' in source
+    assert 'typer.echo("Main Menu Title")' in source
+    assert os.listdir(tmp_path) == ["dummy_output.py"]
+
+
+def test_export_failure_keeps_previous_output(parsed_commands, tmp_path, monkeypatch):
+    output = tmp_path / "cli.py"
+    output.write_text("previous")
+
+    def failing_chunks():
+        yield "partial"
+        raise RuntimeError("render failed")
+
+    with pytest.raises(RuntimeError, match="render failed"):
+        write_atomic(output, failing_chunks())
+    assert output.read_text() == "previous"
+    assert os.listdir(tmp_path) == ["cli.py"]
+
+
+def test_write_atomic_streams_through_small_buffer(tmp_path):
+    output = tmp_path / "big.py"
+    chunks = (f"line {i}\n" for i in range(10_000))
+    result = write_atomic(output, chunks, buffer_size=64)
+    text = output.read_text()
+    assert result.characters == len(text)
+    assert result.changed
+    assert text.count("\n") == 10_000
+
+
+def test_write_atomic_keeps_file_mode(tmp_path, monkeypatch):
+    output = tmp_path / "cli.py"
+    output.write_text("old")
+    output.chmod(0o754)
+    write_atomic(output, ["new"])
+    assert output.read_text() == "new"
+    assert output.stat().st_mode & 0o777 == 0o754
+
+    # A new output gets the umask's default mode, without touching the umask
+    probe = tmp_path / "probe.py"
+    probe.write_text("")
+    monkeypatch.setattr(os, "umask", None)
+    fresh = tmp_path / "fresh.py"
+    write_atomic(fresh, ["x"])
+    assert fresh.stat().st_mode & 0o777 == probe.stat().st_mode & 0o777
+
+
+def test_write_atomic_hashes_while_writing(tmp_path, monkeypatch):
+    output = tmp_path / "cli.py"
+    chunks = [f"line {i} \u00e9\n" for i in range(1_000)]
+    monkeypatch.setattr(exporter, "file_digest", None)
+    result = write_atomic(output, chunks, buffer_size=64)
+    assert result.characters == len("".join(chunks))
+    assert result.digest == hashlib.sha256(output.read_bytes()).hexdigest()
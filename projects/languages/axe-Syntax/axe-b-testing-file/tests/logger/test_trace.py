@@ -0,0 +1,44 @@
+# tests/logger/test_trace.py
+
+import pytest
+from axe_builder.logger import trace
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import AxeSyntaxParser
+from loguru import logger
+
+
+@pytest.fixture
+def messages():
+    captured = []
+    handler_id = logger.add(captured.append, level="DEBUG", format="{message}")
+    yield captured
+    logger.remove(handler_id)
+    trace.set_production_mode(False)
+
+
+@pytest.fixture
+def parser():
+    return AxeSyntaxParser(
+        treeless=True, result_cache=ParseResultCache(max_entries=0)
+    )
+
+
+def test_trace_messages_are_formatted_when_enabled(parser, messages):
+    parser.parse('[N+(T="Title")={2}]')
+    assert any("value parsed: Title" in message for message in messages)
+    assert any("Created MenuCommand: MenuNode(type='N'" in message for message in messages)
+
+
+def test_production_mode_drops_trace_messages(parser, messages):
+    trace.set_production_mode(True)
+    assert trace.is_production_mode()
+    parser.parse('[N+(T="Title")={2}]')
+    assert messages == []
+
+
+def test_production_mode_is_restored(parser, messages):
+    with trace.production_mode():
+        assert trace.is_production_mode()
+        parser.parse('[N+(T="Title")={2}]')
+    assert messages == []
+    assert not trace.is_production_mode()
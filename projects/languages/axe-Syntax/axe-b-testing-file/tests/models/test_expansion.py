@@ -0,0 +1,66 @@
+# tests/models/test_expansion.py
+
+import pytest
+from axe_builder.models.expansion import (
+    CountExpansion,
+    ExpandedNode,
+    ExpansionLimitError,
+    expanded_size,
+)
+from axe_builder.models.nodes import MenuNode, SubNode, to_models
+
+CUSTOM = SubNode(".", "=", None, 3)
+TITLE = SubNode("T", "=", "Title")
+NODES = [
+    MenuNode("M", "=", 2),
+    MenuNode("N", "+", 2, (TITLE, CUSTOM)),
+    SubNode(".", "=", None, 2),
+]
+
+
+def test_size_is_known_before_expanding():
+    # 1 selected menu, 2 nested menus of 1 + 1 + 3 items, 2 top-level customs
+    assert expanded_size(NODES) == 1 + 2 * 5 + 2
+    assert expanded_size(to_models(NODES)) == 13
+    assert len(CountExpansion(NODES)) == 13
+
+
+def test_iteration_order():
+    items = list(CountExpansion(NODES))
+    assert items[:7] == [
+        ExpandedNode(0, 1, 1, NODES[0]),
+        ExpandedNode(1, 1, 1, NODES[1]),
+        ExpandedNode(1, 1, 1, TITLE),
+        ExpandedNode(1, 1, 1, CUSTOM),
+        ExpandedNode(1, 1, 2, CUSTOM),
+        ExpandedNode(1, 1, 3, CUSTOM),
+        ExpandedNode(1, 2, 2, NODES[1]),
+    ]
+    assert items[-1] == ExpandedNode(2, 0, 2, NODES[2])
+
+
+def test_random_access_matches_iteration():
+    expansion = CountExpansion(NODES)
+    assert [expansion[i] for i in range(len(expansion))] == list(expansion)
+    assert expansion[-1] == expansion[12]
+    assert list(expansion.window(5, 8)) == list(expansion)[5:8]
+    with pytest.raises(IndexError):
+        expansion[13]
+
+
+def test_huge_counts_stay_lazy():
+    expansion = CountExpansion(
+        [MenuNode("N", "+", 10**6, (SubNode(".", "=", None, 10**6),))],
+        max_items=None,
+    )
+    assert len(expansion) == 10**6 * (10**6 + 1)
+    assert expansion[len(expansion) - 1].copy == 10**6
+
+
+def test_limits_are_enforced_up_front():
+    with pytest.raises(ExpansionLimitError) as exc_info:
+        CountExpansion(NODES, max_items=12)
+    assert (exc_info.value.size, exc_info.value.limit) == (13, 12)
+    with pytest.raises(ExpansionLimitError):
+        CountExpansion(NODES, max_count=2)
+    assert len(CountExpansion(NODES, max_items=13, max_count=3)) == 13
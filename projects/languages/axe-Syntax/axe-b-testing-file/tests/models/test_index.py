@@ -0,0 +1,70 @@
+# tests/models/test_index.py
+
+import pytest
+from axe_builder.models.index import MenuIndex
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import AxeSyntaxParser
+
+SYNTAX = (
+    '[M+(T="Main")={2}]:[N+(.)={3}]:[N+(T="Nested")={1}]:(T="Chained")'
+    ':[M={1}]:[N+(.)={2}]:[N+(T="Nested")={4}]'
+)
+
+
+@pytest.fixture
+def index():
+    parser = AxeSyntaxParser(result_cache=ParseResultCache(max_entries=0))
+    return MenuIndex.from_commands(parser.parse_nodes(SYNTAX))
+
+
+def test_paths_and_parents(index):
+    assert index.paths == [
+        "M1",
+        "M1/T1",
+        "M1/N1",
+        "M1/N1/.1",
+        "M1/N2",
+        "M1/N2/T1",
+        "M1/N2/T2",
+        "M2",
+        "M2/N1",
+        "M2/N1/.1",
+        "M2/N2",
+        "M2/N2/T1",
+    ]
+    assert index.roots() == (0, 7)
+    assert index.parent(0) is None
+    assert index.parent(index.lookup("M2/N1/.1")) == index.lookup("M2/N1")
+    assert index.children(index.lookup("M1")) == (1, 2, 4)
+
+
+def test_lookup(index):
+    assert index.get("M2/N1/.1").count == 2
+    assert index.get("/M1/N2/T2/").value == "Chained"
+    assert index.get("M3") is None
+    with pytest.raises(KeyError):
+        index.lookup("M1/N9")
+
+
+def test_titled(index):
+    assert [index.path(entry) for entry in index.titled("Nested")] == ["M1/N2", "M2/N2"]
+    assert index.titled("Missing") == []
+
+
+def test_subtree(index):
+    assert [index.path(e) for e in index.subtree(index.lookup("M1/N2"))] == [
+        "M1/N2",
+        "M1/N2/T1",
+        "M1/N2/T2",
+    ]
+    assert list(index.subtree(0)) == list(range(7))
+
+
+def test_parser_caches_index_with_result():
+    cache = ParseResultCache()
+    parser = AxeSyntaxParser(result_cache=cache)
+    first = parser.parse_index(SYNTAX)
+    assert parser.parse_index(SYNTAX) is first
+    assert cache.stats()["entries"] == 1
+    cache.clear()
+    assert parser.parse_index(SYNTAX) is not first
@@ -0,0 +1,75 @@
+# tests/models/test_loader.py
+
+import json
+
+import pytest
+from axe_builder.models.loader import (
+    CommandLoadError,
+    commands_adapter,
+    dump_commands,
+    load_commands,
+)
+from axe_builder.models.models import MenuCommand, SubCommand
+
+
+def sample_menus():
+    return [
+        MenuCommand(
+            type="M",
+            operation="+",
+            count=2,
+            subcommands=[SubCommand(type="T", operation="=", value="Main Menu")],
+        ),
+        MenuCommand(
+            type="N",
+            operation="+",
+            subcommands=[SubCommand(type=".", operation="=", count=3)],
+        ),
+    ]
+
+
+def test_round_trip():
+    menus = sample_menus()
+    assert load_commands(dump_commands(menus)) == menus
+
+
+def test_load_decoded_list():
+    menus = sample_menus()
+    data = json.loads(dump_commands(menus))
+    assert load_commands(data) == menus
+
+
+def test_adapter_is_shared():
+    assert commands_adapter() is commands_adapter()
+
+
+def test_lax_mode_coerces():
+    payload = '[{"type": "M", "operation": "+", "count": "2"}]'
+    assert load_commands(payload)[0].count == 2
+
+
+def test_strict_mode_rejects_coercion():
+    payload = '[{"type": "M", "operation": "+", "count": "2"}]'
+    with pytest.raises(CommandLoadError) as exc_info:
+        load_commands(payload, strict=True)
+    assert exc_info.value.errors[0]["loc"] == (0, "count")
+
+
+def test_errors_are_aggregated_with_paths():
+    payload = json.dumps(
+        [
+            {"type": "M", "operation": "+", "count": 1},
+            {"type": "X"},
+            {"type": "N", "operation": "+", "subcommands": [{"type": "T"}]},
+        ]
+    )
+    with pytest.raises(CommandLoadError) as exc_info:
+        load_commands(payload, strict=True)
+    locs = [error["loc"] for error in exc_info.value.errors]
+    assert locs == [(1,), (2, "subcommands", 0)]
+    assert "2.subcommands.0" in str(exc_info.value)
+
+
+def test_invalid_json():
+    with pytest.raises(CommandLoadError):
+        load_commands("[{")
@@ -0,0 +1,103 @@
+# tests/models/test_nodes.py
+
+import pytest
+from axe_builder.models.models import MenuCommand, SubCommand
+from axe_builder.models.nodes import (
+    MenuNode,
+    NodeInterner,
+    SubNode,
+    from_models,
+    make_menunode,
+    make_subnode,
+    structural_hash,
+    to_models,
+)
+from axe_builder.models.validation import CommandValidationError
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import AxeSyntaxParser
+
+
+def test_nodes_round_trip_through_models():
+    nodes = [
+        make_menunode("N", "+", 2, [make_subnode("T", "=", "Title")]),
+        make_subnode(".", "=", None, 3),
+    ]
+    models = to_models(nodes)
+    assert models == [
+        MenuCommand(
+            type="N",
+            operation="+",
+            count=2,
+            subcommands=[SubCommand(type="T", operation="=", value="Title")],
+        ),
+        SubCommand(type=".", operation="=", count=3),
+    ]
+    assert from_models(models) == nodes
+
+
+def test_nodes_are_immutable_and_slotted():
+    node = make_menunode("M", "+", 3)
+    with pytest.raises(AttributeError):
+        node.count = 4
+    assert not hasattr(node, "__dict__")
+    assert node._replace(count=4).count == 4
+
+
+def test_node_builders_validate():
+    with pytest.raises(CommandValidationError):
+        make_subnode("T")
+    with pytest.raises(CommandValidationError):
+        make_menunode("M", "+")
+
+
+def test_parse_nodes_matches_parse():
+    parser = AxeSyntaxParser(result_cache=ParseResultCache(max_entries=0))
+    syntax = '[M={1}]:[N+(T="Nested Title")={2}]:[N+(.)={6}]:(T="Top")'
+    nodes = parser.parse_nodes(syntax)
+    assert [type(node) for node in nodes] == [MenuNode, MenuNode, MenuNode, SubNode]
+    assert to_models(nodes) == parser.parse(syntax)
+
+
+def test_interner_shares_identical_nodes():
+    interner = NodeInterner()
+    first = interner.subnode("T", "=", "".join(["Ti", "tle"]))
+    second = interner.subnode("T", "=", "".join(["Ti", "tle"]))
+    assert first is second
+    assert interner.title("".join(["Ti", "tle"])) is first.value
+    assert interner.hits == 2
+    with pytest.raises(CommandValidationError):
+        interner.subnode("T")
+
+
+def test_interner_clears_when_full():
+    interner = NodeInterner(max_entries=2)
+    first = interner.subnode(".", "=", None, 1)
+    interner.subnode(".", "=", None, 2)
+    assert interner.subnode(".", "=", None, 1) is first
+    interner.subnode(".", "=", None, 3)
+    assert interner.subnode(".", "=", None, 1) is not first
+    assert len(interner) <= 2
+
+
+@pytest.mark.parametrize("treeless", [False, True])
+def test_interning_parser_shares_repeated_nodes(treeless):
+    parser = AxeSyntaxParser(
+        treeless=treeless,
+        result_cache=ParseResultCache(max_entries=0),
+        intern_nodes=True,
+    )
+    syntax = '[N+(T="Same")={2}]:[N+(.)={6}]:[N+(T="Same")={2}]:[N+(.)={6}]'
+    nodes = parser.parse_nodes(syntax)
+    assert nodes[0] is nodes[2]
+    assert nodes[1].subcommands[0] is nodes[3].subcommands[0]
+    assert to_models(nodes) == AxeSyntaxParser(
+        result_cache=ParseResultCache(max_entries=0)).parse(syntax)
+
+
+def test_structural_hash_is_stable_across_representations():
+    node = make_menunode("N", "+", 2, [make_subnode("T", "=", "Title")])
+    model = to_models([node])[0]
+    assert structural_hash(node) == structural_hash(model)
+    assert structural_hash(node) != structural_hash(node._replace(count=3))
+    assert structural_hash(make_subnode(".", "=", None, 2)) != structural_hash(
+        make_menunode("N", "=", 2))
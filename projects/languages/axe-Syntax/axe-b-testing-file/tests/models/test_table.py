@@ -0,0 +1,55 @@
+# tests/models/test_table.py
+
+from axe_builder.models.nodes import from_models
+from axe_builder.models.table import MenuTable
+from axe_builder.parser.parser import parse_axesyntax
+
+SYNTAX = (
+    '[M={1}]:[N+(T="Settings")={2}]:[N+(.)={6}]:[N+{3}]:'
+    '[M+(T="Settings")+(T="Help")={4}]:(T="Top")'
+)
+
+
+def test_table_round_trips_losslessly():
+    commands = parse_axesyntax(SYNTAX)
+    table = MenuTable.from_commands(commands)
+    assert len(table) == 6
+    assert table.to_commands() == commands
+    assert table.to_nodes() == from_models(commands)
+    assert list(table.sub_offsets) == [0, 0, 1, 2, 2, 4, 5]
+
+
+def test_table_interns_titles():
+    table = MenuTable.from_commands(parse_axesyntax(SYNTAX))
+    assert table.titles.strings == ["Settings", "Help", "Top"]
+
+
+def test_table_filters_and_aggregates():
+    table = MenuTable.from_commands(parse_axesyntax(SYNTAX))
+    assert table.filter(type="N") == [1, 2, 3]
+    assert table.filter(type="N", min_count=3) == [2, 3]
+    assert table.filter(operation="=") == [0]
+    assert table.filter(title="Settings") == [1, 4]
+    assert table.filter(type="M", title="Help") == [4]
+    assert table.rows_with_title("Top") == [5]
+    assert table.rows_with_title("Missing") == []
+    assert table.count_by_type() == {"M": 2, "N": 3}
+    assert table.subcommand_counts() == {"T": 4, ".": 1}
+    assert table.total_count() == 16
+    assert table.total_count("N") == 11
+
+
+def test_take_selects_rows():
+    table = MenuTable.from_commands(parse_axesyntax(SYNTAX))
+    selected = table.take(table.filter(type="N", min_count=3))
+    assert [node.count for node in selected.to_nodes()] == [6, 3]
+
+
+def test_table_keeps_counts_past_int64():
+    huge = 2**64
+    commands = parse_axesyntax(f"[M+{{{huge}}}]:[N+(.)={{{huge + 1}}}]:[N+{{2}}]")
+    table = MenuTable.from_commands(commands)
+    assert table.to_nodes() == from_models(commands)
+    assert table.filter(min_count=huge + 1) == [1]
+    assert table.total_count() == 2 * huge + 3
+    assert table.nbytes() > 0
@@ -0,0 +1,73 @@
+# tests/models/test_validation.py
+
+import axe_builder.models.nodes as nodes_module
+import pytest
+from axe_builder.models import validation
+from axe_builder.models.models import MenuCommand, SubCommand
+from axe_builder.models.nodes import make_menunode, make_subnode, to_model
+from axe_builder.models.validation import CommandValidationError, validate_commands
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import AxeSyntaxParser
+
+
+def test_nodes_convert_to_validated_models():
+    sub = make_subnode("T", "=", "Title")
+    menu = to_model(make_menunode("N", "+", 2, [sub]))
+    assert menu == MenuCommand(
+        type="N",
+        operation="+",
+        count=2,
+        subcommands=[SubCommand(type="T", operation="=", value="Title")],
+    )
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: make_subnode("X"),
+        lambda: make_subnode("T", "="),
+        lambda: make_subnode(".", "=", None, 0),
+        lambda: make_menunode("M", "+"),
+        lambda: make_menunode("N", "=", -1),
+    ],
+)
+def test_builders_and_models_share_rules(build):
+    with pytest.raises(CommandValidationError):
+        build()
+
+
+def test_models_reject_what_the_builders_reject():
+    with pytest.raises(ValueError):
+        SubCommand(type=".", count=0)
+    with pytest.raises(ValueError):
+        MenuCommand(type="M", operation="+")
+
+
+def test_trusted_builders_skip_the_check():
+    sub = make_subnode("X", trusted=True)
+    assert sub.type == "X"
+    with pytest.raises(CommandValidationError):
+        validate_commands([make_menunode("M", subcommands=[sub])])
+
+
+def test_parse_checks_each_node_exactly_once(monkeypatch):
+    calls = {"menu": 0, "sub": 0}
+
+    def counting(name, check):
+        def wrapper(*args):
+            calls[name] += 1
+            return check(*args)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        nodes_module,
+        "check_menu_command",
+        counting("menu", validation.check_menu_command),
+    )
+    monkeypatch.setattr(
+        nodes_module, "check_subcommand", counting("sub", validation.check_subcommand)
+    )
+    parser = AxeSyntaxParser(result_cache=ParseResultCache(max_entries=0))
+    parser.parse('[M={1}]:[N+(T="Title")={2}]:[N+(.)={4}]:(T="Top")')
+    assert calls == {"menu": 3, "sub": 3}
@@ -0,0 +1,141 @@
+# tests/parser/test_async_service.py
+
+import asyncio
+import threading
+
+import pytest
+from axe_builder.parser.async_service import AsyncParseService
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import (
+    AxeSyntaxError,
+    AxeSyntaxParser,
+    parse_axesyntax,
+)
+
+
+class SlowParser(AxeSyntaxParser):
+    """Records how many parses run at once and blocks until released."""
+
+    def __init__(self):
+        super().__init__(result_cache=ParseResultCache(max_entries=0))
+        self.release = threading.Event()
+        self.running = 0
+        self.peak = 0
+        self.started = 0
+        self._lock = threading.Lock()
+
+    def parse(self, syntax_str):
+        with self._lock:
+            self.started += 1
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        self.release.wait(5)
+        with self._lock:
+            self.running -= 1
+        return super().parse(syntax_str)
+
+
+def test_async_parse_matches_sync_parse():
+    async def run():
+        async with AsyncParseService() as service:
+            return await service.parse("[M={1}]:[N+(.)={6}]")
+
+    assert asyncio.run(run()) == parse_axesyntax("[M={1}]:[N+(.)={6}]")
+
+
+def test_async_parse_raises_syntax_errors():
+    async def run():
+        async with AsyncParseService() as service:
+            await service.parse("[X]")
+
+    with pytest.raises(AxeSyntaxError):
+        asyncio.run(run())
+
+
+def test_concurrency_is_capped_and_timeouts_cancel_queued_jobs():
+    parser = SlowParser()
+
+    async def run():
+        service = AsyncParseService(parser, max_workers=4, max_concurrency=2)
+        async with service:
+            running = [
+                asyncio.ensure_future(service.parse("[M+{1}]")) for _ in range(2)
+            ]
+            # Waits for a slot that never frees up before the timeout
+            with pytest.raises(asyncio.TimeoutError):
+                await service.parse("[M+{2}]", timeout=0.2)
+            parser.release.set()
+            return await asyncio.gather(*running)
+
+    results = asyncio.run(run())
+    assert len(results) == 2
+    assert parser.peak == 2
+    assert parser.started == 2
+
+
+def test_parse_stream_yields_outcomes_in_order_with_backpressure():
+    inputs = ["[M+{1}]", "[X]", "[M={2}]:[N+{3}]"] * 5
+    consumed = []
+
+    def produce():
+        for syntax in inputs:
+            consumed.append(syntax)
+            yield syntax
+
+    async def run():
+        outcomes = []
+        async with AsyncParseService(max_concurrency=2) as service:
+            async for outcome in service.parse_stream(produce()):
+                # Never more than max_concurrency inputs read ahead of the consumer
+                assert len(consumed) - len(outcomes) <= 2
+                outcomes.append(outcome)
+        return outcomes
+
+    outcomes = asyncio.run(run())
+    assert len(outcomes) == len(inputs)
+    for syntax, outcome in zip(inputs, outcomes):
+        if syntax == "[X]":
+            assert isinstance(outcome.error, AxeSyntaxError)
+        else:
+            assert outcome.commands == parse_axesyntax(syntax)
+
+
+def test_process_executor_parses():
+    async def run():
+        async with AsyncParseService(
+            AxeSyntaxParser(result_cache=ParseResultCache()),
+            executor="process",
+            max_workers=2,
+        ) as service:
+            return await asyncio.gather(
+                service.parse("[M+{3}]"), service.parse('[N+(T="Title")={2}]')
+            )
+
+    first, second = asyncio.run(run())
+    assert first == parse_axesyntax("[M+{3}]")
+    assert second[0].subcommands[0].value == "Title"
+
+
+def test_invalid_executor_kind():
+    with pytest.raises(ValueError):
+        AsyncParseService(executor="fiber")
+
+
+def test_exit_does_not_block_the_event_loop():
+    parser = SlowParser()
+
+    async def release_soon():
+        await asyncio.sleep(0.05)
+        parser.release.set()
+
+    async def run():
+        async with AsyncParseService(parser, max_workers=1) as service:
+            running = asyncio.ensure_future(service.parse("[M+{1}]"))
+            while not parser.started:
+                await asyncio.sleep(0.01)
+            releaser = asyncio.ensure_future(release_soon())
+        # The loop kept running while the executor waited for the parse
+        assert releaser.done()
+        await asyncio.gather(running, return_exceptions=True)
+
+    asyncio.run(run())
@@ -0,0 +1,65 @@
+# tests/parser/test_cache.py
+
+from axe_builder.parser.cache import ParseResultCache, estimate_size
+from axe_builder.parser.parser import AxeSyntaxParser
+
+
+def test_cache_hits_return_independent_copies():
+    parser = AxeSyntaxParser(result_cache=ParseResultCache())
+    first = parser.parse("[N+(.)={6}]")
+    first[0].subcommands.clear()
+    first.append("garbage")
+
+    second = parser.parse("[N+(.)={6}]")
+    third = parser.parse("[N+(.)={6}]")
+    assert len(second) == 1
+    assert len(second[0].subcommands) == 1
+    assert second == third
+    assert second[0] is not third[0]
+    assert parser.result_cache.stats()["hits"] == 2
+    assert parser.result_cache.stats()["misses"] == 1
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = ParseResultCache(max_entries=2)
+    parser = AxeSyntaxParser(result_cache=cache)
+    parser.parse("[M+{1}]")
+    parser.parse("[M+{2}]")
+    parser.parse("[M+{1}]")  # refresh [M+{1}]
+    parser.parse("[M+{3}]")  # evicts [M+{2}]
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get(parser.grammar_version, "[M+{1}]") is not None
+    assert cache.get(parser.grammar_version, "[M+{2}]") is None
+
+
+def test_cache_respects_byte_limit():
+    parser = AxeSyntaxParser(result_cache=ParseResultCache())
+    result = parser.parse_nodes("[M={2}]:[N+{3}]")
+    cache = ParseResultCache(max_bytes=estimate_size(result) + 1)
+    cache.put(parser.grammar_version, "[M={2}]:[N+{3}]", result)
+    cache.put(parser.grammar_version, "[M={2}]:[N+{4}]", result)
+
+    assert len(cache) == 1
+    assert cache.evictions == 1
+    assert cache.current_bytes <= cache.max_bytes
+
+
+def test_cache_is_keyed_by_grammar_version():
+    cache = ParseResultCache()
+    parser = AxeSyntaxParser(result_cache=cache)
+    parser.parse("[M+{1}]")
+    assert cache.get(parser.grammar_version, "[M+{1}]") is not None
+    assert cache.get("other-grammar", "[M+{1}]") is None
+
+
+def test_cached_index_counts_towards_the_byte_limit():
+    cache = ParseResultCache()
+    parser = AxeSyntaxParser(result_cache=cache)
+    parser.parse_nodes("[M={2}]:[N+{3}]")
+    before = cache.current_bytes
+    index = cache.get_index(parser.grammar_version, "[M={2}]:[N+{3}]")
+    assert index.paths == ["M1", "M1/N1"]
+    assert cache.current_bytes == before + index.estimate_size()
+    assert cache.get_index(parser.grammar_version, "[M={2}]") is None
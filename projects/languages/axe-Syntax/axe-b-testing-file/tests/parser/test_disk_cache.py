@@ -0,0 +1,117 @@
+# tests/parser/test_disk_cache.py
+
+import marshal
+import os
+import zlib
+
+import pytest
+from axe_builder.models.nodes import from_models
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.disk_cache import (
+    _MAGIC,
+    RESCAN_INTERVAL,
+    DiskParseCache,
+    decode_commands,
+    encode_commands,
+)
+from axe_builder.parser.parser import AxeSyntaxParser, parse_axesyntax
+
+
+def test_encode_decode_round_trip():
+    commands = parse_axesyntax('[M={1}]:[N+(T="Nested Title")={2}]:(T="Top")')
+    assert decode_commands(encode_commands(commands)) == from_models(commands)
+
+
+def test_disk_cache_skips_lark_across_parsers(tmp_path, monkeypatch):
+    syntax = "[M={1}]:[N+(.)={6}]"
+    first = AxeSyntaxParser(
+        result_cache=ParseResultCache(), disk_cache=DiskParseCache(tmp_path)
+    )
+    expected = first.parse(syntax)
+
+    # A fresh parser (as in a new CLI run) must not touch Lark at all
+    second = AxeSyntaxParser(
+        result_cache=ParseResultCache(), disk_cache=DiskParseCache(tmp_path)
+    )
+
+    def fail(_):
+        raise AssertionError("Lark should not run on a disk cache hit")
+
+    monkeypatch.setattr(second, "_parse", fail)
+    assert second.parse(syntax) == expected
+
+
+def test_disk_cache_discards_corrupt_entries(tmp_path):
+    cache = DiskParseCache(tmp_path)
+    cache.put("v1", "[M+{1}]", parse_axesyntax("[M+{1}]"))
+    (entry,) = tmp_path.iterdir()
+    entry.write_bytes(b"not a cache entry")
+
+    assert cache.get("v1", "[M+{1}]") is None
+    assert not entry.exists()
+
+
+def test_disk_cache_rejects_unexpected_payloads(tmp_path):
+    cache = DiskParseCache(tmp_path)
+    cache.put("v1", "[M+{1}]", parse_axesyntax("[M+{1}]"))
+    (entry,) = tmp_path.iterdir()
+    code = compile("print('hi')", "<entry>", "exec")
+    for payload in [code, (code,), (("S", "T", "=", code, None),), ((1, 2),)]:
+        with pytest.raises(ValueError, match="Malformed"):
+            decode_commands(_MAGIC + zlib.compress(marshal.dumps(payload)))
+
+    entry.write_bytes(_MAGIC + zlib.compress(marshal.dumps((code,))))
+    assert cache.get("v1", "[M+{1}]") is None
+    assert not entry.exists()
+
+
+def test_disk_cache_prunes_least_recently_used(tmp_path):
+    cache = DiskParseCache(tmp_path)
+    commands = parse_axesyntax("[M+{1}]")
+    cache.put("v1", "0", commands)
+    entry_size = next(tmp_path.iterdir()).stat().st_size
+    cache.max_bytes = entry_size * 10
+
+    for i in range(1, 10):
+        cache.put("v1", str(i), commands)
+    oldest = cache._entry_path("v1", "0")
+    os.utime(oldest, (0, 0))
+    assert len(list(tmp_path.iterdir())) == 10
+
+    # Over the limit: pruned to a tenth below it, least recently used first
+    cache.put("v1", "10", commands)
+    assert len(list(tmp_path.iterdir())) == 9
+    assert not oldest.exists()
+    assert cache.get("v1", "10") == from_models(commands)
+
+
+def test_disk_cache_prunes_abandoned_temp_files(tmp_path):
+    cache = DiskParseCache(tmp_path)
+    abandoned = tmp_path / "abandoned.tmp"
+    abandoned.write_bytes(b"x" * 100)
+    os.utime(abandoned, (0, 0))
+    in_flight = tmp_path / "in_flight.tmp"
+    in_flight.write_bytes(b"x" * 10)
+
+    cache.prune()
+    assert not abandoned.exists()
+    # A recent temp file may still be renamed into place; it only counts
+    assert in_flight.exists()
+    assert cache._size_estimate == 10
+
+
+def test_disk_cache_put_scans_only_when_needed(tmp_path, monkeypatch):
+    cache = DiskParseCache(tmp_path)
+    commands = parse_axesyntax("[M+{1}]")
+    scans = []
+    original_prune = cache.prune
+
+    def counting_prune():
+        scans.append(1)
+        original_prune()
+
+    monkeypatch.setattr(cache, "prune", counting_prune)
+    for i in range(2 * RESCAN_INTERVAL + 1):
+        cache.put("v1", str(i), commands)
+    # The first put, then once every RESCAN_INTERVAL puts
+    assert len(scans) == 3
@@ -0,0 +1,60 @@
+# tests/parser/test_fast_parser.py
+
+import pytest
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.fast_parser import FastAxeSyntaxParser
+from axe_builder.parser.parser import AxeSyntaxError, AxeSyntaxParser, get_parser
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
+from tests.strategies import soup, structured, valid
+
+
+@pytest.fixture(scope="module")
+def parsers():
+    return (
+        AxeSyntaxParser(result_cache=ParseResultCache(max_entries=0)),
+        FastAxeSyntaxParser(result_cache=ParseResultCache(max_entries=0)),
+    )
+
+
+def _outcome(parser, syntax):
+    try:
+        return parser.parse(syntax)
+    except Exception as e:
+        return type(e), str(e)
+
+
+@settings(max_examples=400, deadline=None)
+@given(syntax=st.one_of(valid, structured, soup))
+@example(syntax='[N+(T="a\\\nb")={1}]')
+def test_fast_parser_agrees_with_lark(parsers, syntax):
+    lark_parser, fast_parser = parsers
+    assert _outcome(fast_parser, syntax) == _outcome(lark_parser, syntax)
+
+
+def test_fast_parser_does_not_use_lark_for_valid_input(monkeypatch):
+    parser = FastAxeSyntaxParser(result_cache=ParseResultCache(max_entries=0))
+
+    def fail(_):
+        raise AssertionError("Lark should not run for valid input")
+
+    monkeypatch.setattr(parser.parser, "parse", fail)
+    result = parser.parse('[M={1}]:[N+(T="Nested Menu 1 Title")={2}]:[N+(.)={4}]')
+    assert [cmd.type for cmd in result] == ["M", "N", "N"]
+    assert result[2].subcommands[0].count == 4
+    assert parser.fallbacks == 0
+
+
+def test_fast_parser_reports_errors_through_lark():
+    parser = FastAxeSyntaxParser(result_cache=ParseResultCache(max_entries=0))
+    with pytest.raises(AxeSyntaxError) as excinfo:
+        parser.parse("[M+{3}]:\n[X]")
+    assert (excinfo.value.line, excinfo.value.column) == (2, 2)
+    assert parser.fallbacks == 1
+
+
+def test_get_parser_returns_shared_fast_parser():
+    parser = get_parser(fast=True)
+    assert isinstance(parser, FastAxeSyntaxParser)
+    assert get_parser(fast=True) is parser
+    assert not isinstance(get_parser(), FastAxeSyntaxParser)
@@ -0,0 +1,49 @@
+# tests/parser/test_incremental.py
+
+import pytest
+from axe_builder.parser.incremental import IncrementalParser, split_segments
+from axe_builder.parser.parser import AxeSyntaxError, parse_axesyntax
+
+
+def test_split_segments_ignores_colons_in_strings():
+    syntax = '[M={1}]:(T="Title: with colon"):[N+{2}]'
+    assert split_segments(syntax) == [
+        (0, "[M={1}]"),
+        (8, '(T="Title: with colon")'),
+        (32, "[N+{2}]"),
+    ]
+
+
+def test_incremental_parse_matches_full_parse_and_reuses_segments():
+    parser = IncrementalParser()
+    syntax = '[M={1}]:[N+(T="Nested Title")={2}]:[N+(.)={6}]:[M+{3}]'
+    assert parser.parse(syntax) == parse_axesyntax(syntax)
+    assert parser.reparsed == 4
+
+    edited = '[M={1}]:[N+(T="Nested Title")={2}]:[N+(.)={7}]:[M+{3}]'
+    assert parser.parse(edited) == parse_axesyntax(edited)
+    assert parser.reparsed == 1
+
+    appended = edited + ":[N+{4}]"
+    assert parser.parse(appended) == parse_axesyntax(appended)
+    assert parser.reparsed == 1
+
+
+def test_incremental_parse_reports_position_in_full_input():
+    parser = IncrementalParser()
+    with pytest.raises(AxeSyntaxError) as excinfo:
+        parser.parse("[M={1}]:[N+{2}]:[X]")
+    assert excinfo.value.line == 1
+    assert excinfo.value.column == 18
+
+
+def test_incremental_parse_index_is_cached_with_the_result():
+    parser = IncrementalParser()
+    syntax = '[M={1}]:[N+(T="Nested Title")={2}]:[M+{3}]'
+    index = parser.parse_index(syntax)
+    assert parser.reparsed == 3
+    assert index.paths == ["M1", "M1/N1", "M1/N1/T1", "M2"]
+
+    # Same input: neither re-parsed nor re-indexed, even by a fresh parser
+    assert parser.parse_index(syntax) is index
+    assert IncrementalParser().parse_index(syntax) is index
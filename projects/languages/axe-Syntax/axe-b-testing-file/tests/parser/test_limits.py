@@ -0,0 +1,138 @@
+# tests/parser/test_limits.py
+
+import itertools
+
+import pytest
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.fast_parser import FastAxeSyntaxParser
+from axe_builder.parser.incremental import IncrementalParser
+from axe_builder.parser.limits import ParseLimitError, ParseLimits, _Budget
+from axe_builder.parser.parser import AxeSyntaxParser
+
+PARSERS = [
+    (AxeSyntaxParser, False),
+    (AxeSyntaxParser, True),
+    (FastAxeSyntaxParser, False),
+]
+
+
+def make_parser(cls, treeless, **limits):
+    return cls(
+        treeless=treeless,
+        result_cache=ParseResultCache(max_entries=0),
+        limits=ParseLimits(**limits),
+    )
+
+
+@pytest.mark.parametrize("cls, treeless", PARSERS)
+@pytest.mark.parametrize(
+    "limits, syntax, limit",
+    [
+        ({"max_bytes": 10}, "[M+{1}]:[N+{22}]", "max_bytes"),
+        ({"max_bytes": 12}, '(T="ééééé")', "max_bytes"),
+        ({"max_commands": 2}, "[M+{1}]:[N+{2}]:[N+{3}]", "max_commands"),
+        ({"max_count": 100}, "[M+{1}]:[N+{101}]", "max_count"),
+        ({"max_count": 100}, "[N+(.)={" + "9" * 5000 + "}]", "max_count"),
+        ({"max_subcommands": 1}, '[N+(T="a")+(.)={2}]', "max_subcommands"),
+    ],
+)
+def test_limits_are_enforced(cls, treeless, limits, syntax, limit):
+    parser = make_parser(cls, treeless, **limits)
+    with pytest.raises(ParseLimitError) as exc_info:
+        parser.parse(syntax)
+    assert exc_info.value.limit == limit
+
+
+@pytest.mark.parametrize("cls, treeless", PARSERS)
+def test_inputs_within_limits_parse(cls, treeless):
+    parser = make_parser(
+        cls,
+        treeless,
+        max_bytes=64,
+        max_commands=2,
+        max_count=6,
+        max_subcommands=1,
+        timeout=5,
+    )
+    assert parser.parse("[M={0001}]:[N+(.)={6}]") == AxeSyntaxParser().parse(
+        "[M={0001}]:[N+(.)={6}]")
+
+
+@pytest.mark.parametrize("cls, treeless", PARSERS)
+def test_deadline(cls, treeless, monkeypatch):
+    clock = iter(range(0, 1000, 10))
+    monkeypatch.setattr("axe_builder.parser.limits.time.monotonic", lambda: next(clock))
+    parser = make_parser(cls, treeless, timeout=5)
+    with pytest.raises(ParseLimitError) as exc_info:
+        parser.parse("[M+{1}]:[N+{2}]")
+    assert exc_info.value.limit == "timeout"
+
+
+def test_tree_mode_deadline_stops_mid_parse(monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr("axe_builder.parser.limits.time.monotonic", lambda: next(clock))
+    charged = []
+    original_command = _Budget.command
+
+    def counting_command(self):
+        charged.append(1)
+        original_command(self)
+
+    monkeypatch.setattr(_Budget, "command", counting_command)
+    parser = make_parser(AxeSyntaxParser, False, timeout=5)
+
+    def build_tree(_):
+        raise AssertionError("A limited parse must not build a whole tree first")
+
+    monkeypatch.setattr(parser.parser, "parse", build_tree)
+    with pytest.raises(ParseLimitError) as exc_info:
+        parser.parse(":".join(["[N+{2}]"] * 200))
+    assert exc_info.value.limit == "timeout"
+    assert 0 < len(charged) < 200
+
+
+def test_cache_hits_are_checked_against_the_limits():
+    cache = ParseResultCache()
+    AxeSyntaxParser(result_cache=cache).parse("[M+{1}]:[N+{50}]")
+    strict = AxeSyntaxParser(result_cache=cache, limits=ParseLimits(max_count=10))
+    with pytest.raises(ParseLimitError):
+        strict.parse("[M+{1}]:[N+{50}]")
+
+
+def test_batch_reports_limit_errors_per_item():
+    parser = make_parser(AxeSyntaxParser, False, max_count=10)
+    outcomes = parser.parse_many(["[M+{1}]", "[M+{11}]"], workers=1)
+    assert outcomes[0].error is None
+    assert isinstance(outcomes[1].error, ParseLimitError)
+
+
+def test_incremental_parser_checks_the_whole_result():
+    incremental = IncrementalParser(make_parser(AxeSyntaxParser, True, max_commands=2))
+    incremental.parse("[M+{1}]:[N+{2}]")
+    with pytest.raises(ParseLimitError):
+        incremental.parse("[M+{1}]:[N+{2}]:[N+{3}]")
+
+
+def test_limits_must_be_positive():
+    with pytest.raises(ValueError):
+        ParseLimits(max_bytes=0)
+
+
+def test_limit_errors_cross_process_boundaries():
+    parser = make_parser(AxeSyntaxParser, False, max_count=10)
+    outcomes = parser.parse_many(["[M+{1}]", "[M+{11}]", "[N+{3}]"], workers=2)
+    assert [type(outcome.error) for outcome in outcomes] == [
+        type(None),
+        ParseLimitError,
+        type(None),
+    ]
+    assert outcomes[1].error.limit == "max_count"
+
+
+def test_file_lines_are_reported(tmp_path):
+    path = tmp_path / "menus.axe"
+    path.write_text("[M+{1}]\n[N+{99}]\n")
+    parser = make_parser(AxeSyntaxParser, False, max_count=10)
+    with pytest.raises(ParseLimitError) as exc_info:
+        list(parser.iter_parse_file(path))
+    assert exc_info.value.line == 2
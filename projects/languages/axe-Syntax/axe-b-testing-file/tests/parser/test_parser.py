@@ -1,7 +1,19 @@
 # tests/parser/test_parser.py
 
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
 from axe_builder.models.models import MenuCommand, SubCommand
-from axe_builder.parser.parser import parse_axesyntax
+from axe_builder.parser import parser as parser_module
+from axe_builder.parser.parser import (
+    AxeSyntaxError,
+    AxeSyntaxParser,
+    get_parser,
+    grammar_cache_path,
+    parse_axesyntax,
+)
 
 
 def test_parse_multiple_main_menus():
@@ -58,3 +70,118 @@ def test_parse_custom_subcommand_with_count():
     assert subcmd.type == "."
     assert subcmd.count == 6
     assert subcmd.value is None
+
+
+def test_treeless_parser_matches_tree_parser():
+    tree_parser = AxeSyntaxParser()
+    treeless_parser = AxeSyntaxParser(treeless=True)
+    for syntax in [
+        "[M+{3}]",
+        "[M={2}]:[N+{3}]",
+        '[M={1}]:(T="Menu One Title")',
+        "[N+(.)={6}]",
+        '[M={1}]:[N+(T="Nested Menu 1 Title")={2}]',
+    ]:
+        assert treeless_parser.parse(syntax) == tree_parser.parse(syntax)
+
+
+def test_treeless_parser_reports_errors_like_tree_parser():
+    tree_parser = AxeSyntaxParser()
+    treeless_parser = AxeSyntaxParser(treeless=True)
+    for syntax, error in [("[X+{2}]", ValueError), ("(.)", RuntimeError)]:
+        with pytest.raises(error):
+            tree_parser.parse(syntax)
+        with pytest.raises(error):
+            treeless_parser.parse(syntax)
+
+
+def test_grammar_cache_is_written_and_rebuilt_when_stale(tmp_path):
+    grammar = tmp_path / "axe_syntax.lark"
+    shutil.copy(Path(parser_module.__file__).parent / "axe_syntax.lark", grammar)
+    cache = grammar_cache_path(grammar)
+
+    AxeSyntaxParser(grammar_file=str(grammar))
+    assert cache.exists()
+    first = cache.read_bytes()
+
+    # A cached parser behaves exactly like a freshly built one
+    cached = AxeSyntaxParser(grammar_file=str(grammar))
+    assert cached.parse("[M={2}]:[N+{3}]") == parse_axesyntax("[M={2}]:[N+{3}]")
+
+    grammar.write_text(grammar.read_text() + "\n# edited\n")
+    AxeSyntaxParser(grammar_file=str(grammar))
+    assert cache.read_bytes() != first
+
+
+def test_tree_and_treeless_parsers_keep_separate_grammar_caches(tmp_path):
+    grammar = tmp_path / "axe_syntax.lark"
+    shutil.copy(Path(parser_module.__file__).parent / "axe_syntax.lark", grammar)
+    AxeSyntaxParser(grammar_file=str(grammar))
+    AxeSyntaxParser(grammar_file=str(grammar), treeless=True)
+    caches = [grammar_cache_path(grammar), grammar_cache_path(grammar, True)]
+    written = [cache.stat().st_mtime_ns for cache in caches]
+
+    for treeless in (False, True, False, True):
+        AxeSyntaxParser(grammar_file=str(grammar), treeless=treeless)
+    assert [cache.stat().st_mtime_ns for cache in caches] == written
+
+
+def test_get_parser_builds_lazily_and_once(monkeypatch):
+    monkeypatch.setattr(parser_module, "_parsers", {})
+    built = []
+    original_init = AxeSyntaxParser.__init__
+
+    def counting_init(self, *args, **kwargs):
+        built.append(kwargs.get("treeless", False))
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(AxeSyntaxParser, "__init__", counting_init)
+    assert built == []
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        parsers = list(pool.map(lambda _: get_parser(), range(32)))
+
+    assert all(p is parsers[0] for p in parsers)
+    assert built == [False]
+    assert get_parser(treeless=True) is not parsers[0]
+    assert built == [False, True]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_keeps_order_and_reports_errors_per_item(workers):
+    inputs = ["[M+{1}]", "[X+{2}]", "[M={2}]:[N+{3}]", "(.)", "[N+(.)={6}]"]
+    outcomes = get_parser().parse_many(inputs, workers=workers, chunksize=2)
+
+    assert len(outcomes) == len(inputs)
+    for syntax, outcome in zip(inputs, outcomes):
+        if syntax in ("[X+{2}]", "(.)"):
+            assert outcome.commands is None
+            assert isinstance(outcome.error, (ValueError, RuntimeError))
+        else:
+            assert outcome.error is None
+            assert outcome.commands == parse_axesyntax(syntax)
+
+
+def test_iter_parse_file_yields_one_result_per_line(tmp_path):
+    path = tmp_path / "menus.axe"
+    path.write_text("[M+{3}]\n\n  [M={2}]:[N+{3}]\r\n[N+(.)={6}]", encoding="utf-8")
+
+    results = list(get_parser().iter_parse_file(path))
+
+    assert results == [
+        parse_axesyntax("[M+{3}]"),
+        parse_axesyntax("[M={2}]:[N+{3}]"),
+        parse_axesyntax("[N+(.)={6}]"),
+    ]
+
+
+def test_iter_parse_file_reports_file_line_and_column(tmp_path):
+    path = tmp_path / "menus.axe"
+    path.write_text("[M+{3}]\n\n[M={1}]:[N+ X]\n[M+{1}]\n", encoding="utf-8")
+
+    results = get_parser().iter_parse_file(path)
+    assert next(results) == parse_axesyntax("[M+{3}]")
+    with pytest.raises(AxeSyntaxError) as excinfo:
+        next(results)
+    assert excinfo.value.line == 3
+    assert excinfo.value.column == 13
@@ -0,0 +1,60 @@
+# tests/strategies.py
+
+# Hypothesis strategies for axe:Syntax input, shared by the parser and utils tests
+
+from hypothesis import strategies as st
+
+# Near-valid input built from the grammar's own pieces
+_op = st.sampled_from(["+", "=", " + ", "= "])
+_num = st.integers(min_value=0, max_value=120).map(lambda n: f"{{{n:02}}}")
+_string = st.sampled_from(
+    ['"Title"', '""', '"a:b"', '"[x] (y)"', r'"a\"b"', r'"a\\"', '"T\tab"']
+    # A backslash escapes any character but a newline
+    + ['"a\\\nb"', '"a\\\r\nb"']
+)
+_sub = st.builds(
+    lambda t, ops: f"({t}{''.join(ops)})",
+    st.sampled_from(["T", ".", " T "]),
+    st.lists(
+        st.builds("".join, st.tuples(_op, st.one_of(_num, _string))), max_size=2
+    ),
+)
+_menu = st.builds(
+    lambda t, ops: f"[{t}{''.join(ops)}]",
+    st.sampled_from(["M", "N", " N"]),
+    st.lists(
+        st.builds("".join, st.tuples(_op, st.one_of(_sub, _num))), max_size=3
+    ),
+)
+structured = st.builds(
+    lambda cmds, sep: sep.join(cmds),
+    st.lists(st.one_of(_menu, _sub), min_size=1, max_size=4),
+    st.sampled_from([":", " : ", ":\n"]),
+)
+# Valid commands, so the success path is exercised as much as the error paths
+_title = _string.filter(lambda s: s != '""' and "\n" not in s)
+_positive = st.integers(min_value=1, max_value=120).map(lambda n: f"{{{n}}}")
+valid = st.builds(
+    ":".join,
+    st.lists(
+        st.one_of(
+            st.builds(
+                lambda t, op, n: f"[{t}{op}{n}]", st.sampled_from("MN"), _op, _positive
+            ),
+            st.builds(lambda s, n: f"[N+(T={s})={n}]", _title, _positive),
+            st.builds(lambda n: f"[N + (.) = {n}]", _positive),
+            st.builds(lambda s: f"(T={s})", _title),
+            st.builds(lambda n: f"(.={n})", _positive),
+        ),
+        min_size=1,
+        max_size=4,
+    ),
+)
+# Arbitrary token soup, including characters no terminal accepts
+soup = st.lists(
+    st.sampled_from(
+        list("[]():+=MNT.{}\" \t\n\\\vX7") + ["{3}", "{0}", '"x"', r'"\"', '"\\\n"']
+    ),
+    max_size=20,
+).map("".join)
+
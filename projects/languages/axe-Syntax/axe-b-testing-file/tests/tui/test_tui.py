@@ -1,5 +1,43 @@
+from axe_builder.models.nodes import MenuNode, SubNode
+from axe_builder.tui.widgets import MAX_EXPANDED_ROWS, MenuTree
+
 # Placeholder for TUI tests
 # Testing TUI applications can be complex and may require specialized tools or manual testing
 def test_tui_launch():
     # Example placeholder test
     assert True
+
+
+class RecordingTree(MenuTree):
+    """Records the rows added to the tree as (label, parent label) pairs."""
+
+    def add(self, node_label, parent=None):
+        self.rows.append((node_label, parent))
+        return node_label
+
+    def populate_tree(self):
+        self.rows = []
+        super().populate_tree()
+
+
+def test_menu_tree_lists_the_copies_of_counted_menus():
+    nodes = [
+        MenuNode("M", "=", 1),
+        MenuNode("N", "+", 100000, (SubNode(".", "=", None, 3),)),
+    ]
+    rows = RecordingTree("Menu Commands", nodes).rows
+    expanded = "Expanded: 400000 items"
+    assert (expanded, "N (Op: +, Count: 100000)") in rows
+    listed = [label for label, parent in rows if parent == expanded]
+    # Only the first rows are built
+    assert len(listed) == MAX_EXPANDED_ROWS + 1
+    assert listed[:5] == [
+        "N (Op: +, Count: 100000) #1",
+        "Custom Command (Count: 3) #1",
+        "Custom Command (Count: 3) #2",
+        "Custom Command (Count: 3) #3",
+        "N (Op: +, Count: 100000) #2",
+    ]
+    assert listed[-1] == f"... {400000 - MAX_EXPANDED_ROWS} more"
+    # The "={1}" menu refers to a single menu and is not expanded
+    assert [label for label, _ in rows if label.startswith("Expanded")] == [expanded]
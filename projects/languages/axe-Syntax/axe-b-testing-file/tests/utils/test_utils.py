@@ -0,0 +1,63 @@
+# tests/utils/test_utils.py
+
+import pytest
+from axe_builder.parser.cache import ParseResultCache
+from axe_builder.parser.parser import AxeSyntaxError, AxeSyntaxParser
+from axe_builder.utils.utils import SyntaxIssue, check_syntax, validate_syntax
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from tests.strategies import soup, structured, valid
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return AxeSyntaxParser(result_cache=ParseResultCache(max_entries=0))
+
+
+@pytest.mark.parametrize(
+    "syntax",
+    ["[M+{3}]", "[M={2}]:[N+{3}]", " [ N + ( . ) = {6} ] ", '(T="a:b]")', "[N]:\n(.)"],
+)
+def test_valid_syntax(syntax):
+    assert check_syntax(syntax) is None
+    assert validate_syntax(syntax)
+
+
+@pytest.mark.parametrize(
+    "syntax, offset, message",
+    [
+        ("", 0, "end of input"),
+        ("[M+{3}", 0, "Unclosed '['"),
+        ("[M+{3}]x", 7, "Expected ':'"),
+        ("[X]", 1, "menu type"),
+        ("[M+{a}]", 3, "Malformed count"),
+        ('[M+(T="abc)]', 6, "Unterminated string"),
+        ('[M+{3}]:[N+(T="x")]:(.+(T="y"))', 23, "{INT} or a string"),
+    ],
+)
+def test_first_error_offset(syntax, offset, message):
+    issue = check_syntax(syntax)
+    assert issue.offset == offset
+    assert message in issue.message
+    assert not validate_syntax(syntax)
+
+
+def test_error_position():
+    syntax = "[M]:\n  [N+{ 3}]"
+    issue = check_syntax(syntax)
+    assert issue == SyntaxIssue(10, "Malformed count, expected {INT}")
+    assert issue.position(syntax) == (2, 6)
+
+
+@settings(max_examples=400, deadline=None)
+@given(syntax=st.one_of(valid, structured, soup))
+def test_agrees_with_lark(parser, syntax):
+    try:
+        parser.parse(syntax)
+        lark_accepts = True
+    except AxeSyntaxError:
+        lark_accepts = False
+    except RuntimeError:
+        # Syntactically valid, rejected by the field rules
+        lark_accepts = True
+    assert validate_syntax(syntax) == lark_accepts